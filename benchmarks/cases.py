@@ -0,0 +1,130 @@
+# 📄 benchmarks/cases.py
+"""Benchmark cases for the scan -> analyze -> report pipeline.
+
+Each case has a setup(bssids, workdir) that builds its input offline from
+synthetic netsh output, and a run(state) that is the part being measured.
+"""
+import os
+from datetime import datetime
+
+import numpy as np
+
+from main import WifiAuditTool
+from modules.config import load_config
+from modules.evidence_collector import EvidenceCollector
+from modules.executor import StageExecutor
+from modules.network_scanner import NetworkScanner
+from modules.report_generator import ReportGenerator, summarize_fleet
+from modules.risk_engine import RiskEngine
+from modules.scan_backends import ReplayBackend, SyntheticBackend, write_capture
+from modules.scan_parsers import parse_netsh
+from modules.simulation import SimulationEngine
+
+SEED = 42
+BSSIDS_PER_NETWORK = 2
+
+
+# ===============================
+# SHARED INPUTS
+# ===============================
+def netsh_lines(bssids):
+    networks = max(1, bssids // BSSIDS_PER_NETWORK)
+    return list(SyntheticBackend(networks, BSSIDS_PER_NETWORK, SEED).iter_lines())
+
+
+def scanned_networks(bssids, workdir):
+    capture = os.path.join(workdir, "scan.txt")
+    write_capture(netsh_lines(bssids), capture)
+    return list(NetworkScanner(load_config(), ReplayBackend(capture, "netsh")).iter_scan())
+
+
+def analyzed_results(bssids, workdir):
+    config = load_config()
+    tool = WifiAuditTool()
+    targets = [tool.build_target(net) for net in scanned_networks(bssids, workdir)]
+    return StageExecutor("serial").analyze(targets, config, SimulationEngine(SEED))
+
+
+def batch_data(bssids, workdir):
+    results = analyzed_results(bssids, workdir)
+    return {
+        "adapter": {"adapter": "benchmark", "supports_monitor": False},
+        "networks": results,
+        "summary": summarize_fleet(results),
+        "simulation_seed": SEED,
+        "timestamp": datetime.now().isoformat(),
+        "duration": 0.0
+    }
+
+
+# ===============================
+# CASES
+# ===============================
+def setup_parse(bssids, workdir):
+    return netsh_lines(bssids)
+
+
+def run_parse(lines):
+    return sum(1 for _ in parse_netsh(lines))
+
+
+def setup_scan(bssids, workdir):
+    capture = os.path.join(workdir, "scan.txt")
+    write_capture(netsh_lines(bssids), capture)
+    return NetworkScanner(load_config(), ReplayBackend(capture, "netsh"))
+
+
+def run_scan(scanner):
+    # Parsing plus band/vendor enrichment, without the JSON/CSV export
+    return sum(1 for _ in scanner.iter_scan())
+
+
+def setup_analyze(bssids, workdir):
+    tool = WifiAuditTool()
+    return [tool.build_target(net) for net in scanned_networks(bssids, workdir)]
+
+
+def run_analyze(targets):
+    return StageExecutor("serial").analyze(targets, load_config(), SimulationEngine(SEED))
+
+
+def setup_risk(bssids, workdir):
+    results = analyzed_results(bssids, workdir)
+    return {
+        "encryption": np.array([r["encryption"]["type"] for r in results]),
+        "pmf_enabled": np.array([r["protection"]["pmf_enabled"] for r in results]),
+        "wps_enabled": np.array([r["protection"]["wps_enabled"] for r in results]),
+        "password_strength": np.array([r["password"]["strength"] for r in results])
+    }
+
+
+def run_risk(table):
+    return RiskEngine(load_config()).score_table(table)
+
+
+def setup_evidence(bssids, workdir):
+    return EvidenceCollector(os.path.join(workdir, "evidence.db")), batch_data(bssids, workdir)
+
+
+def run_evidence(state):
+    store, data = state
+    return store.save(data)
+
+
+def setup_report(bssids, workdir):
+    return ReportGenerator(load_config(), os.path.join(workdir, "reports")), batch_data(bssids, workdir)
+
+
+def run_report(state):
+    generator, data = state
+    return generator.generate_fleet(data)
+
+
+CASES = {
+    "parse": (setup_parse, run_parse),
+    "scan": (setup_scan, run_scan),
+    "analyze": (setup_analyze, run_analyze),
+    "risk": (setup_risk, run_risk),
+    "evidence": (setup_evidence, run_evidence),
+    "report": (setup_report, run_report)
+}
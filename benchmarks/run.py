@@ -0,0 +1,218 @@
+# 📄 benchmarks/run.py
+"""Pipeline benchmarks: wall time, peak RSS and peak Python allocations per stage.
+
+    python -m benchmarks.run                      # all cases at 10 .. 50k BSSIDs
+    python -m benchmarks.run --cases parse,scan --scales 1000,10000
+    python -m benchmarks.run --save-baseline      # record benchmarks/baseline.json
+
+Every case/scale runs in a fresh process, so imports and caches warmed by
+one case never flatter the next. Peak RSS is what one run adds to the
+worker's resident size after setup, measured in a forked child so native
+buffers (numpy, sqlite, pyarrow) count too; it needs the POSIX resource
+module and is left empty on Windows. The allocation column is the
+tracemalloc peak of one run, also excluding setup. Results are compared
+with the baseline and any case slower (or using more memory) than the
+tolerance allows is flagged; the exit status is 1 when something
+regressed. Everything runs offline on synthetic data.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_SCALES = (10, 1000, 10000, 50000)
+DEFAULT_TOLERANCE = 0.25
+
+# Compared against the baseline
+GATED_METRICS = ("seconds", "rss_peak_mb", "alloc_peak_mb")
+MIN_GATED_SECONDS = 0.05  # below this, timer noise dominates
+MIN_GATED_RSS_MB = 1.0  # below this, page-granularity noise dominates
+
+
+def _maxrss_mb(who):
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    maxrss = resource.getrusage(who).ru_maxrss
+    return maxrss / 2 ** 20 if sys.platform == "darwin" else maxrss / 1024
+
+
+def rss_peak(run, state):
+    """Peak RSS (MB) one run adds on top of the already set-up worker.
+
+    The run happens in a forked child. Its ru_maxrss right after the fork is
+    what it inherited resident (file-backed pages such as shared libraries
+    are not carried over), so the growth from there is the case's own
+    footprint, native allocations included.
+    """
+    if resource is None or not hasattr(os, "fork"):
+        return None
+    read_end, write_end = os.pipe()
+    sys.stdout.flush()
+    pid = os.fork()  # Pool workers are daemonic, so multiprocessing can't start one
+    if pid == 0:
+        os.close(read_end)
+        try:
+            before = _maxrss_mb(resource.RUSAGE_SELF)
+            run(state)
+            os.write(write_end, str(_maxrss_mb(resource.RUSAGE_SELF) - before).encode())
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as pipe:
+        growth = pipe.read()
+    os.waitpid(pid, 0)
+    if not growth:
+        raise RuntimeError("benchmark run failed in the RSS child")
+    return max(float(growth), 0.0)
+
+
+def measure(case, bssids, repeat, trace_allocations):
+    """Runs in a fresh worker process: setup, an RSS run, timed runs, then a traced run."""
+    sys.path.insert(0, BASE_DIR)
+    from benchmarks.cases import CASES
+
+    setup, run = CASES[case]
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        state = setup(bssids, workdir)
+        # First, before the timed runs leave freed memory in the worker's heap
+        rss = rss_peak(run, state)
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - started)
+
+        alloc_peak = None
+        if trace_allocations:
+            tracemalloc.start()
+            run(state)
+            alloc_peak = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+    return {
+        "case": case,
+        "bssids": bssids,
+        "seconds": min(timings),
+        "rss_peak_mb": None if rss is None else round(rss, 2),
+        "alloc_peak_mb": None if alloc_peak is None else round(alloc_peak, 2)
+    }
+
+
+def run_benchmarks(cases, scales, repeat=3, trace_allocations=True):
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for bssids in scales:
+        for case in cases:
+            with context.Pool(1) as pool:
+                result = pool.apply(measure, (case, bssids, repeat, trace_allocations))
+            key = f"{case}@{bssids}"
+            results[key] = result
+            rss = "-" if result["rss_peak_mb"] is None else f"{result['rss_peak_mb']:.1f} MB"
+            alloc = "-" if result["alloc_peak_mb"] is None else f"{result['alloc_peak_mb']:.1f} MB"
+            print(f"⏱️  {key:<18} {result['seconds'] * 1000:10.1f} ms   rss {rss:>9}   alloc {alloc}")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            continue
+        for metric in GATED_METRICS:
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            if metric == "seconds" and new < MIN_GATED_SECONDS:
+                continue
+            if metric == "rss_peak_mb" and new < MIN_GATED_RSS_MB:
+                continue
+            change = new / old - 1
+            if change > tolerance:
+                regressions.append((key, metric, old, new, change))
+    return regressions
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scan -> analyze -> report pipeline")
+    parser.add_argument("--cases", help="comma-separated subset of: parse, scan, analyze, risk, evidence, report")
+    parser.add_argument("--scales", help="comma-separated BSSID counts (default: 10,1000,10000,50000)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the fastest is kept")
+    parser.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown/extra memory before flagging (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    from benchmarks.cases import CASES
+    cases = args.cases.split(",") if args.cases else list(CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    scales = [int(s) for s in args.scales.split(",")] if args.scales else list(DEFAULT_SCALES)
+
+    print(f"🏁 Benchmarking {', '.join(cases)} at {', '.join(map(str, scales))} BSSIDs")
+    results = run_benchmarks(cases, scales, args.repeat, not args.no_alloc)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Baseline saved: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("⚠️  No baseline to compare against (run with --save-baseline)")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("machine") != report["machine"]:
+        print("⚠️  Baseline was recorded on a different machine/Python; comparisons are indicative only")
+
+    regressions = compare(results, baseline, args.tolerance)
+    for key, metric, old, new, change in regressions:
+        print(f"❌ {key} {metric}: {old:.4g} → {new:.4g} (+{change:.0%})")
+    if regressions:
+        return 1
+
+    print(f"✅ No regressions beyond {args.tolerance:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
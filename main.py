@@ -1,31 +1,41 @@
 # 📄 main.py
 from modules.adapter_manager import AdapterManager
-from modules.network_scanner import NetworkScanner
+from modules.network_scanner import NetworkScanner, build_target
 from modules.encryption_analyzer import EncryptionAnalyzer
 from modules.handshake_test import HandshakeTest
 from modules.protection_test import ProtectionTest
-from modules.password_audit import PasswordAudit
+from modules.password_audit import PasswordAudit, load_passphrases
 from modules.risk_engine import RiskEngine
 from modules.evidence_collector import EvidenceCollector
-from modules.report_generator import ReportGenerator
-import yaml
+from modules.report_generator import ReportGenerator, summarize_fleet
+from modules.executor import StageExecutor
+from modules.config import load_config
+from modules.scan_backends import ReplayBackend, SyntheticBackend
+from modules.simulation import SimulationEngine
+from modules.network_watch import format_event
+from modules.metrics import Metrics
+import argparse
+import json
 import sys
 import os
 import time
 from datetime import datetime
 
 class WifiAuditTool:
-    def __init__(self):
+    def __init__(self, backend=None, seed=None, trials=None, passphrases=None):
         self.config = self.load_config()
+        self.backend = backend
+        self.engine = SimulationEngine(self.config.simulation_seed if seed is None else seed)
+        self.trials = self.config.monte_carlo_trials if trials is None else trials
+        self.passphrases = passphrases or {}  # {ssid: passphrase} of our own APs, never saved
+        self.metrics = Metrics()
         self.start_time = datetime.now()
         
     def load_config(self):
-        try:
-            with open("config.yaml", "r") as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
+        config = load_config()
+        if not config.exists:
             print("⚠️  config.yaml not found, using default settings")
-            return {}
+        return config
     
     def verify_authorization(self):
         if not os.path.exists("authorization.txt"):
@@ -42,20 +52,138 @@ class WifiAuditTool:
         print("✅ Authorization verified")
     
     def select_target(self, networks):
+        # Returns (scan position, target); the position is the network's
+        # simulation row, the same one --all gives it for a given seed.
+        # Scanner records keep signal per BSSID; flatten before listing
+        networks = [self.build_target(net) if "bssids" in net else net for net in networks]
+
         print("\n📡 Available Networks:")
         for i, net in enumerate(networks, 1):
             print(f"{i}. {net['ssid']} ({net['encryption']}) - Signal: {net['signal']}dBm")
         
         if len(networks) == 1:
-            return networks[0]
+            return 0, networks[0]
         
         try:
             choice = int(input("\nSelect target network (number): "))
-            return networks[choice-1]
+            if not 1 <= choice <= len(networks):
+                raise ValueError(choice)
+            return choice - 1, networks[choice - 1]
         except:
             print("⚠️  Invalid selection, using first network")
-            return networks[0]
+            return 0, networks[0]
     
+    def build_target(self, net):
+        return build_target(net)
+
+    def build_executor(self, kind=None, workers=None):
+        return StageExecutor(
+            kind or self.config.executor,
+            workers or self.config.workers
+        )
+
+    def stage(self, name):
+        return self.metrics.timer(name)
+
+    def export_metrics(self):
+        if self.config.prometheus_file:
+            self.metrics.write_prometheus(self.config.prometheus_file)
+        print("\n⏱️  Stage timings:")
+        for stage, timing in self.metrics.summary()["stages"].items():
+            print(f"   {stage:<20} {timing['total_seconds'] * 1000:10.1f} ms  ({timing['count']} calls, "
+                  f"max {timing['max_seconds'] * 1000:.1f} ms)")
+
+    def save_evidence(self, data):
+        # The evidence record carries every stage up to the save itself;
+        # the report (rendered next) also shows the evidence write
+        data["metrics"] = self.metrics.summary()
+        with self.stage("evidence_write"):
+            run_id = EvidenceCollector().save(data)
+        data["metrics"] = self.metrics.summary()
+        return run_id
+
+    def run_batch_audit(self, executor=None):
+        print("=" * 50)
+        print("🔒 Wi-Fi Security Audit Tool (Batch Mode)")
+        print("=" * 50)
+
+        print("\n[1/4] Checking wireless adapter...")
+        with self.stage("adapter_detect"):
+            adapter = AdapterManager().detect()
+        print(f"   Adapter: {adapter['adapter']}")
+
+        print("\n[2/4] Scanning for networks...")
+        networks = NetworkScanner(self.config, self.backend, self.metrics).scan()
+        if not networks:
+            print("❌ No networks found in simulation")
+            return
+
+        executor = executor or self.build_executor()
+        print(f"\n[3/4] Auditing {len(networks)} networks ({executor.kind}, {executor.workers} workers)...")
+        targets = [self.build_target(net) for net in networks]
+        passphrases = [self.passphrases.get(target["ssid"]) for target in targets]
+        results = executor.analyze(targets, self.config, self.engine, self.metrics, passphrases)
+        if self.trials:
+            started = time.perf_counter()
+            with self.stage("monte_carlo"):
+                distributions = RiskEngine(self.config).monte_carlo(results, self.engine, self.trials)
+            for result, distribution in zip(results, distributions):
+                result["risk_distribution"] = distribution
+            print(f"   Monte Carlo: {self.trials} trials per network in {time.perf_counter() - started:.2f}s")
+
+        for result in results:
+            print(f"   {result['target']['ssid']}: {result['risk']['level']} ({result['risk']['score']}/15)")
+
+        data = {
+            "adapter": adapter,
+            "networks": results,
+            "summary": summarize_fleet(results),
+            "simulation_seed": self.engine.seed,
+            "timestamp": self.start_time.isoformat(),
+            "duration": (datetime.now() - self.start_time).total_seconds()
+        }
+
+        print("\n[4/4] Saving evidence and report...")
+        data["run_id"] = self.save_evidence(data)
+        with self.stage("report_render"):
+            report = ReportGenerator(self.config).generate_fleet(data)
+        self.export_metrics()
+
+        print("\n" + "=" * 50)
+        print(f"✅ Batch audit of {len(results)} networks completed!")
+        print(f"📊 Report saved: {report}")
+        print("=" * 50)
+
+        return data
+
+    def run_watch(self, interval=None, cycles=None, log_path=None):
+        print("=" * 50)
+        print("🔒 Wi-Fi Security Audit Tool (Watch Mode)")
+        print("=" * 50)
+
+        scanner = NetworkScanner(self.config, self.backend, self.metrics)
+        interval = self.config.watch["interval"] if interval is None else interval
+        print(f"\n👀 Rescanning every {interval}s, reporting changes only (Ctrl+C to stop)")
+
+        log = open(log_path, "a", encoding="utf-8") if log_path else None
+        try:
+            for cycle, events in scanner.watch(interval, cycles):
+                failed = any(event["event"] == "error" for event in events)
+                print(f"\n[cycle {cycle}] " + ("scan failed, keeping the previous view" if failed else f"{len(events)} change(s)"))
+                for event in events:
+                    print(f"   {format_event(event)}")
+                    if log:
+                        log.write(json.dumps(event) + "\n")
+                if log:
+                    log.flush()
+                if self.config.prometheus_file:
+                    self.metrics.write_prometheus(self.config.prometheus_file)
+        except KeyboardInterrupt:
+            print("\n⏹  Watch stopped")
+        finally:
+            if log:
+                log.close()
+
     def run_audit(self):
         print("=" * 50)
         print("🔒 Wi-Fi Security Audit Tool (Lab Simulation)")
@@ -63,44 +191,62 @@ class WifiAuditTool:
         
         # Step 1: Check adapter
         print("\n[1/7] Checking wireless adapter...")
-        adapter = AdapterManager().detect()
+        with self.stage("adapter_detect"):
+            adapter = AdapterManager().detect()
         print(f"   Adapter: {adapter['adapter']}")
         print(f"   Monitor Mode: {adapter['supports_monitor']}")
         
         # Step 2: Scan networks
         print("\n[2/7] Scanning for networks...")
-        networks = NetworkScanner().scan()
+        networks = NetworkScanner(self.config, self.backend, self.metrics).scan()
         if not networks:
             print("❌ No networks found in simulation")
             return
         
-        target = self.select_target(networks)
+        row, target = self.select_target(networks)
         print(f"   Selected: {target['ssid']}")
         
         # Step 3: Analyze encryption
         print("\n[3/7] Analyzing encryption...")
-        encryption = EncryptionAnalyzer().analyze(target)
+        with self.stage("encryption_analysis"):
+            encryption = EncryptionAnalyzer(self.config).analyze(target)
         print(f"   Type: {encryption['type']} → {encryption['severity']}")
         
         # Step 4: Handshake test
         print("\n[4/7] Testing handshake capture...")
-        handshake = HandshakeTest().run(target)
+        with self.stage("handshake_test"):
+            handshake = HandshakeTest(self.engine).run(target, row)
         print(f"   Capturable: {handshake['handshake_possible']}")
         
         # Step 5: Protection features
         print("\n[5/7] Checking protection mechanisms...")
-        protection = ProtectionTest().run(target)
+        with self.stage("protection_test"):
+            protection = ProtectionTest(self.engine).run(target, row)
         print(f"   PMF: {protection['pmf_enabled']}, WPS: {protection['wps_enabled']}")
         
         # Step 6: Password audit
         print("\n[6/7] Auditing password strength...")
-        password = PasswordAudit().run(target)
+        with self.stage("password_audit"):
+            passphrase = self.passphrases.get(target["ssid"])
+            password = PasswordAudit(self.config).run(dict(target, passphrase=passphrase) if passphrase else target)
         print(f"   Strength: {password['strength']}")
         
         # Step 7: Risk assessment
         print("\n[7/7] Calculating risk...")
-        risk = RiskEngine().calculate(encryption, protection, password)
+        risk_engine = RiskEngine(self.config)
+        with self.stage("risk_scoring"):
+            risk = risk_engine.calculate(encryption, protection, password)
         print(f"   Risk Level: {risk['level']} ({risk['score']}/15)")
+
+        risk_distribution = None
+        if self.trials:
+            with self.stage("monte_carlo"):
+                risk_distribution = risk_engine.monte_carlo(
+                    [{"target": target, "encryption": encryption, "password": password}], self.engine, self.trials, row
+                )[0]
+            likely = max(risk_distribution["level_probability"].items(), key=lambda item: item[1])
+            print(f"   Monte Carlo: mean {risk_distribution['mean']}/15, "
+                  f"{likely[0]} in {likely[1]:.0%} of {self.trials} trials")
         
         # Compile data
         data = {
@@ -111,15 +257,20 @@ class WifiAuditTool:
             "protection": protection,
             "password": password,
             "risk": risk,
+            "simulation_seed": self.engine.seed,
             "timestamp": self.start_time.isoformat(),
             "duration": (datetime.now() - self.start_time).total_seconds()
         }
+        if risk_distribution:
+            data["risk_distribution"] = risk_distribution
         
         # Save evidence
-        EvidenceCollector().save(data)
+        data["run_id"] = self.save_evidence(data)
         
         # Generate report
-        ReportGenerator().generate(data)
+        with self.stage("report_render"):
+            ReportGenerator(self.config).generate(data)
+        self.export_metrics()
         
         print("\n" + "=" * 50)
         print("✅ Audit completed successfully!")
@@ -128,10 +279,87 @@ class WifiAuditTool:
         
         return data
 
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return number
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Wi-Fi Security Audit Tool (Lab Simulation)")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="audit every scanned network in one pass and write a combined report"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["serial", "thread", "process"],
+        help="how batch analysis stages are fanned out (overrides config.yaml)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="worker count for thread/process executors (overrides config.yaml)"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="replay a recorded capture file or directory instead of scanning"
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="N",
+        help="scan N seeded synthetic networks instead of the radio"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="rescan continuously and print only new/gone/changed access points"
+    )
+    parser.add_argument("--interval", type=float, help="seconds between watch rescans (overrides config.yaml)")
+    parser.add_argument("--cycles", type=int, help="stop watching after N scans")
+    parser.add_argument("--watch-log", metavar="PATH", help="append watch events to a JSONL file")
+    parser.add_argument("--bssids", type=int, default=1, help="BSSIDs per synthetic network")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic networks")
+    parser.add_argument(
+        "--monte-carlo",
+        type=non_negative_int,
+        metavar="TRIALS",
+        help="also report each network's risk distribution over TRIALS simulated trials"
+    )
+    parser.add_argument(
+        "--passphrases",
+        metavar="CSV",
+        help="rate the real passphrases of your own APs (CSV with ssid,passphrase columns; never saved)"
+    )
+    parser.add_argument(
+        "--sim-seed",
+        type=non_negative_int,
+        help="seed for simulated handshake/protection results (overrides config.yaml)"
+    )
+    return parser.parse_args(argv)
+
+def build_backend(args):
+    # None lets NetworkScanner fall back to the backend configured in config.yaml
+    if args.replay:
+        return ReplayBackend(args.replay)
+    if args.synthetic is not None:
+        return SyntheticBackend(args.synthetic, args.bssids, args.seed)
+    return None
+
 def main():
-    tool = WifiAuditTool()
+    args = parse_args()
+    passphrases = load_passphrases(args.passphrases) if args.passphrases else None
+    tool = WifiAuditTool(build_backend(args), args.sim_seed, args.monte_carlo, passphrases)
     tool.verify_authorization()
-    tool.run_audit()
+    if args.watch:
+        tool.run_watch(args.interval, args.cycles, args.watch_log)
+    elif args.all:
+        tool.run_batch_audit(tool.build_executor(args.executor, args.workers))
+    else:
+        tool.run_audit()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+# 📄 modules/bloom_filter.py
+"""Memory-mapped Bloom filter for leaked-passphrase blocklists.
+
+Build it once from a wordlist (one passphrase per line, e.g. a public
+leaked-password corpus), then point password_dictionaries.blocklist at it:
+
+    python -m modules.bloom_filter build rockyou.txt -o data/leaked.bloom --fp-rate 0.001
+    python -m modules.bloom_filter check data/leaked.bloom "Summer2023!"
+
+The wordlist is streamed twice (count, then insert) and never held in
+memory. Opening the filter is a single mmap and a check reads k bits.
+"""
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"BLMF"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHQQd")  # magic, version, hash count, bit count, entries, target fp rate
+MASK64 = (1 << 64) - 1
+CHUNK_LINES = 200_000
+
+
+def hash_pair(data):
+    """Two independent 64-bit hashes; probe i is (h1 + i * h2) mod bits."""
+    return struct.unpack("<QQ", hashlib.blake2b(data, digest_size=16).digest())
+
+
+def filter_size(entries, fp_rate):
+    bits = max(64, math.ceil(-entries * math.log(fp_rate) / math.log(2) ** 2))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / max(entries, 1) * math.log(2)))
+    return bits, hashes
+
+
+# ===============================
+# BUILD
+# ===============================
+def read_words(path):
+    with open(path, "rb") as f:
+        for line in f:
+            word = line.rstrip(b"\r\n")
+            if word:
+                yield word
+
+
+def _set_bits(bits, chunk, bit_count, hash_count):
+    digests = b"".join(hashlib.blake2b(word, digest_size=16).digest() for word in chunk)
+    pairs = np.frombuffer(digests, dtype="<u8").reshape(-1, 2)  # same layout hash_pair() unpacks
+    h1, h2 = pairs[:, 0], pairs[:, 1]
+    for i in range(hash_count):
+        # uint64 arithmetic wraps like the & MASK64 used on lookup
+        positions = (h1 + np.uint64(i) * h2) % np.uint64(bit_count)
+        np.bitwise_or.at(bits, positions >> np.uint64(3), (1 << (positions & np.uint64(7))).astype(np.uint8))
+
+
+def build_filter(wordlist_path, output_path, fp_rate=0.001):
+    entries = sum(1 for _ in read_words(wordlist_path))
+    bit_count, hash_count = filter_size(entries, fp_rate)
+    bits = np.zeros(bit_count // 8, dtype=np.uint8)
+
+    chunk = []
+    with np.errstate(over="ignore"):
+        for word in read_words(wordlist_path):
+            chunk.append(word)
+            if len(chunk) >= CHUNK_LINES:
+                _set_bits(bits, chunk, bit_count, hash_count)
+                chunk = []
+        if chunk:
+            _set_bits(bits, chunk, bit_count, hash_count)
+
+    # Written aside and renamed, so processes still mapping the old filter keep a valid file
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, hash_count, bit_count, entries, fp_rate))
+        f.write(bits.tobytes())
+    os.replace(tmp_path, output_path)
+
+    size_mb = os.path.getsize(output_path) / 1e6
+    print(f"📄 Bloom filter saved: {output_path} ({entries} entries, {hash_count} hashes, {size_mb:.1f} MB)")
+    return entries
+
+
+# ===============================
+# LOOKUP
+# ===============================
+class BloomFilter:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.hash_count, self.bit_count, self.entries, self.fp_rate = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a Bloom filter (or wrong version): {path}")
+
+    def __contains__(self, word):
+        if isinstance(word, str):
+            word = word.encode("utf-8")
+        h1, h2 = hash_pair(word)
+        mm, offset = self._mm, HEADER.size
+        for i in range(self.hash_count):
+            position = ((h1 + i * h2) & MASK64) % self.bit_count
+            if not mm[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def close(self):
+        self._mm.close()
+
+
+_filters = {}
+
+
+def open_filter(path):
+    """Shared BloomFilter for path, or None when no blocklist has been built.
+
+    Misses are not cached and a rebuilt file is reopened, so a long-running
+    process picks up `build` output without a restart.
+    """
+    if not path:
+        return None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _filters.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _filters[path] = (mtime, BloomFilter(path))
+    return cached[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query a leaked-passphrase Bloom filter")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="compile a one-passphrase-per-line wordlist")
+    build.add_argument("wordlist")
+    build.add_argument("-o", "--output", default=os.path.join("data", "leaked.bloom"))
+    build.add_argument("--fp-rate", type=float, default=0.001, help="target false-positive rate")
+
+    check = sub.add_parser("check", help="check passphrases against a filter")
+    check.add_argument("filter")
+    check.add_argument("passphrase", nargs="+")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        if not 0 < args.fp_rate < 1:
+            parser.error("--fp-rate must be between 0 and 1")
+        build_filter(args.wordlist, args.output, args.fp_rate)
+    else:
+        blocklist = BloomFilter(args.filter)
+        for passphrase in args.passphrase:
+            print(f"{'⚠️ LEAKED' if passphrase in blocklist else '✅ not listed'}  {passphrase}")
+
+
+if __name__ == "__main__":
+    main()
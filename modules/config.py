@@ -0,0 +1,268 @@
+# 📄 modules/config.py
+import hashlib
+import json
+import os
+import threading
+
+import yaml
+
+from modules.scoring_rules import RuleSet
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
+
+EXECUTORS = ("serial", "thread", "process")
+SCAN_BACKENDS = ("auto", "netsh", "linux", "replay", "synthetic")
+LINUX_SCAN_TOOLS = ("auto", "nmcli", "iw")
+EXPORT_FORMATS = ("json", "csv", "jsonl", "parquet")
+SIMULATION_SPEEDS = ("fast", "normal", "slow")
+RISK_LEVELS = ("critical", "high", "medium", "low")
+
+DEFAULT_RISK_THRESHOLDS = {
+    "critical": 9,
+    "high": 7,
+    "medium": 5,
+    "low": 3
+}
+
+
+class ConfigError(ValueError):
+    pass
+
+
+class Config:
+    """Validated view of config.yaml. Build it through load_config()."""
+
+    def __init__(self, data=None, path=None, exists=True):
+        self.path = path
+        self.exists = exists
+        self.raw = data or {}
+
+        if not isinstance(self.raw, dict):
+            raise ConfigError("config.yaml must contain a mapping at the top level")
+
+        # Changes whenever any setting does; keys caches of config-dependent results
+        canonical = json.dumps(self.raw, sort_keys=True, default=str)
+        self.fingerprint = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+        lab = self._mapping(self.raw, "lab_settings")
+        self.lab_settings = lab
+
+        # ---- Simulation ----
+        self.simulation_mode = self._bool(lab, "simulation_mode", False)
+        self.simulation_speed = lab.get("simulation_speed", "normal")
+        if self.simulation_speed not in SIMULATION_SPEEDS:
+            raise ConfigError(
+                f"lab_settings.simulation_speed must be one of {', '.join(SIMULATION_SPEEDS)}"
+            )
+
+        self.simulation_seed = lab.get("simulation_seed")
+        if self.simulation_seed is not None and (
+            not isinstance(self.simulation_seed, int) or isinstance(self.simulation_seed, bool) or self.simulation_seed < 0
+        ):
+            raise ConfigError("lab_settings.simulation_seed must be a non-negative integer or null")
+
+        self.monte_carlo_trials = lab.get("monte_carlo_trials", 0)
+        if (
+            not isinstance(self.monte_carlo_trials, int) or isinstance(self.monte_carlo_trials, bool)
+            or self.monte_carlo_trials < 0
+        ):
+            raise ConfigError("lab_settings.monte_carlo_trials must be a non-negative integer")
+
+        self.target_networks = lab.get("target_networks") or []
+        if not isinstance(self.target_networks, list):
+            raise ConfigError("lab_settings.target_networks must be a list")
+
+        # ---- Scanner backend ----
+        scanner = self._mapping(lab, "scanner")
+        backend = scanner.get("backend", "auto")
+        if backend not in SCAN_BACKENDS:
+            raise ConfigError(f"lab_settings.scanner.backend must be one of {', '.join(SCAN_BACKENDS)}")
+
+        linux_tool = scanner.get("linux_tool", "auto")
+        if linux_tool not in LINUX_SCAN_TOOLS:
+            raise ConfigError(f"lab_settings.scanner.linux_tool must be one of {', '.join(LINUX_SCAN_TOOLS)}")
+
+        interface = scanner.get("interface")
+        if interface is not None and not isinstance(interface, str):
+            raise ConfigError("lab_settings.scanner.interface must be an interface name")
+
+        replay_path = scanner.get("replay_path", "captures")
+        if not isinstance(replay_path, str):
+            raise ConfigError("lab_settings.scanner.replay_path must be a path")
+
+        synthetic = self._mapping(scanner, "synthetic")
+        synthetic = {
+            "networks": synthetic.get("networks", 100),
+            "bssids_per_network": synthetic.get("bssids_per_network", 1),
+            "seed": synthetic.get("seed", 0)
+        }
+        for key, value in synthetic.items():
+            if not isinstance(value, int) or value < 0:
+                raise ConfigError(f"lab_settings.scanner.synthetic.{key} must be a non-negative integer")
+
+        oui_index = scanner.get("oui_index", os.path.join("data", "oui.idx"))
+        if not isinstance(oui_index, str):
+            raise ConfigError("lab_settings.scanner.oui_index must be a path")
+
+        timeout = scanner.get("timeout", 30)
+        if not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise ConfigError("lab_settings.scanner.timeout must be a positive number of seconds")
+
+        exports = self._strings(scanner, "exports") if "exports" in scanner else list(EXPORT_FORMATS)
+        unknown = [fmt for fmt in exports if fmt not in EXPORT_FORMATS]
+        if unknown:
+            raise ConfigError(f"lab_settings.scanner.exports must only contain {', '.join(EXPORT_FORMATS)}")
+
+        self.scanner = {
+            "backend": backend,
+            "timeout": timeout,
+            "oui_index": os.path.join(BASE_DIR, oui_index),
+            "linux_tool": linux_tool,
+            "interface": interface,
+            "rescan": self._bool(scanner, "rescan", False),
+            "replay_path": os.path.join(BASE_DIR, replay_path),
+            "synthetic": synthetic,
+            "exports": exports
+        }
+
+        # ---- Watch mode ----
+        watch = self._mapping(lab, "watch")
+        self.watch = {
+            "interval": watch.get("interval", 30),
+            "signal_threshold": watch.get("signal_threshold", 10),
+            "miss_limit": watch.get("miss_limit", 2)
+        }
+        for key, value in self.watch.items():
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ConfigError(f"lab_settings.watch.{key} must be a positive number")
+
+        # ---- Trend store ----
+        trends = self._mapping(lab, "trends")
+        trend_path = trends.get("path", os.path.join("evidence", "trends.db"))
+        if not isinstance(trend_path, str):
+            raise ConfigError("lab_settings.trends.path must be a path")
+        retention = trends.get("raw_retention_days")
+        if retention is not None and (not isinstance(retention, (int, float)) or retention <= 0):
+            raise ConfigError("lab_settings.trends.raw_retention_days must be a positive number or null")
+        self.trends = {
+            "enabled": self._bool(trends, "enabled", True),
+            "path": os.path.join(BASE_DIR, trend_path),
+            "raw_retention_days": retention
+        }
+
+        # ---- Dashboard ----
+        ui = self._mapping(lab, "ui")
+        self.ui = {"scan_ttl": ui.get("scan_ttl", 300), "page_size": ui.get("page_size", 50)}
+        if not isinstance(self.ui["scan_ttl"], (int, float)) or self.ui["scan_ttl"] <= 0:
+            raise ConfigError("lab_settings.ui.scan_ttl must be a positive number of seconds")
+        if not isinstance(self.ui["page_size"], int) or self.ui["page_size"] < 1:
+            raise ConfigError("lab_settings.ui.page_size must be a positive integer")
+
+        # ---- Metrics ----
+        metrics = self._mapping(lab, "metrics")
+        prometheus_file = metrics.get("prometheus_file")
+        if prometheus_file is not None and not isinstance(prometheus_file, str):
+            raise ConfigError("lab_settings.metrics.prometheus_file must be a path or null")
+        self.prometheus_file = os.path.join(BASE_DIR, prometheus_file) if prometheus_file else None
+
+        # ---- Execution ----
+        execution = self._mapping(lab, "execution")
+        self.executor = execution.get("executor", "serial")
+        if self.executor not in EXECUTORS:
+            raise ConfigError(f"lab_settings.execution.executor must be one of {', '.join(EXECUTORS)}")
+
+        self.workers = execution.get("workers")
+        if self.workers is not None and (not isinstance(self.workers, int) or self.workers < 1):
+            raise ConfigError("lab_settings.execution.workers must be a positive integer")
+
+        # ---- Password dictionaries ----
+        dictionaries = self._mapping(lab, "password_dictionaries")
+        self.weak_passwords = self._strings(dictionaries, "weak_passwords")
+        self.common_passwords = self._strings(dictionaries, "common_passwords")
+        self.ranked_wordlists = [
+            os.path.join(BASE_DIR, path) for path in self._strings(dictionaries, "ranked_wordlists")
+        ]
+
+        blocklist = dictionaries.get("blocklist")
+        if blocklist is not None and not isinstance(blocklist, str):
+            raise ConfigError("lab_settings.password_dictionaries.blocklist must be a path")
+        self.passphrase_blocklist = os.path.join(BASE_DIR, blocklist) if blocklist else None
+
+        # ---- Scoring rules (compiled once per load) ----
+        try:
+            self.rules = RuleSet(self._mapping(lab, "scoring_rules"))
+        except ValueError as e:
+            raise ConfigError(f"lab_settings.scoring_rules.{e}")
+
+        # ---- Report settings ----
+        report = self._mapping(lab, "report_settings")
+        self.include_recommendations = self._bool(report, "include_recommendations", True)
+        self.report_dev_mode = self._bool(report, "dev_mode", False)
+
+        self.report_page_size = report.get("page_size", 100)
+        if not isinstance(self.report_page_size, int) or self.report_page_size < 1:
+            raise ConfigError("report_settings.page_size must be a positive integer")
+
+        self.report_pdf_workers = report.get("pdf_workers", 4)
+        if not isinstance(self.report_pdf_workers, int) or self.report_pdf_workers < 1:
+            raise ConfigError("report_settings.pdf_workers must be a positive integer")
+
+        thresholds = dict(DEFAULT_RISK_THRESHOLDS)
+        thresholds.update(self._mapping(report, "risk_thresholds"))
+        for level in RISK_LEVELS:
+            if not isinstance(thresholds[level], (int, float)):
+                raise ConfigError(f"report_settings.risk_thresholds.{level} must be a number")
+        values = [thresholds[level] for level in RISK_LEVELS]
+        if values != sorted(values, reverse=True):
+            raise ConfigError("report_settings.risk_thresholds must decrease from critical to low")
+        self.risk_thresholds = thresholds
+
+    # ===============================
+    # VALIDATION HELPERS
+    # ===============================
+    def _mapping(self, parent, key):
+        value = parent.get(key) or {}
+        if not isinstance(value, dict):
+            raise ConfigError(f"{key} must be a mapping")
+        return value
+
+    def _bool(self, parent, key, default):
+        value = parent.get(key, default)
+        if not isinstance(value, bool):
+            raise ConfigError(f"{key} must be true or false")
+        return value
+
+    def _strings(self, parent, key):
+        value = parent.get(key) or []
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ConfigError(f"{key} must be a list of strings")
+        return value
+
+
+# ===============================
+# CACHED LOADER
+# ===============================
+_cache = {}
+_lock = threading.Lock()
+
+
+def load_config(path=None):
+    """Return the parsed Config for path, re-reading it only when its mtime changes."""
+    path = os.path.abspath(path or DEFAULT_CONFIG_PATH)
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return Config({}, path, exists=False)
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, "r", encoding="utf-8") as f:
+            config = Config(yaml.safe_load(f), path)
+
+        _cache[path] = (mtime, config)
+        return config
@@ -1,19 +1,20 @@
+from modules.config import load_config
+
+
 class EncryptionAnalyzer:
+    def __init__(self, config=None):
+        self.rules = (config or load_config()).rules
+
     def analyze(self, network):
         enc = network["encryption"]
 
-        score_map = {
-            "OPEN": ("Critical", 9),
-            "WEP": ("Critical", 9),
-            "WPA": ("High", 7),
-            "WPA2": ("Medium", 5),
-            "WPA3": ("Low", 2)
-        }
-
-        severity, score = score_map.get(enc, ("Unknown", 5))
+        severity, score = self.rules.encryption_rule(enc)
 
         return {
             "type": enc,
             "severity": severity,
             "score": score
         }
+
+    def analyze_batch(self, networks):
+        return [self.analyze(network) for network in networks]
@@ -1,15 +1,217 @@
+import argparse
 import json
 import os
+import sqlite3
+import time
+import uuid
 from datetime import datetime
 
+from modules.config import BASE_DIR
+
+DEFAULT_STORE = os.path.join(BASE_DIR, "evidence", "evidence.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id        TEXT PRIMARY KEY,
+    saved_at      REAL NOT NULL,
+    mode          TEXT NOT NULL,
+    network_count INTEGER NOT NULL,
+    payload       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS audits (
+    id         INTEGER PRIMARY KEY,
+    run_id     TEXT NOT NULL REFERENCES runs(run_id),
+    audited_at REAL NOT NULL,
+    ssid       TEXT,
+    bssid      TEXT,
+    encryption TEXT,
+    risk_level TEXT,
+    risk_score REAL,
+    payload    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS audits_bssid ON audits (bssid, audited_at);
+CREATE INDEX IF NOT EXISTS audits_ssid ON audits (ssid, audited_at);
+CREATE INDEX IF NOT EXISTS audits_run ON audits (run_id);
+CREATE INDEX IF NOT EXISTS audits_time ON audits (audited_at);
+"""
+
+AUDIT_KEYS = ("target", "encryption", "handshake", "protection", "password", "risk", "risk_distribution")
+
+
 class EvidenceCollector:
-    def save(self, data):
-        os.makedirs("evidence", exist_ok=True)
+    """Indexed SQLite evidence store: one row per run, one row per audited network."""
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_STORE
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        # WAL keeps each save to one sequential append plus index updates
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _split(self, data):
+        # Batch runs carry a list of per-network results; single runs are one
+        if "networks" in data:
+            audits = data["networks"]
+            run = {k: v for k, v in data.items() if k != "networks"}
+        else:
+            audits = [{k: data[k] for k in AUDIT_KEYS if k in data}]
+            run = {k: v for k, v in data.items() if k not in AUDIT_KEYS}
+        return run, audits
+
+    def save(self, data, saved_at=None):
+        run_id = uuid.uuid4().hex
+        saved_at = saved_at or time.time()
+        run, audits = self._split(data)
+        mode = "batch" if "networks" in data else "single"
+
+        rows = []
+        for audit in audits:
+            target = audit.get("target", {})
+            risk = audit.get("risk", {})
+            rows.append((
+                run_id,
+                saved_at,
+                target.get("ssid"),
+                (target.get("bssid") or "").lower() or None,
+                target.get("encryption"),
+                risk.get("level"),
+                risk.get("score"),
+                json.dumps(audit, separators=(",", ":"))
+            ))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?, ?)",
+                    (run_id, saved_at, mode, len(rows), json.dumps(run, separators=(",", ":")))
+                )
+                conn.executemany(
+                    "INSERT INTO audits (run_id, audited_at, ssid, bssid, encryption, risk_level, risk_score, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        finally:
+            conn.close()
+
+        print(f"📁 Evidence saved to: {self.path} (run {run_id})")
+        return run_id
+
+    # ===============================
+    # QUERIES
+    # ===============================
+    def query(self, bssid=None, ssid=None, run_id=None, since=None, until=None, days=None, limit=None):
+        """Audits matching every given filter, newest first.
+
+        e.g. query(bssid="cc:54:fe:e3:cd:88", days=30)
+        """
+        clauses, params = [], []
+        if bssid:
+            clauses.append("bssid = ?")
+            params.append(bssid.lower())
+        if ssid:
+            clauses.append("ssid = ?")
+            params.append(ssid)
+        if run_id:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        if days is not None:
+            since = time.time() - days * 86400
+        if since is not None:
+            clauses.append("audited_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("audited_at < ?")
+            params.append(until)
+
+        sql = "SELECT run_id, audited_at, payload FROM audits"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY audited_at DESC, id"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+
+        conn = self._connect()
+        try:
+            results = []
+            for row in conn.execute(sql, params):
+                audit = json.loads(row["payload"])
+                audit["run_id"] = row["run_id"]
+                audit["audited_at"] = datetime.fromtimestamp(row["audited_at"]).isoformat()
+                results.append(audit)
+            return results
+        finally:
+            conn.close()
+
+    def load_run(self, run_id):
+        """Rebuild the evidence record that was passed to save()."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT mode, payload FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+
+            data = json.loads(row["payload"])
+            audits = [
+                json.loads(r["payload"])
+                for r in conn.execute("SELECT payload FROM audits WHERE run_id = ? ORDER BY id", (run_id,))
+            ]
+        finally:
+            conn.close()
+
+        if row["mode"] == "batch":
+            data["networks"] = audits
+        elif audits:
+            data.update(audits[0])
+        return data
+
+    def import_json(self, paths):
+        # Migrates the old one-file-per-run evidence/<timestamp>.json records
+        run_ids = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            try:
+                saved_at = datetime.fromisoformat(data["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                saved_at = os.path.getmtime(path)
+            run_ids.append(self.save(data, saved_at=saved_at))
+        return run_ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query or import audit evidence")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="evidence database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    query = sub.add_parser("query", help="list audits matching filters")
+    query.add_argument("--bssid")
+    query.add_argument("--ssid")
+    query.add_argument("--run")
+    query.add_argument("--days", type=float, help="only audits from the last N days")
+    query.add_argument("--limit", type=int, default=50)
+
+    legacy = sub.add_parser("import", help="import legacy evidence/<timestamp>.json files")
+    legacy.add_argument("files", nargs="+")
+
+    args = parser.parse_args(argv)
+    store = EvidenceCollector(args.store)
+
+    if args.command == "import":
+        store.import_json(args.files)
+        return
 
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = os.path.join("evidence", f"{timestamp}.json")
+    for audit in store.query(args.bssid, args.ssid, args.run, days=args.days, limit=args.limit):
+        target, risk = audit.get("target", {}), audit.get("risk", {})
+        print(f"{audit['audited_at']}  {audit['run_id'][:8]}  {target.get('ssid')} ({target.get('bssid')})  "
+              f"{risk.get('level')} {risk.get('score')}")
 
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
 
-        print(f"📁 Evidence saved to: {filename}")
+if __name__ == "__main__":
+    main()
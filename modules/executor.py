@@ -0,0 +1,100 @@
+# 📄 modules/executor.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from modules.config import EXECUTORS
+from modules.encryption_analyzer import EncryptionAnalyzer
+from modules.handshake_test import HandshakeTest
+from modules.metrics import Metrics
+from modules.protection_test import ProtectionTest
+from modules.password_audit import PasswordAudit
+from modules.risk_engine import RiskEngine
+from modules.simulation import SimulationEngine
+
+
+def analyze_network(target, config=None, handshake=None, protection=None, passphrase=None):
+    # Module-level so it can be pickled into process pool workers.
+    # Stage timings travel back with the result; StageExecutor.analyze()
+    # pops them into the parent's Metrics.
+    timings = {}
+    started = time.perf_counter()
+
+    def lap(stage):
+        nonlocal started
+        now = time.perf_counter()
+        timings[stage] = now - started
+        started = now
+
+    encryption = EncryptionAnalyzer(config).analyze(target)
+    lap("encryption_analysis")
+    if handshake is None:
+        handshake = HandshakeTest().run(target)
+        lap("handshake_test")
+    if protection is None:
+        protection = ProtectionTest().run(target)
+        lap("protection_test")
+    # The passphrase is rated but never copied into the returned target
+    password = PasswordAudit(config).run(dict(target, passphrase=passphrase) if passphrase else target)
+    lap("password_audit")
+    risk = RiskEngine(config).calculate(encryption, protection, password)
+    lap("risk_scoring")
+
+    return {
+        "target": target,
+        "encryption": encryption,
+        "handshake": handshake,
+        "protection": protection,
+        "password": password,
+        "risk": risk,
+        "timings": timings
+    }
+
+
+def analyze_simulated(item, config=None):
+    target, handshake, protection, passphrase = item
+    return analyze_network(target, config, handshake, protection, passphrase)
+
+
+class StageExecutor:
+    def __init__(self, kind="serial", workers=None):
+        if kind not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{kind}', expected one of: {', '.join(EXECUTORS)}")
+
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+
+    def map(self, func, items):
+        # Results always come back in input (scan) order
+        items = list(items)
+
+        if self.kind == "serial" or len(items) < 2:
+            return [func(item) for item in items]
+
+        pool_cls = ThreadPoolExecutor if self.kind == "thread" else ProcessPoolExecutor
+        workers = min(self.workers, len(items))
+        chunksize = max(1, len(items) // (workers * 4))
+
+        with pool_cls(max_workers=workers) as pool:
+            if self.kind == "process":
+                return list(pool.map(func, items, chunksize=chunksize))
+            return list(pool.map(func, items))
+
+    def analyze(self, targets, config=None, engine=None, metrics=None, passphrases=None):
+        # passphrases: optional list aligned with targets (None where unknown)
+        targets = list(targets)
+        passphrases = passphrases or [None] * len(targets)
+        engine = engine or SimulationEngine()
+        metrics = metrics or Metrics()
+
+        # Simulated stages are drawn here in one vectorized pass, so results
+        # depend only on the engine seed, never on how work is split up
+        with metrics.timer("simulation"):
+            handshakes, protections = engine.run(targets)
+        results = self.map(partial(analyze_simulated, config=config), zip(targets, handshakes, protections, passphrases))
+
+        for result in results:
+            metrics.merge(result.pop("timings"))
+        metrics.count("networks_analyzed", len(results))
+        return results
@@ -0,0 +1,165 @@
+# 📄 modules/metrics.py
+"""Per-stage timers and counters for one audit run.
+
+    metrics = Metrics()
+    with metrics.timer("evidence_write"):
+        ...
+    metrics.count("bssids_scanned", 12)
+
+Latencies go into fixed histogram buckets (no samples are kept), so a
+long watch session costs the same memory as a single scan. summary() is
+stored with the evidence and shown in the report; write_prometheus()
+writes the Prometheus text format, e.g. for node_exporter's textfile
+collector.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency buckets; a final +Inf bucket is implied
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+
+PROMETHEUS_PREFIX = "wifi_audit"
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def cumulative(self):
+        """[(upper bound, observations <= bound)], ending with +Inf."""
+        total, buckets = 0, []
+        for bound, count in zip((*BUCKETS, float("inf")), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class Metrics:
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    # ===============================
+    # RECORDING
+    # ===============================
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, timings):
+        """Adds {stage: seconds} measured elsewhere (e.g. in a worker process)."""
+        for stage, seconds in timings.items():
+            self.observe(stage, seconds)
+
+    def total(self, stage):
+        histogram = self.histograms.get(stage)
+        return histogram.sum if histogram else 0.0
+
+    def timed(self, iterable, stage):
+        """Yields from iterable, recording the time spent waiting on it as one observation."""
+        iterator = iter(iterable)
+        waited = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    waited += time.perf_counter() - started
+                    return
+                waited += time.perf_counter() - started
+                yield item
+        finally:
+            self.observe(stage, waited)
+
+    async def atimed(self, iterable, stage):
+        """Async twin of timed()."""
+        iterator = iterable.__aiter__()
+        waited = 0.0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    waited += time.perf_counter() - started
+                    return
+                waited += time.perf_counter() - started
+                yield item
+        finally:
+            self.observe(stage, waited)
+
+    # ===============================
+    # OUTPUT
+    # ===============================
+    def summary(self):
+        """JSON-ready stage latencies and counters, slowest stage first."""
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": h.count,
+                    "total_seconds": round(h.sum, 6),
+                    "mean_seconds": round(h.sum / h.count, 6) if h.count else 0.0,
+                    "max_seconds": round(h.max, 6),
+                    "buckets": [["+Inf" if bound == float("inf") else bound, n] for bound, n in h.cumulative()]
+                }
+                for stage, h in sorted(self.histograms.items(), key=lambda item: -item[1].sum)
+            }
+            return {"stages": stages, "counters": dict(sorted(self.counters.items()))}
+
+    def to_prometheus(self):
+        lines = [
+            f"# HELP {PROMETHEUS_PREFIX}_stage_seconds Time spent in each audit pipeline stage.",
+            f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds histogram"
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+                lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_sum{{stage="{stage}"}} {histogram.sum!r}')
+                lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+            lines.append(f"# HELP {PROMETHEUS_PREFIX}_events_total Items processed by the audit pipeline.")
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_events_total counter")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f'{PROMETHEUS_PREFIX}_events_total{{event="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        # Written to a temp file and renamed, so scrapers never read half a file
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+        print(f"📈 Metrics saved: {path}")
+        return path
@@ -1,157 +1,165 @@
 # modules/network_scanner.py
 
-import subprocess
-import re
-import yaml
+import asyncio
 import os
 import json
 import csv
-import ctypes
+import time
 
 from datetime import datetime
 
+from modules.config import BASE_DIR, load_config
+from modules.metrics import Metrics
+from modules.network_watch import NetworkIndex, error_event
+from modules.oui_index import open_index
+from modules.scan_backends import build_backend
+from modules.scan_export import ScanExport
+from modules.scan_parsers import normalize_encryption
+from modules.trend_store import TrendStore
+
+# Used only until data/oui.idx is built (python -m modules.oui_index build ...)
+FALLBACK_VENDORS = {
+    "AA:BB:CC": "Cisco Systems",
+    "11:22:33": "TP-Link",
+    "AA:11:BB": "Ubiquiti",
+    "00:50:F2": "Microsoft",
+    "00:1A:2B": "Netgear"
+}
+
+
+def build_target(net):
+    # Flatten a scanned network onto its strongest access point so the
+    # analysis modules see the same shape as a single-target audit.
+    aps = net.get("bssids") or [{}]
+    best = max(aps, key=lambda ap: ap.get("signal") or 0)
+    return {
+        "ssid": net.get("ssid"),
+        "encryption": net.get("encryption"),
+        "bssid": best.get("bssid"),
+        "vendor": best.get("vendor", "Unknown"),
+        "signal": best.get("signal"),
+        "channel": best.get("channel"),
+        "band": best.get("band"),
+        "ap_count": len(net.get("bssids", [])),
+        "last_seen": net.get("last_seen")
+    }
 
-class NetworkScanner:
-    def __init__(self):
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_path = os.path.join(base_dir, "config.yaml")
-
-        with open(config_path, "r") as f:
-            self.config = yaml.safe_load(f)
-
-        self.simulation = self.config.get("lab_settings", {}).get("simulation_mode", False)
 
-        self.export_dir = os.path.join(base_dir, "reports")
+class NetworkScanner:
+    def __init__(self, config=None, backend=None, metrics=None):
+        self.config = config or load_config()
+        self.simulation = self.config.simulation_mode
+        self.backend = backend or build_backend(self.config)
+        self.metrics = metrics or Metrics()
+        self.backend.metrics = self.metrics
+        self.oui_index = open_index(self.config.scanner["oui_index"])
+
+        self.export_dir = os.path.join(BASE_DIR, "reports")
         os.makedirs(self.export_dir, exist_ok=True)
 
     def scan(self):
-        if self.simulation:
-            networks = self._scan_simulated()
-        else:
-            networks = self._scan_windows_real()
-
-        self.export_json(networks)
-        self.export_csv(networks)
+        # History formats are appended as each network is parsed,
+        # the wifi_scan.json/csv snapshots once the scan is complete
+        with self.open_history() as history:
+            networks = [history.write(network) for network in self.iter_scan()]
+            with self.metrics.timer("export"):
+                history.close()
+                self.export_snapshots(networks)
+        with self.metrics.timer("trend_write"):
+            self.record_trends(networks, history.scan_time)
 
         return networks
 
-    # ===============================
-    # WINDOWS PREFLIGHT CHECK
-    # ===============================
-    def _windows_precheck(self):
-        # ---- Admin privilege check ----
-        try:
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-        except Exception:
-            is_admin = False
-
-        if not is_admin:
-            raise PermissionError(
-                "Administrator privileges required.\n"
-                "Right-click PowerShell → Run as administrator."
-            )
-
-        # ---- WLAN + Location permission check ----
-        result = subprocess.run(
-            ["netsh", "wlan", "show", "interfaces"],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore"
-        )
-
-        if "Location permission" in result.stdout:
-            # Optional: open settings page (cannot auto-enable)
-            # subprocess.run(["start", "ms-settings:privacy-location"], shell=True)
-
-            raise PermissionError(
-                "Location Services are disabled.\n"
-                "Enable:\n"
-                "Settings → Privacy & Security → Location\n"
-                "Also enable: 'Let desktop apps access location'."
-            )
+    def iter_scan(self):
+        # Yields each network as soon as it is parsed, without exporting
+        if self.simulation:
+            yield from self._scan_simulated()
+            return
+
+        self.oui_index = open_index(self.config.scanner["oui_index"])  # once per scan; picks up a rebuilt index
+        # Backend time is the subprocess wait plus parsing (the two are streamed together)
+        before = self._backend_totals()
+        for network in self.metrics.timed(self.backend.iter_networks(), "scan_backend"):
+            yield self._enrich(network)
+        self._record_parse(before)
 
     # ===============================
-    # REAL WINDOWS WIFI SCANNER
+    # ASYNC API (UIs / event loops)
     # ===============================
-    def _scan_windows_real(self):
-        # Mandatory precheck
-        self._windows_precheck()
-
-        print("\n📡 Scanning real Wi-Fi networks (Windows)...\n")
-
-        cmd = ["netsh", "wlan", "show", "networks", "mode=bssid"]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="ignore"
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError("Wi-Fi scan failed. Ensure WLAN service is running.")
-
-        output = result.stdout
-
-        networks = {}
-        current_ssid = None
-        current_bssid = None
-
-        for line in output.splitlines():
-            line = line.strip()
-
-            if line.startswith("SSID "):
-                ssid = line.split(":", 1)[1].strip()
-                current_ssid = ssid
-
-                if ssid not in networks:
-                    networks[ssid] = {
-                        "ssid": ssid,
-                        "encryption": None,
-                        "bssids": [],
-                        "last_seen": datetime.now().strftime("%H:%M:%S")
-                    }
+    async def scan_async(self):
+        with self.open_history() as history:
+            networks = [history.write(network) async for network in self.aiter_scan()]
+            with self.metrics.timer("export"):
+                await asyncio.to_thread(history.close)
+                await asyncio.to_thread(self.export_snapshots, networks)
+        with self.metrics.timer("trend_write"):
+            await asyncio.to_thread(self.record_trends, networks, history.scan_time)
 
-            elif line.startswith("Authentication") and current_ssid:
-                raw = line.split(":", 1)[1].strip()
-                networks[current_ssid]["encryption"] = self.normalize_encryption(raw)
-
-            elif line.startswith("BSSID") and current_ssid:
-                bssid = line.split(":", 1)[1].strip()
-                current_bssid = {
-                    "bssid": bssid,
-                    "vendor": self.get_vendor_from_bssid(bssid),
-                    "signal": None,
-                    "channel": None,
-                    "band": None
-                }
-                networks[current_ssid]["bssids"].append(current_bssid)
-
-            elif line.startswith("Signal") and current_bssid:
-                current_bssid["signal"] = self.extract_number(line)
-
-            elif line.startswith("Channel") and current_bssid:
-                channel = self.extract_number(line)
-                current_bssid["channel"] = channel
-                current_bssid["band"] = self.detect_band(channel)
+        return networks
 
-        result = list(networks.values())
+    async def aiter_scan(self):
+        # Same records as iter_scan(), but subprocess I/O never blocks the loop
+        if self.simulation:
+            for network in self._scan_simulated():
+                yield network
+            return
 
-        if not result:
-            print("❌ No Wi-Fi networks detected.")
-        else:
-            for i, n in enumerate(result, 1):
-                print(f"{i}. {n['ssid']} | {n['encryption']} | APs: {len(n['bssids'])}")
+        self.oui_index = open_index(self.config.scanner["oui_index"])
+        before = self._backend_totals()
+        async for network in self.metrics.atimed(self.backend.aiter_networks(), "scan_backend"):
+            yield self._enrich(network)
+        self._record_parse(before)
 
-        return result
+    # ===============================
+    # WATCH MODE
+    # ===============================
+    def watch(self, interval=None, cycles=None, index=None):
+        # Rescans forever (or for `cycles` rounds) and yields (cycle, events)
+        # with only what changed; nothing is exported to reports/. A failed
+        # scan yields a single "error" event and leaves the index as it was.
+        settings = self.config.watch
+        interval = settings["interval"] if interval is None else interval
+        index = index or NetworkIndex(settings["signal_threshold"], settings["miss_limit"])
+        self.backend.verbose = False
+
+        cycle = 0
+        while cycles is None or cycle < cycles:
+            started = time.monotonic()
+            cycle += 1
+            try:
+                # Read the whole scan first so a failure halfway does not count as BSSIDs going missing
+                networks = list(self.iter_scan())
+            except (RuntimeError, OSError) as e:
+                self.metrics.count("scan_errors")
+                yield cycle, [error_event(e)]
+            else:
+                yield cycle, index.update(networks)
+
+            if cycles is not None and cycle >= cycles:
+                break
+            time.sleep(max(0, interval - (time.monotonic() - started)))
 
     # ===============================
     # HELPERS
     # ===============================
-    def extract_number(self, text):
-        match = re.search(r"\d+", text)
-        return int(match.group()) if match else None
+    def _enrich(self, network):
+        network["last_seen"] = datetime.now().strftime("%H:%M:%S")
+        started = time.perf_counter()
+        for ap in network["bssids"]:
+            ap["vendor"] = self.get_vendor_from_bssid(ap["bssid"])
+            ap["band"] = self.detect_band(ap["channel"])
+        self.metrics.observe("vendor_lookup", time.perf_counter() - started)
+        self.metrics.count("networks_scanned")
+        self.metrics.count("bssids_scanned", len(network["bssids"]))
+        return network
+
+    def _backend_totals(self):
+        return self.metrics.total("scan_backend"), self.metrics.total("scan_subprocess")
+
+    def _record_parse(self, before):
+        # Parsing is whatever backend time was not spent waiting on the subprocess
+        backend, subprocess_wait = (after - start for after, start in zip(self._backend_totals(), before))
+        self.metrics.observe("parse", max(0.0, backend - subprocess_wait))
 
     def detect_band(self, channel):
         if channel is None:
@@ -159,24 +167,35 @@ class NetworkScanner:
         return "2.4 GHz" if channel <= 14 else "5 GHz"
 
     def normalize_encryption(self, auth):
-        auth = auth.lower()
-
-        if "open" in auth:
-            return "Open"
-        if "wpa3" in auth and "wpa2" in auth:
-            return "WPA2/WPA3"
-        if "wpa3" in auth:
-            return "WPA3"
-        if "wpa2" in auth:
-            return "WPA2"
-        if "wpa" in auth:
-            return "WPA"
-
-        return "Unknown"
+        return normalize_encryption(auth)
 
     # ===============================
     # EXPORT FUNCTIONS
     # ===============================
+    def export(self, networks):
+        with self.metrics.timer("export"):
+            self.export_snapshots(networks)
+            with self.open_history() as history:
+                history.write_all(networks)
+        with self.metrics.timer("trend_write"):
+            self.record_trends(networks, history.scan_time)
+
+    def export_snapshots(self, networks):
+        formats = self.config.scanner["exports"]
+        if "json" in formats:
+            self.export_json(networks)
+        if "csv" in formats:
+            self.export_csv(networks)
+
+    def record_trends(self, networks, scanned_at):
+        settings = self.config.trends
+        if settings["enabled"] and networks:
+            TrendStore(settings["path"], settings["raw_retention_days"]).record(networks, scanned_at.timestamp())
+
+    def open_history(self):
+        # Append-only JSONL stream and partitioned Parquet dataset
+        return ScanExport(self.export_dir, self.config.scanner["exports"])
+
     def export_json(self, networks):
         path = os.path.join(self.export_dir, "wifi_scan.json")
         with open(path, "w", encoding="utf-8") as f:
@@ -235,13 +254,7 @@ class NetworkScanner:
         if not bssid:
             return "Unknown"
 
-        vendor_map = {
-            "AA:BB:CC": "Cisco Systems",
-            "11:22:33": "TP-Link",
-            "AA:11:BB": "Ubiquiti",
-            "00:50:F2": "Microsoft",
-            "00:1A:2B": "Netgear"
-        }
+        if self.oui_index is not None:
+            return self.oui_index.lookup(bssid) or "Unknown"
 
-        prefix = bssid[:8].upper()
-        return vendor_map.get(prefix, "Unknown")
+        return FALLBACK_VENDORS.get(bssid[:8].upper(), "Unknown")
@@ -0,0 +1,127 @@
+# 📄 modules/network_table.py
+"""Columnar, one-row-per-BSSID view of a scan for the dashboards.
+
+The table is built once per scan; filtering, sorting and paging then
+work on NumPy columns, and only the requested page is turned back into
+rows for the widget, so 20k+ BSSIDs stay interactive:
+
+    table = NetworkTable(networks)
+    rows = table.query(ssid="guest", bands=["5 GHz"], signal=(40, 100), sort="signal")
+    table.page(rows, 0, 50)
+"""
+import math
+
+import numpy as np
+
+# column -> heading shown by the dashboards
+COLUMNS = {
+    "ssid": "SSID",
+    "encryption": "Encryption",
+    "bssid": "BSSID",
+    "vendor": "Vendor",
+    "signal": "Signal (%)",
+    "channel": "Channel",
+    "band": "Band",
+    "last_seen": "Last Seen"
+}
+SORT_KEYS = ("signal", "ssid", "channel", "encryption", "band", "vendor", "bssid")
+
+
+class NetworkTable:
+    def __init__(self, networks):
+        self.networks = list(networks)
+        values = {name: [] for name in COLUMNS}
+        network_index = []
+        for i, net in enumerate(self.networks):
+            for ap in net["bssids"]:
+                values["ssid"].append(net.get("ssid") or "")
+                values["encryption"].append(net.get("encryption") or "Unknown")
+                values["bssid"].append(ap.get("bssid") or "")
+                values["vendor"].append(ap.get("vendor") or "Unknown")
+                values["signal"].append(ap.get("signal"))
+                values["channel"].append(ap.get("channel"))
+                values["band"].append(ap.get("band") or "Unknown")
+                values["last_seen"].append(net.get("last_seen"))
+                network_index.append(i)
+
+        # Original values for display; typed arrays for filtering and sorting
+        self.values = values
+        self.network_index = np.array(network_index, dtype=np.int64)
+        self.columns = {
+            "ssid": np.array(values["ssid"], dtype=object),
+            "ssid_lower": np.array([s.lower() for s in values["ssid"]], dtype=object),
+            "encryption": np.array(values["encryption"], dtype=object),
+            "band": np.array(values["band"], dtype=object),
+            "vendor": np.array(values["vendor"], dtype=object),
+            "bssid": np.array(values["bssid"], dtype=object),
+            "signal": np.array([np.nan if v is None else v for v in values["signal"]], dtype=float),
+            "channel": np.array([np.nan if v is None else v for v in values["channel"]], dtype=float)
+        }
+        self._orders = {}
+
+    def __len__(self):
+        return len(self.network_index)
+
+    def options(self, column):
+        """Distinct values of a categorical column, for filter widgets."""
+        return sorted(set(self.values[column]))
+
+    # ===============================
+    # QUERY
+    # ===============================
+    def mask(self, ssid=None, encryptions=None, bands=None, signal=None):
+        keep = np.ones(len(self), dtype=bool)
+        if ssid:
+            needle = ssid.lower()
+            keep &= np.fromiter((needle in s for s in self.columns["ssid_lower"]), dtype=bool, count=len(self))
+        if encryptions:
+            keep &= np.isin(self.columns["encryption"], list(encryptions))
+        if bands:
+            keep &= np.isin(self.columns["band"], list(bands))
+        if signal:
+            low, high = signal
+            keep &= (self.columns["signal"] >= low) & (self.columns["signal"] <= high)
+        return keep
+
+    def order(self, sort="signal", descending=True):
+        """Row order for a sort key (computed once per key and direction); missing values last."""
+        key = (sort, descending)
+        if key not in self._orders:
+            if sort not in SORT_KEYS:
+                raise ValueError(f"Unknown sort column: {sort}")
+            column = self.columns["ssid_lower" if sort == "ssid" else sort]
+            if column.dtype == object:
+                order = np.argsort(column.astype(str), kind="stable")
+                if descending:
+                    order = order[::-1]
+            else:
+                missing = np.isnan(column)
+                order = np.argsort(-column if descending else column, kind="stable")
+                order = np.concatenate([order[~missing[order]], order[missing[order]]])
+            self._orders[key] = order
+        return self._orders[key]
+
+    def query(self, ssid=None, encryptions=None, bands=None, signal=None, sort="signal", descending=True):
+        """Row indices matching every filter, in sort order."""
+        order = self.order(sort, descending)
+        return order[self.mask(ssid, encryptions, bands, signal)[order]]
+
+    # ===============================
+    # PAGING
+    # ===============================
+    def page_count(self, rows, page_size):
+        return max(1, math.ceil(len(rows) / page_size))
+
+    def page(self, rows, page, page_size):
+        """Columns ({heading: values}) of one page of rows."""
+        selected = rows[page * page_size:(page + 1) * page_size].tolist()
+        return {heading: [self.values[name][i] for i in selected] for name, heading in COLUMNS.items()}
+
+    def page_positions(self, rows, page, page_size):
+        """Scan positions of the networks behind one page of rows, in order and without repeats."""
+        selected = self.network_index[rows[page * page_size:(page + 1) * page_size]]
+        return list(dict.fromkeys(selected.tolist()))
+
+    def page_networks(self, rows, page, page_size):
+        """The networks behind one page of rows, in order and without repeats."""
+        return [self.networks[i] for i in self.page_positions(rows, page, page_size)]
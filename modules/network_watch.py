@@ -0,0 +1,104 @@
+# 📄 modules/network_watch.py
+from datetime import datetime
+
+EVENT_ICONS = {
+    "new": "🆕",
+    "gone": "👻",
+    "encryption": "🔐",
+    "channel": "📶",
+    "signal": "📈",
+    "error": "⚠️"
+}
+
+
+class NetworkIndex:
+    """In-memory BSSID index that turns successive scans into change events."""
+
+    def __init__(self, signal_threshold=10, miss_limit=2):
+        self.signal_threshold = signal_threshold
+        self.miss_limit = miss_limit
+        self.aps = {}
+
+    def _event(self, kind, bssid, ap, old=None, new=None):
+        return {
+            "event": kind,
+            "bssid": bssid,
+            "ssid": ap["ssid"],
+            "old": old,
+            "new": new,
+            "time": datetime.now().isoformat(timespec="seconds")
+        }
+
+    def update(self, networks):
+        events = []
+        seen = set()
+
+        for net in networks:
+            for ap in net["bssids"]:
+                bssid = ap["bssid"].lower()
+                seen.add(bssid)
+                current = {
+                    "ssid": net["ssid"],
+                    "encryption": net["encryption"],
+                    "channel": ap["channel"],
+                    "band": ap["band"],
+                    "vendor": ap["vendor"],
+                    "signal": ap["signal"]
+                }
+
+                known = self.aps.get(bssid)
+                if known is None:
+                    current["reported_signal"] = current["signal"]
+                    current["misses"] = 0
+                    self.aps[bssid] = current
+                    events.append(self._event("new", bssid, current, new=current["encryption"]))
+                    continue
+
+                known["misses"] = 0
+                for field in ("encryption", "channel"):
+                    if current[field] != known[field]:
+                        events.append(self._event(field, bssid, current, known[field], current[field]))
+                        known[field] = current[field]
+
+                # Compare against the last reported level so slow drifts still surface
+                signal = current["signal"]
+                reported = known["reported_signal"]
+                if signal is not None and (reported is None or abs(signal - reported) >= self.signal_threshold):
+                    events.append(self._event("signal", bssid, current, reported, signal))
+                    known["reported_signal"] = signal
+
+                known.update(ssid=current["ssid"], band=current["band"], vendor=current["vendor"], signal=signal)
+
+        for bssid in list(self.aps):
+            if bssid in seen:
+                continue
+            known = self.aps[bssid]
+            known["misses"] += 1
+            if known["misses"] >= self.miss_limit:
+                events.append(self._event("gone", bssid, known, old=known["encryption"]))
+                del self.aps[bssid]
+
+        return events
+
+
+def error_event(error):
+    """Event for a watch cycle whose scan failed; the index is left untouched."""
+    return {
+        "event": "error",
+        "bssid": None,
+        "ssid": None,
+        "old": None,
+        "new": f"{type(error).__name__}: {error}",
+        "time": datetime.now().isoformat(timespec="seconds")
+    }
+
+
+def format_event(event):
+    if event["event"] == "error":
+        return f"{EVENT_ICONS['error']} [{event['time']}] {'ERROR':<10} scan failed: {event['new']}"
+
+    icon = EVENT_ICONS.get(event["event"], "•")
+    text = f"{icon} [{event['time']}] {event['event'].upper():<10} {event['bssid']} ({event['ssid']})"
+    if event["event"] in ("encryption", "channel", "signal"):
+        text += f": {event['old']} → {event['new']}"
+    return text
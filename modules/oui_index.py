@@ -0,0 +1,205 @@
+# 📄 modules/oui_index.py
+"""Prebuilt, memory-mapped index of the IEEE OUI registry.
+
+Build it once from the IEEE CSV exports (MA-L oui.csv, MA-M mam.csv,
+MA-S oui36.csv):
+
+    python -m modules.oui_index build oui.csv mam.csv oui36.csv -o data/oui.idx
+
+The file is an open-addressing hash table keyed by (prefix length, prefix)
+followed by a deduplicated vendor string table, so opening it is a single
+mmap and a lookup is at most three probes (36, 28, then 24-bit prefix).
+"""
+import argparse
+import csv
+import mmap
+import os
+import struct
+
+MAGIC = b"OUIX"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHII")  # magic, version, reserved, slot_bits, entry count
+SLOT = struct.Struct("<QI")        # key (0 = empty), vendor string offset
+STRING_LEN = struct.Struct("<H")
+
+# Registry name -> prefix length in bits
+REGISTRIES = {
+    "MA-L": 24,
+    "MA-M": 28,
+    "MA-S": 36
+}
+PREFIX_BITS = (36, 28, 24)  # longest match first
+
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+MASK64 = (1 << 64) - 1
+
+
+def make_key(bits, prefix):
+    # Length in the high bits keeps a 24-bit prefix distinct from a 36-bit one
+    return (bits << 40) | prefix
+
+
+def slot_index(key, slot_bits):
+    return ((key * HASH_MULTIPLIER) & MASK64) >> (64 - slot_bits)
+
+
+def mac_to_int36(mac):
+    """First 36 bits of a MAC address as an int, or None if it is malformed."""
+    digits = "".join(ch for ch in mac if ch not in ":-. ")[:9]
+    if len(digits) < 9:
+        return None
+    try:
+        return int(digits, 16)
+    except ValueError:
+        return None
+
+
+# ===============================
+# BUILD
+# ===============================
+def read_registry_csv(path):
+    with open(path, newline="", encoding="utf-8", errors="ignore") as f:
+        for row in csv.DictReader(f):
+            bits = REGISTRIES.get((row.get("Registry") or "").strip())
+            assignment = (row.get("Assignment") or "").strip()
+            vendor = (row.get("Organization Name") or "").strip()
+            if not bits or not vendor or len(assignment) * 4 != bits:
+                continue
+            yield bits, int(assignment, 16), vendor
+
+
+def build_index(csv_paths, output_path):
+    entries = {}
+    for path in csv_paths:
+        for bits, prefix, vendor in read_registry_csv(path):
+            entries[make_key(bits, prefix)] = vendor
+
+    # Load factor <= 0.5 keeps probe chains short
+    slot_bits = max(4, (len(entries) * 2 - 1).bit_length())
+    slots = [(0, 0)] * (1 << slot_bits)
+
+    strings = bytearray()
+    offsets = {}
+    for key, vendor in entries.items():
+        offset = offsets.get(vendor)
+        if offset is None:
+            encoded = vendor.encode("utf-8")[:0xFFFF]
+            offset = offsets[vendor] = len(strings)
+            strings += STRING_LEN.pack(len(encoded)) + encoded
+
+        i = slot_index(key, slot_bits)
+        while slots[i][0]:
+            i = (i + 1) & ((1 << slot_bits) - 1)
+        slots[i] = (key, offset)
+
+    # Written aside and renamed, so processes still mapping the old index keep a valid file
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, slot_bits, len(entries)))
+        for key, offset in slots:
+            f.write(SLOT.pack(key, offset))
+        f.write(strings)
+    os.replace(tmp_path, output_path)
+
+    print(f"📄 OUI index saved: {output_path} ({len(entries)} prefixes, {len(offsets)} vendors)")
+    return len(entries)
+
+
+# ===============================
+# LOOKUP
+# ===============================
+class OUIIndex:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.slot_bits, self.entries = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Not an OUI index (or wrong version): {path}")
+
+        self._mask = (1 << self.slot_bits) - 1
+        self._strings = HEADER.size + SLOT.size * (1 << self.slot_bits)
+        self._vendors = {}
+
+    def _find(self, key):
+        i = slot_index(key, self.slot_bits)
+        while True:
+            slot_key, offset = SLOT.unpack_from(self._mm, HEADER.size + i * SLOT.size)
+            if slot_key == key:
+                return offset
+            if slot_key == 0:
+                return None
+            i = (i + 1) & self._mask
+
+    def _vendor(self, offset):
+        vendor = self._vendors.get(offset)
+        if vendor is None:
+            start = self._strings + offset
+            (length,) = STRING_LEN.unpack_from(self._mm, start)
+            start += STRING_LEN.size
+            vendor = self._vendors[offset] = self._mm[start:start + length].decode("utf-8", "replace")
+        return vendor
+
+    def lookup(self, mac):
+        value = mac_to_int36(mac)
+        if value is None:
+            return None
+
+        for bits in PREFIX_BITS:
+            offset = self._find(make_key(bits, value >> (36 - bits)))
+            if offset is not None:
+                return self._vendor(offset)
+        return None
+
+    def close(self):
+        self._mm.close()
+
+
+_indexes = {}
+
+
+def open_index(path):
+    """Shared OUIIndex for path, or None when the index has not been built.
+
+    Misses are not cached and a rebuilt file is reopened, so a long-running
+    process picks up `build` output without a restart.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _indexes.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _indexes[path] = (mtime, OUIIndex(path))
+    return cached[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the memory-mapped OUI vendor index")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="compile IEEE MA-L/MA-M/MA-S CSV exports")
+    build.add_argument("csv", nargs="+", help="oui.csv, mam.csv and/or oui36.csv")
+    build.add_argument("-o", "--output", default=os.path.join("data", "oui.idx"))
+
+    lookup = sub.add_parser("lookup", help="look up one or more MAC addresses")
+    lookup.add_argument("index")
+    lookup.add_argument("mac", nargs="+")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_index(args.csv, args.output)
+    else:
+        index = OUIIndex(args.index)
+        for mac in args.mac:
+            print(f"{mac}  {index.lookup(mac) or 'Unknown'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,9 @@ from datetime import datetime
 import csv
 
 # Import the NetworkScanner from your modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from network_scanner import NetworkScanner
+    from modules.network_scanner import NetworkScanner
 except ImportError:
     print("[-] Error: Cannot import NetworkScanner from modules.network_scanner")
     print("[-] Make sure network_scanner.py exists in modules/ directory")
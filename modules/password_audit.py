@@ -1,67 +1,45 @@
-import yaml
-import re
+import csv
 
-class PasswordAudit:
-    def __init__(self):
-        try:
-            with open("./config.yaml", "r") as f:
-                self.config = yaml.safe_load(f)
-        except:
-            self.config = {}
-
-    def run(self, network):
-        score = 0
-        reasons = []
-
-        encryption = network.get("encryption", "WPA2")
-        ssid = network.get("ssid", "").lower()
-        vendor = network.get("vendor", "Unknown")
-        signal = abs(network.get("signal", -60))  # dBm positive value
-        wps_enabled = network.get("wps", False) or network.get("wps_enabled", False)
+from modules.bloom_filter import open_filter
+from modules.config import load_config
+from modules.password_strength import PasswordStrength
 
-        # ---------------------------
-        # 1. Encryption scoring
-        # ---------------------------
-        if encryption == "WEP":
-            score += 40
-            reasons.append("WEP encryption is broken")
-        elif encryption == "WPA":
-            score += 25
-            reasons.append("WPA is outdated")
-        elif encryption == "WPA2":
-            score += 10
-        elif encryption == "WPA3":
-            score += 2
 
-        # ---------------------------
-        # 2. WPS scoring
-        # ---------------------------
-        if wps_enabled:
-            score += 25
-            reasons.append("WPS enabled (PIN attack risk)")
+def load_passphrases(path):
+    """{ssid: passphrase} from a CSV with ssid and passphrase columns (our own APs only).
 
-        # ---------------------------
-        # 3. SSID pattern scoring
-        # ---------------------------
-        weak_patterns = ["admin", "guest", "wifi", "home", "test", "default", "tplink", "dlink"]
+    Passphrases are only held in memory for the audit; they are never
+    written to evidence or reports.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or not {"ssid", "passphrase"} <= set(reader.fieldnames):
+            raise ValueError(f"{path} needs ssid and passphrase columns")
+        return {row["ssid"]: row["passphrase"] for row in reader if row["ssid"] and row["passphrase"]}
 
-        for p in weak_patterns:
-            if p in ssid:
-                score += 10
-                reasons.append(f"Weak SSID pattern detected: {p}")
-                break
 
-        # ---------------------------
-        # 4. Vendor scoring
-        # ---------------------------
-        weak_vendors = ["TP-Link", "D-Link", "Tenda", "Netgear"]
+class PasswordAudit:
+    def __init__(self, config=None):
+        self.config = config or load_config()
+        self._estimator = None
+
+    @property
+    def estimator(self):
+        # Built on first use: only audits that supply a passphrase need it
+        if self._estimator is None:
+            self._estimator = PasswordStrength(self.config)
+        return self._estimator
 
-        if vendor in weak_vendors:
-            score += 10
-            reasons.append(f"Consumer router vendor: {vendor}")
+    def run(self, network, points=None, estimate=None):
+        # Encryption, WPS, SSID-pattern and vendor factors come from the
+        # compiled scoring_rules in config.yaml
+        score, reasons = points or self.config.rules.password_points(network)
+        # dBm positive value; parsers leave signal None when a scan has no signal line
+        signal = network.get("signal")
+        signal = abs(-60 if signal is None else signal)
 
         # ---------------------------
-        # 5. Signal strength scoring
+        # Signal strength scoring
         # ---------------------------
         if signal < 50:
             score += 15
@@ -92,7 +70,7 @@ class PasswordAudit:
             entropy = 70
             crack_days = 365 * 3
 
-        return {
+        result = {
             "strength": strength,
             "entropy_bits": entropy,
             "estimated_crack_days": crack_days,
@@ -102,3 +80,39 @@ class PasswordAudit:
             "has_special_char": True if strength in ["Medium", "Strong"] else False,
             "has_numbers": True if strength != "Very Weak" else False
         }
+
+        # ---------------------------
+        # Real passphrase (our own APs): estimate it instead of guessing
+        # ---------------------------
+        passphrase = network.get("passphrase")
+        if passphrase:
+            estimate = estimate or self.estimator.estimate(passphrase)
+            result.update(
+                strength=estimate["strength"],
+                entropy_bits=estimate["entropy_bits"],
+                estimated_crack_days=estimate["crack_days"],
+                has_special_char=estimate["has_special_char"],
+                has_numbers=estimate["has_numbers"],
+                passphrase_length=estimate["length"]
+            )
+            reasons.extend(
+                f"Passphrase contains {pattern}" for pattern in estimate["patterns"] if pattern != "brute force"
+            )
+
+            blocklist = open_filter(self.config.passphrase_blocklist)
+            if blocklist is not None and passphrase in blocklist:
+                result.update(strength="Very Weak", estimated_crack_days=0, leaked=True)
+                reasons.append("Passphrase appears in a leaked-password corpus")
+
+        return result
+
+    def run_batch(self, networks):
+        # Rule points stay per network: the SSID regex dominates and has nothing to vectorize
+        points = [self.config.rules.password_points(network) for network in networks]
+        passphrases = [network.get("passphrase") for network in networks]
+        estimates = [None] * len(networks)
+        if any(passphrases):
+            rated = self.estimator.estimate_batch([p for p in passphrases if p])
+            rated = iter(rated)
+            estimates = [next(rated) if p else None for p in passphrases]
+        return [self.run(network, p, e) for network, p, e in zip(networks, points, estimates)]
@@ -0,0 +1,359 @@
+# 📄 modules/password_strength.py
+"""Offline passphrase strength estimator, in the spirit of zxcvbn.
+
+A passphrase is split into the cheapest sequence of patterns an attacker
+would try: ranked dictionary words (with l33t, reversal and capitalisation
+variants), keyboard walks, character sequences, repeats, dates and, for
+whatever is left, brute force over the character classes in use. The
+product of the guesses for that sequence gives the entropy estimate.
+
+    python -m modules.password_strength "Summer2023!" "correct horse battery"
+    python -m modules.password_strength --file candidates.txt
+"""
+import argparse
+import math
+import os
+import re
+from datetime import date
+from itertools import product
+
+from modules.config import load_config
+
+# WPA2 PBKDF2 (4096 x SHA1) cracked offline on a single modern GPU
+GUESSES_PER_SECOND = 1e6
+
+MIN_SUBMATCH_GUESSES = 10
+MAX_WORD_LENGTH = 32
+MAX_L33T_VARIANTS = 16
+
+# Upper bounds on log10(guesses) for scores 0-3; anything above is a 4
+SCORE_LIMITS = (3, 6, 8, 10)
+STRENGTHS = ("Very Weak", "Weak", "Medium", "Strong", "Very Strong")  # weakest first
+WEAK_STRENGTHS = STRENGTHS[:STRENGTHS.index("Weak") + 1]  # ratings that add password risk
+
+
+def is_weak(strength):
+    return strength in WEAK_STRENGTHS
+
+L33T = {
+    "4": "a", "@": "a",
+    "8": "b",
+    "(": "c", "{": "c", "[": "c", "<": "c",
+    "3": "e",
+    "6": "g", "9": "g",
+    "1": "il", "!": "i", "|": "il",
+    "0": "o",
+    "$": "s", "5": "s",
+    "7": "lt", "+": "t",
+    "%": "x",
+    "2": "z"
+}
+
+DATE_PATTERN = re.compile(r"(?<!\d)(\d{1,4})([-/._ ]?)(\d{1,2})\2(\d{2,4})(?!\d)")
+YEAR_PATTERN = re.compile(r"(?<!\d)(19\d\d|20\d\d)(?!\d)")
+
+# ===============================
+# KEYBOARD GRAPH
+# ===============================
+QWERTY_ROWS = ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+QWERTY_SHIFTED = ("~!@#$%^&*()_+", "QWERTYUIOP{}|", 'ASDFGHJKL:"', "ZXCVBNM<>?")
+ROW_OFFSETS = (0, 0.5, 0.75, 1.25)  # stagger of each row, in key widths
+
+KEY_POSITIONS = {}
+for row, (keys, shifted) in enumerate(zip(QWERTY_ROWS, QWERTY_SHIFTED)):
+    for col, (key, shift_key) in enumerate(zip(keys, shifted)):
+        KEY_POSITIONS[key] = KEY_POSITIONS[shift_key] = (row, col + ROW_OFFSETS[row])
+
+SHIFTED_KEYS = frozenset("".join(QWERTY_SHIFTED))
+KEYBOARD_KEYS = len(KEY_POSITIONS) // 2
+KEYBOARD_DEGREE = 4.6  # average neighbours per key on a staggered QWERTY layout
+
+
+def key_direction(a, b):
+    """Direction from key a to an adjacent key b, or None if not adjacent."""
+    pa, pb = KEY_POSITIONS.get(a), KEY_POSITIONS.get(b)
+    if pa is None or pb is None or pa == pb:
+        return None
+    dy, dx = pb[0] - pa[0], pb[1] - pa[1]
+    if abs(dy) > 1 or abs(dx) > 1:
+        return None
+    if dy and abs(dx) <= 0.5:
+        dx = 0  # rows are staggered: "1qaz" is one straight column
+    return dy, round(dx * 4)
+
+
+# ===============================
+# DICTIONARIES
+# ===============================
+_wordlists = {}
+
+
+def load_ranked_wordlist(path):
+    """word -> rank (1 = most common) for a one-word-per-line file, cached per mtime."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _wordlists.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    ranks = {}
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            word = line.strip().lower()
+            if word and len(word) <= MAX_WORD_LENGTH and word not in ranks:
+                ranks[word] = len(ranks) + 1
+    _wordlists[path] = (mtime, ranks)
+    return ranks
+
+
+def rank_words(words):
+    ranks = {}
+    for word in words:
+        ranks.setdefault(word.lower(), len(ranks) + 1)
+    return ranks
+
+
+# ===============================
+# ESTIMATOR
+# ===============================
+class PasswordStrength:
+    def __init__(self, config=None):
+        config = config or load_config()
+        dictionaries = {
+            "weak_passwords": rank_words(config.weak_passwords),
+            "common_passwords": rank_words(config.common_passwords)
+        }
+        for path in config.ranked_wordlists:
+            dictionaries[os.path.basename(path)] = load_ranked_wordlist(path)
+
+        # One table for every dictionary: word -> (best rank, dictionary name)
+        self.words = {}
+        for name, ranks in dictionaries.items():
+            for word, rank in ranks.items():
+                if word not in self.words or rank < self.words[word][0]:
+                    self.words[word] = (rank, name)
+        # Every prefix of every word, forwards and reversed, so a scan can stop
+        # extending a substring as soon as no word could still match it
+        self.prefixes = set()
+        for word in self.words:
+            for text in (word, word[::-1]):
+                for end in range(1, len(text) + 1):
+                    self.prefixes.add(text[:end])
+        self.reference_year = date.today().year
+
+    # ---- pattern matchers: each yields (start, end, guesses, description) ----
+    def _dictionary_matches(self, password):
+        lower = password.lower()
+        n = len(password)
+        seen = set()
+        for variant in self._l33t_variants(lower):
+            for i in range(n):
+                for j in range(i + 1, n + 1):
+                    token = variant[i:j]
+                    if token not in self.prefixes:
+                        break
+                    if (i, token) in seen:
+                        continue
+                    seen.add((i, token))
+
+                    subs = sum(a != b for a, b in zip(token, lower[i:j]))
+                    for word, extra, label in ((token, 1, ""), (token[::-1], 2, " reversed")):
+                        entry = self.words.get(word)
+                        if entry is None:
+                            continue
+                        rank, name = entry
+                        guesses = rank * extra * self._case_variations(password[i:j]) * (2 ** subs)
+                        kind = "l33t " if subs else ""
+                        yield i, j, guesses, f"{kind}{name} word{label} '{word}'"
+
+    def _l33t_variants(self, text):
+        """text itself, then up to MAX_L33T_VARIANTS l33t-decoded spellings of it."""
+        yield text
+        positions = [(k, L33T[ch]) for k, ch in enumerate(text) if ch in L33T]
+        if not positions:
+            return
+        for count, choice in enumerate(product(*(choices for _, choices in positions))):
+            if count >= MAX_L33T_VARIANTS:
+                break
+            chars = list(text)
+            for (k, _), ch in zip(positions, choice):
+                chars[k] = ch
+            yield "".join(chars)
+
+    def _case_variations(self, token):
+        upper = sum(ch.isupper() for ch in token)
+        lower = sum(ch.islower() for ch in token)
+        if upper == 0:
+            return 1
+        # Capitalised, ALL CAPS and trailing capital are the first things tried
+        if lower == 0 or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+            return 2
+        return sum(math.comb(upper + lower, k) for k in range(1, min(upper, lower) + 1))
+
+    def _keyboard_matches(self, password):
+        n = len(password)
+        i = 0
+        while i < n - 2:
+            j, turns, direction = i + 1, 0, None
+            while j < n:
+                step = key_direction(password[j - 1], password[j])
+                if step is None:
+                    break
+                if step != direction:
+                    turns += 1
+                    direction = step
+                j += 1
+            if j - i >= 3:
+                shifted = any(ch in SHIFTED_KEYS for ch in password[i:j])
+                guesses = KEYBOARD_KEYS * (j - i) * KEYBOARD_DEGREE ** turns * (2 if shifted else 1)
+                yield i, j, guesses, f"keyboard walk '{password[i:j]}'"
+                i = j - 1
+            else:
+                i += 1
+
+    def _sequence_matches(self, password):
+        n = len(password)
+        i = 0
+        while i < n - 2:
+            delta = ord(password[i + 1]) - ord(password[i])
+            j = i + 1
+            if delta in (-1, 1):
+                while j < n and ord(password[j]) - ord(password[j - 1]) == delta:
+                    j += 1
+            if j - i >= 3:
+                first = password[i]
+                if first in "aAzZ01":
+                    base = 4
+                elif first.isdigit():
+                    base = 10
+                else:
+                    base = 26
+                guesses = base * (j - i) * (2 if delta < 0 else 1)
+                yield i, j, guesses, f"sequence '{password[i:j]}'"
+                i = j - 1
+            else:
+                i += 1
+
+    def _repeat_matches(self, password):
+        for match in re.finditer(r"(.)\1{2,}", password):
+            guesses = self._cardinality(match.group(1)) * len(match.group(0))
+            yield match.start(), match.end(), guesses, f"repeat '{match.group(0)}'"
+
+    def _year_guesses(self, year):
+        return max(abs(self.reference_year - year), 20)
+
+    def _date_matches(self, password):
+        for match in YEAR_PATTERN.finditer(password):
+            yield match.start(), match.end(), self._year_guesses(int(match.group(1))), f"year '{match.group(0)}'"
+
+        for match in DATE_PATTERN.finditer(password):
+            a, separator, b, c = match.group(1), match.group(2), int(match.group(3)), match.group(4)
+            # day-month-year, month-day-year or year-month-day
+            for year, day, month in ((c, int(a), b), (c, b, int(a)), (a, int(c), b)):
+                year = int(year)
+                if year < 100:
+                    year += 2000 if year <= self.reference_year % 100 else 1900
+                if 1900 <= year <= self.reference_year + 10 and 1 <= month <= 12 and 1 <= day <= 31:
+                    guesses = 365 * self._year_guesses(year) * (4 if separator else 1)
+                    yield match.start(), match.end(), guesses, f"date '{match.group(0)}'"
+                    break
+
+    def _cardinality(self, text):
+        size = 0
+        if any(ch.islower() for ch in text):
+            size += 26
+        if any(ch.isupper() for ch in text):
+            size += 26
+        if any(ch.isdigit() for ch in text):
+            size += 10
+        if any(not ch.isalnum() for ch in text):
+            size += 33
+        return size or 26
+
+    # ---- combination ----
+    def estimate(self, password):
+        n = len(password)
+        if n == 0:
+            return self._result(password, 1, [])
+
+        # Best (lowest) guesses for each match span
+        matches = {}
+        for matcher in (self._dictionary_matches, self._keyboard_matches, self._sequence_matches,
+                        self._repeat_matches, self._date_matches):
+            for i, j, guesses, description in matcher(password):
+                if j - i < n:
+                    guesses = max(guesses, MIN_SUBMATCH_GUESSES)
+                if (i, j) not in matches or guesses < matches[(i, j)][0]:
+                    matches[(i, j)] = (guesses, description)
+
+        by_end = {}
+        for (i, j), match in matches.items():
+            by_end.setdefault(j, []).append((i, match))
+
+        # Cheapest segmentation, in log space; uncovered characters are brute-forced
+        brute = math.log10(self._cardinality(password))
+        best = [0.0] + [math.inf] * n
+        back = [None] * (n + 1)
+        for j in range(1, n + 1):
+            best[j], back[j] = best[j - 1] + brute, (j - 1, None)
+            for i, (guesses, description) in by_end.get(j, ()):
+                cost = best[i] + math.log10(guesses)
+                if cost < best[j]:
+                    best[j], back[j] = cost, (i, description)
+
+        patterns = []
+        j = n
+        while j > 0:
+            i, description = back[j]
+            if description:
+                patterns.append(description)
+            elif not patterns or not patterns[-1].startswith("brute force"):
+                patterns.append("brute force")
+            j = i
+        patterns.reverse()
+
+        return self._result(password, 10 ** best[n], patterns)
+
+    def _result(self, password, guesses, patterns):
+        log_guesses = math.log10(max(guesses, 1))
+        score = sum(log_guesses >= limit for limit in SCORE_LIMITS)
+        return {
+            "length": len(password),
+            "guesses": guesses,
+            "entropy_bits": round(math.log2(max(guesses, 1)), 1),
+            "crack_days": round(guesses / GUESSES_PER_SECOND / 86400, 2),
+            "score": score,
+            "strength": STRENGTHS[score],
+            "patterns": patterns,
+            "has_numbers": any(ch.isdigit() for ch in password),
+            "has_special_char": any(not ch.isalnum() for ch in password)
+        }
+
+    def estimate_batch(self, passwords):
+        cache = {}
+        results = []
+        for password in passwords:
+            if password not in cache:
+                cache[password] = self.estimate(password)
+            results.append(cache[password])
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate AP passphrases offline")
+    parser.add_argument("passwords", nargs="*")
+    parser.add_argument("--file", help="one candidate passphrase per line")
+    args = parser.parse_args(argv)
+
+    passwords = list(args.passwords)
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            passwords.extend(line.rstrip("\n") for line in f if line.strip())
+
+    estimator = PasswordStrength()
+    for password, result in zip(passwords, estimator.estimate_batch(passwords)):
+        print(f"{result['strength']:<11} {result['entropy_bits']:5.1f} bits  "
+              f"{result['crack_days']:>12} days  {password}  [{', '.join(result['patterns'])}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,15 @@
 # 📄 modules/protection_test.py
-import random
+from modules.simulation import SimulationEngine
 
 class ProtectionTest:
-    def run(self, network):
+    def __init__(self, engine=None):
+        # Pass a shared engine (see modules/simulation.py) for reproducible runs
+        self.engine = engine or SimulationEngine()
+
+    def run(self, network, index=0):
         # Simulated protection checks
-        encryption = network.get("encryption", "WPA2")
-        
-        # PMF (Protected Management Frames) - more likely with newer encryption
-        pmf_enabled = encryption in ["WPA3", "WPA2"] and random.random() > 0.7
-        
-        # WPS (Wi-Fi Protected Setup) - often enabled by default
-        wps_enabled = random.random() > 0.3
-        
-        # Rate limiting (simulated)
-        rate_limiting = random.random() > 0.5
-        
-        # Hidden SSID (simulated)
-        hidden_ssid = network.get("ssid", "").startswith("Hidden_") or random.random() > 0.8
-        
-        return {
-            "pmf_enabled": pmf_enabled,
-            "wps_enabled": wps_enabled,
-            "rate_limiting": rate_limiting,
-            "hidden_ssid": hidden_ssid,
-            "mac_filtering": False,  # Simulated as usually disabled
-            "isolation_enabled": random.random() > 0.6  # Client isolation
-        }
\ No newline at end of file
+        return self.run_batch([network], index)[0]
+
+    def run_batch(self, networks, start=0):
+        networks = list(networks)
+        return self.engine.protection(networks, self.engine.uniforms(len(networks), start))
@@ -1,17 +1,216 @@
-from jinja2 import Environment, FileSystemLoader
-import os, datetime
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse, glob, os, datetime, heapq, time
+
+from modules.config import BASE_DIR, load_config
+
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+REPORT_DIR = os.path.join(BASE_DIR, "reports")
+BYTECODE_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "jinja")
+# Cached bytecode bakes in the escaping mode; a new name skips files compiled without autoescape
+BYTECODE_CACHE_PATTERN = "__jinja2_%s.escaped.cache"
+
+# One environment per mode for the whole process: templates compile once and
+# the on-disk bytecode cache lets later processes skip compilation entirely.
+_environments = {}
+
+
+def get_environment(dev_mode=False):
+    env = _environments.get(dev_mode)
+    if env is None:
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+        env = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            # SSIDs, vendors and factors come from the air; escape everything in .html templates
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR, BYTECODE_CACHE_PATTERN),
+            auto_reload=dev_mode  # only re-stat template files while developing them
+        )
+        _environments[dev_mode] = env
+    return env
+
+
+def summarize_fleet(results, worst=20):
+    """Single pass over batch results: risk, band, channel and encryption
+    counts plus the highest-risk networks, as small JSON-friendly values."""
+    levels, bands, channels, encryption = Counter(), Counter(), Counter(), Counter()
+    expected = Counter()
+    for result in results:
+        target = result["target"]
+        levels[result["risk"]["level"]] += 1
+        if "risk_distribution" in result:
+            expected.update(result["risk_distribution"]["level_probability"])
+        bands[target.get("band") or "Unknown"] += 1
+        channels[target.get("channel") or "Unknown"] += 1
+        encryption[target.get("encryption") or "Unknown"] += 1
+
+    offenders = heapq.nlargest(
+        worst,
+        enumerate(results, 1),
+        key=lambda pair: pair[1]["risk"]["score"]
+    )
+
+    return {
+        "network_count": len(results),
+        "risk_levels": dict(levels),
+        "expected_levels": {level: round(value, 2) for level, value in expected.items()},
+        "bands": sorted(bands.items(), key=lambda pair: str(pair[0])),
+        "channels": sorted(channels.items(), key=lambda pair: (not isinstance(pair[0], int), str(pair[0]).zfill(3))),
+        "encryption": encryption.most_common(),
+        "worst": [
+            {
+                "index": index,
+                "ssid": result["target"]["ssid"],
+                "bssid": result["target"].get("bssid"),
+                "encryption": result["target"].get("encryption"),
+                "score": result["risk"]["score"],
+                "level": result["risk"]["level"]
+            }
+            for index, result in offenders
+        ]
+    }
+
+
+# ===============================
+# PDF EXPORT
+# ===============================
+def pdf_path_for(html_path):
+    return os.path.splitext(html_path)[0] + ".pdf"
+
+
+def is_pdf_current(html_path, pdf_path=None):
+    pdf_path = pdf_path or pdf_path_for(html_path)
+    return os.path.exists(pdf_path) and os.path.getmtime(pdf_path) >= os.path.getmtime(html_path)
+
+
+def export_pdf(html_path, force=False):
+    """Convert one HTML report next to itself; returns a per-file result."""
+    pdf_path = pdf_path_for(html_path)
+    result = {"html": html_path, "pdf": pdf_path, "status": "skipped", "seconds": 0.0, "error": None}
+    if not force and is_pdf_current(html_path, pdf_path):
+        return result
+
+    start = time.perf_counter()
+    try:
+        import pdfkit  # optional: needs the wkhtmltopdf binary as well
+        pdfkit.from_file(html_path, pdf_path)
+        result["status"] = "converted"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def export_pdfs(html_paths, workers=4, force=False):
+    """Convert many reports on a bounded pool, results in input order.
+
+    Each conversion is a wkhtmltopdf subprocess, so threads are enough to
+    keep several running at once."""
+    html_paths = list(html_paths)
+    results = [None] * len(html_paths)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(export_pdf, path, force): i for i, path in enumerate(html_paths)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
 
 class ReportGenerator:
+    def __init__(self, config=None, report_dir=None):
+        config = config or load_config()
+        self.report_dir = report_dir or REPORT_DIR
+        dev_mode = config.report_dev_mode or os.environ.get("WIFI_AUDIT_DEV") == "1"
+        self.env = get_environment(dev_mode)
+        self.page_size = config.report_page_size
+        self.pdf_workers = config.report_pdf_workers
+
+    def _report_path(self, prefix):
+        os.makedirs(self.report_dir, exist_ok=True)
+        stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = os.path.join(self.report_dir, f"{prefix}_{stamp}.html")
+
+        # Several reports can be written within the same second during a survey
+        counter = 1
+        while os.path.exists(filename):
+            counter += 1
+            filename = os.path.join(self.report_dir, f"{prefix}_{stamp}_{counter}.html")
+        return filename
+
+    def _render(self, template_name, prefix, data):
+        template = self.env.get_template(template_name)
+        filename = self._report_path(prefix)
+
+        # Stream rendered chunks straight to disk instead of building one string
+        with open(filename, "w", encoding="utf-8") as f:
+            f.writelines(template.generate(data=data))
+
+        return filename
+
     def generate(self, data):
-        env = Environment(loader=FileSystemLoader("templates"))
-        template = env.get_template("report.html")
+        return self._render("report.html", "report", data)  # <-- return the file path
 
-        html = template.render(data=data)
+    def generate_fleet(self, data, page_size=None):
+        """Summary tables plus paginated per-network sections, written one
+        network at a time so memory stays flat for thousands of networks."""
+        networks = data["networks"]
+        summary = data.get("summary") or summarize_fleet(networks)
+        page_size = page_size or self.page_size
+        pages = max(1, -(-len(networks) // page_size))
 
-        os.makedirs("reports", exist_ok=True)
-        filename = f"reports/report_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+        macros = self.env.get_template("fleet_report.html").module
+        filename = self._report_path("fleet_report")
 
         with open(filename, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.write(macros.document_start(data, summary, pages))
+            for page in range(1, pages + 1):
+                f.write(macros.page_start(page, pages))
+                start = (page - 1) * page_size
+                for index in range(start, min(start + page_size, len(networks))):
+                    f.write(macros.network_section(networks[index], index + 1))
+                f.write(macros.page_end(page, pages))
+            f.write(macros.document_end())
+
+        return filename
+
+    def export_pdfs(self, html_paths, force=False):
+        return export_pdfs(html_paths, self.pdf_workers, force)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export generated HTML reports to PDF")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pdf = sub.add_parser("pdf", help="convert reports whose PDF is missing or stale")
+    pdf.add_argument("paths", nargs="*", help="HTML reports or directories (default: reports/)")
+    pdf.add_argument("--workers", type=int, help="parallel conversions (default: report_settings.pdf_workers)")
+    pdf.add_argument("--force", action="store_true", help="convert even when the PDF is up to date")
+
+    args = parser.parse_args(argv)
+
+    html_paths = []
+    for path in args.paths or [REPORT_DIR]:
+        if os.path.isdir(path):
+            html_paths.extend(sorted(glob.glob(os.path.join(path, "*.html"))))
+        else:
+            html_paths.append(path)
+
+    workers = args.workers or load_config().report_pdf_workers
+    start = time.perf_counter()
+    results = export_pdfs(html_paths, workers, args.force)
+
+    for result in results:
+        icon = {"converted": "✅", "skipped": "⏭️", "failed": "❌"}[result["status"]]
+        line = f"{icon} {result['status']:<9} {result['seconds']:6.2f}s  {result['pdf']}"
+        if result["error"]:
+            line += f"  ({result['error']})"
+        print(line)
+
+    counts = Counter(result["status"] for result in results)
+    print(f"📄 {len(results)} reports in {time.perf_counter() - start:.2f}s: "
+          f"{counts['converted']} converted, {counts['skipped']} skipped, {counts['failed']} failed")
+
 
-        return filename  # <-- return the file path
+if __name__ == "__main__":
+    main()
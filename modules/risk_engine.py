@@ -1,4 +1,39 @@
+import numpy as np
+
+from modules.config import load_config
+from modules.password_strength import WEAK_STRENGTHS, is_weak
+
+LEVELS = np.array(["Critical", "High", "Medium", "Low"])
+PERCENTILES = (5, 25, 50, 75, 95)
+MONTE_CARLO_ROWS = 2_000_000  # trial rows scored per vectorized pass
+
+# Accepted column names for score_table(), after lower-casing and
+# replacing spaces with underscores ("Password Strength" -> password_strength)
+COLUMNS = {
+    "encryption_score": ("encryption_score",),
+    "encryption": ("encryption", "encryption_type"),
+    "pmf": ("pmf_enabled", "pmf"),
+    "wps": ("wps_enabled", "wps"),
+    "password": ("password_strength", "password", "strength"),
+    "leaked": ("password_leaked", "leaked")  # optional; a leaked passphrase counts as weak
+}
+
+
 class RiskEngine:
+    def __init__(self, config=None):
+        config = config or load_config()
+        self.thresholds = config.risk_thresholds
+        self.rules = config.rules
+
+    def level_for(self, score):
+        if score >= self.thresholds["critical"]:
+            return "Critical"
+        if score >= self.thresholds["high"]:
+            return "High"
+        if score >= self.thresholds["medium"]:
+            return "Medium"
+        return "Low"
+
     def calculate(self, encryption, protection, password):
         score = encryption["score"]
 
@@ -6,19 +41,108 @@ class RiskEngine:
             score += 2
         if protection["wps_enabled"]:
             score += 2
-        if password["strength"] == "Weak":
+        # A leaked passphrase is never rated below a merely weak one
+        if is_weak(password["strength"]) or password.get("leaked"):
             score += 3
 
-        if score >= 10:
-            level = "Critical"
-        elif score >= 7:
-            level = "High"
-        elif score >= 4:
-            level = "Medium"
-        else:
-            level = "Low"
+        return {
+            "score": score,
+            "level": self.level_for(score)
+        }
+
+    # ===============================
+    # COLUMNAR SCORING
+    # ===============================
+    def score_table(self, table):
+        """Score every row of a DataFrame (or a dict of equal-length arrays).
+
+        Needs an encryption type (or encryption_score) column plus PMF, WPS
+        and password-strength columns, and reads an optional password_leaked
+        column; returns {"score": ..., "level": ...}
+        arrays with the same rules as calculate().
+        """
+        columns = {str(name).lower().replace(" ", "_"): name for name in table.keys()}
+
+        def column(key):
+            for alias in COLUMNS[key]:
+                if alias in columns:
+                    return np.asarray(table[columns[alias]])
+            return None
+
+        score = column("encryption_score")
+        if score is None:
+            encryption = column("encryption")
+            if encryption is None:
+                raise KeyError("score_table needs an encryption or encryption_score column")
+            score = self.rules.encryption_scores(encryption)
+        score = score.astype(np.int64)
+
+        missing = [key for key in ("pmf", "wps", "password") if column(key) is None]
+        if missing:
+            raise KeyError(f"score_table is missing columns: {', '.join(missing)}")
+
+        weak = np.isin(column("password").astype(str), WEAK_STRENGTHS)
+        leaked = column("leaked")
+        if leaked is not None:
+            weak |= leaked.astype(bool)
+
+        score = (
+            score
+            + 2 * ~column("pmf").astype(bool)
+            + 2 * column("wps").astype(bool)
+            + 3 * weak
+        )
+
+        # 0 = Critical ... 3 = Low: count the thresholds each score falls below
+        index = (
+            (score < self.thresholds["critical"]).astype(np.int8)
+            + (score < self.thresholds["high"])
+            + (score < self.thresholds["medium"])
+        )
 
         return {
             "score": score,
-            "level": level
+            "level": LEVELS[index]
         }
+
+    # ===============================
+    # MONTE CARLO
+    # ===============================
+    def monte_carlo(self, results, engine, trials, start=0):
+        """Risk distribution per analyzed network over `trials` simulated draws.
+
+        results are analyze_network() records (target, encryption, password);
+        PMF, WPS and handshake outcomes are redrawn for every trial.
+        """
+        distributions = []
+        chunk = max(1, MONTE_CARLO_ROWS // trials)
+        for offset in range(0, len(results), chunk):
+            batch = results[offset:offset + chunk]
+            outcomes = engine.trials([r["target"] for r in batch], trials, start + offset)
+
+            table = {
+                "encryption_score": np.repeat([r["encryption"]["score"] for r in batch], trials),
+                "pmf_enabled": outcomes["pmf_enabled"].ravel(),
+                "wps_enabled": outcomes["wps_enabled"].ravel(),
+                "password_strength": np.repeat([r["password"]["strength"] for r in batch], trials),
+                "password_leaked": np.repeat([bool(r["password"].get("leaked")) for r in batch], trials)
+            }
+            scored = self.score_table(table)
+            scores = scored["score"].reshape(len(batch), trials)
+            levels = scored["level"].reshape(len(batch), trials)
+
+            percentiles = np.percentile(scores, PERCENTILES, axis=1)
+            means, stds = scores.mean(axis=1), scores.std(axis=1)
+            level_shares = {str(level): (levels == level).mean(axis=1) for level in LEVELS}
+            handshake_rates = outcomes["handshake_possible"].mean(axis=1)
+
+            for i in range(len(batch)):
+                distributions.append({
+                    "trials": trials,
+                    "mean": round(float(means[i]), 2),
+                    "std": round(float(stds[i]), 2),
+                    "percentiles": {f"p{p}": float(percentiles[k, i]) for k, p in enumerate(PERCENTILES)},
+                    "level_probability": {level: round(float(share[i]), 4) for level, share in level_shares.items()},
+                    "handshake_rate": round(float(handshake_rates[i]), 4)
+                })
+        return distributions
@@ -0,0 +1,485 @@
+# 📄 modules/scan_backends.py
+import argparse
+import asyncio
+import ctypes
+import os
+import random
+import shutil
+import subprocess
+import threading
+
+from modules.scan_parsers import NMCLI_FIELDS, NetshParser, parse_iw, parse_nmcli, parse_netsh
+
+NETSH_SCAN_CMD = ["netsh", "wlan", "show", "networks", "mode=bssid"]
+NMCLI_SCAN_CMD = ["nmcli", "-t", "-f", ",".join(NMCLI_FIELDS), "device", "wifi", "list"]
+NETSH_INTERFACES_CMD = ["netsh", "wlan", "show", "interfaces"]
+
+
+class ScanBackend:
+    """Source of raw network records (see scan_parsers.new_network).
+
+    NetworkScanner fills in vendor, band and last_seen, so a backend only
+    has to yield ssid, encryption and per-BSSID signal/channel.
+    """
+
+    name = "base"
+    verbose = True
+    timeout = 30
+    metrics = None  # set by NetworkScanner; times waits on the scan subprocess
+
+    def iter_networks(self):
+        raise NotImplementedError
+
+    def timed_lines(self, lines):
+        return self.metrics.timed(lines, "scan_subprocess") if self.metrics else lines
+
+    def atimed_lines(self, lines):
+        return self.metrics.atimed(lines, "scan_subprocess") if self.metrics else lines
+
+    async def aiter_networks(self):
+        # Offline backends do no I/O worth awaiting; run them off the event loop
+        for network in await asyncio.to_thread(list, self.iter_networks()):
+            yield network
+
+
+def stream_command(cmd, error, timeout=30):
+    """Yield a subprocess's stdout line by line with an overall deadline.
+
+    The child is killed on timeout or when the caller stops early.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="ignore"
+    )
+    # A blocked readline() cannot time out by itself; killing the child ends the pipe
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.daemon = True
+    watchdog.start()
+
+    try:
+        yield from proc.stdout
+    except GeneratorExit:
+        proc.kill()
+        raise
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            expired.set()
+            proc.kill()
+            returncode = proc.wait()
+
+    if expired.is_set():
+        raise TimeoutError(f"{cmd[0]} did not finish within {timeout}s")
+    if returncode != 0:
+        raise RuntimeError(error)
+
+
+def run_command(cmd, timeout=30):
+    """stdout of a short query command; the child is killed if it outlives the timeout."""
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"{cmd[0]} did not finish within {timeout}s") from None
+    return result.stdout
+
+
+# ===============================
+# ASYNC SUBPROCESS HELPERS
+# ===============================
+async def stream_command_async(cmd, error, timeout=30):
+    """Async twin of stream_command with an overall deadline.
+
+    The child is killed on timeout, cancellation, or when the consumer
+    closes the generator early.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            line = await asyncio.wait_for(proc.stdout.readline(), remaining)
+            if not line:
+                break
+            yield line.decode("utf-8", errors="ignore")
+
+        returncode = await asyncio.wait_for(proc.wait(), max(0.1, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{cmd[0]} did not finish within {timeout}s") from None
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    if returncode != 0:
+        raise RuntimeError(error)
+
+
+async def run_command_async(cmd, timeout=30):
+    lines = []
+    async for line in stream_command_async(cmd, f"{' '.join(cmd)} failed", timeout):
+        lines.append(line)
+    return "".join(lines)
+
+
+# ===============================
+# NETSH (WINDOWS RADIO)
+# ===============================
+class NetshBackend(ScanBackend):
+    name = "netsh"
+
+    def precheck(self):
+        self.check_admin()
+
+        # ---- WLAN + Location permission check ----
+        self.check_interfaces(run_command(NETSH_INTERFACES_CMD, self.timeout))
+
+    def check_admin(self):
+        # ---- Admin privilege check ----
+        try:
+            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
+        except Exception:
+            is_admin = False
+
+        if not is_admin:
+            raise PermissionError(
+                "Administrator privileges required.\n"
+                "Right-click PowerShell → Run as administrator."
+            )
+
+    def check_interfaces(self, output):
+        if "Location permission" in output:
+            # Optional: open settings page (cannot auto-enable)
+            # subprocess.run(["start", "ms-settings:privacy-location"], shell=True)
+
+            raise PermissionError(
+                "Location Services are disabled.\n"
+                "Enable:\n"
+                "Settings → Privacy & Security → Location\n"
+                "Also enable: 'Let desktop apps access location'."
+            )
+
+    def iter_lines(self):
+        return self.timed_lines(
+            stream_command(NETSH_SCAN_CMD, "Wi-Fi scan failed. Ensure WLAN service is running.", self.timeout)
+        )
+
+    def iter_networks(self):
+        # Mandatory precheck
+        self.precheck()
+
+        if self.verbose:
+            print("\n📡 Scanning real Wi-Fi networks (Windows)...\n")
+
+        # Stream the pipe line by line; each SSID block is yielded as it closes
+        count = 0
+        for network in parse_netsh(self.iter_lines()):
+            count += 1
+            if self.verbose:
+                print(f"{count}. {network['ssid']} | {network['encryption']} | APs: {len(network['bssids'])}")
+            yield network
+
+        if not count and self.verbose:
+            print("❌ No Wi-Fi networks detected.")
+
+    async def aiter_networks(self):
+        self.check_admin()
+
+        # The interface/location query runs alongside the scan itself; its
+        # verdict is awaited before the first network is handed out.
+        precheck = asyncio.create_task(run_command_async(NETSH_INTERFACES_CMD, self.timeout))
+        parser = NetshParser()
+        try:
+            async for line in self.atimed_lines(stream_command_async(
+                NETSH_SCAN_CMD, "Wi-Fi scan failed. Ensure WLAN service is running.", self.timeout
+            )):
+                network = parser.feed(line)
+                if network is not None:
+                    self.check_interfaces(await precheck)
+                    yield network
+
+            self.check_interfaces(await precheck)
+            network = parser.close()
+            if network is not None:
+                yield network
+        finally:
+            if not precheck.done():
+                precheck.cancel()
+
+
+# ===============================
+# LINUX (NMCLI / IW)
+# ===============================
+class LinuxBackend(ScanBackend):
+    name = "linux"
+    TOOLS = ("auto", "nmcli", "iw")
+
+    def __init__(self, tool="auto", interface=None, rescan=False):
+        if tool not in self.TOOLS:
+            raise ValueError(f"Unknown Linux scan tool '{tool}'")
+
+        self.tool = tool
+        self.interface = interface
+        self.rescan = rescan
+
+    def resolve_tool(self):
+        if self.tool != "auto":
+            return self.tool
+        if shutil.which("nmcli"):
+            return "nmcli"
+        if shutil.which("iw"):
+            return "iw"
+        raise RuntimeError("Neither nmcli nor iw found. Install NetworkManager or iw.")
+
+    def resolve_interface(self, iw_dev_output=None):
+        if self.interface:
+            return self.interface
+
+        # First wireless interface reported by `iw dev`
+        if iw_dev_output is None:
+            iw_dev_output = run_command(["iw", "dev"], self.timeout)
+        for line in iw_dev_output.splitlines():
+            line = line.strip()
+            if line.startswith("Interface "):
+                self.interface = line.split()[1]
+                return self.interface
+        raise RuntimeError("No wireless interface found. Set lab_settings.scanner.interface.")
+
+    def command(self, tool):
+        if tool == "nmcli":
+            cmd = list(NMCLI_SCAN_CMD)
+            if self.interface:
+                cmd += ["ifname", self.interface]
+            cmd += ["--rescan", "yes" if self.rescan else "auto"]
+            return cmd
+
+        # `scan dump` returns the kernel's cached results and needs no root
+        cmd = ["iw", "dev", self.resolve_interface(), "scan"]
+        return cmd if self.rescan else cmd + ["dump"]
+
+    def iter_lines(self, tool=None):
+        tool = tool or self.resolve_tool()
+        return self.timed_lines(
+            stream_command(
+                self.command(tool), f"Wi-Fi scan failed ({tool}). Is the wireless interface up?", self.timeout
+            )
+        )
+
+    def iter_networks(self):
+        tool = self.resolve_tool()
+        if self.verbose:
+            print(f"\n📡 Scanning real Wi-Fi networks (Linux, {tool})...\n")
+
+        parser = parse_nmcli if tool == "nmcli" else parse_iw
+        count = 0
+        for network in parser(self.iter_lines(tool)):
+            count += 1
+            if self.verbose:
+                print(f"{count}. {network['ssid']} | {network['encryption']} | APs: {len(network['bssids'])}")
+            yield network
+
+        if not count and self.verbose:
+            print("❌ No Wi-Fi networks detected.")
+
+    async def aiter_networks(self):
+        tool = self.resolve_tool()
+        if tool == "iw" and not self.interface:
+            self.resolve_interface(await run_command_async(["iw", "dev"], self.timeout))
+
+        lines = []
+        async for line in self.atimed_lines(stream_command_async(
+            self.command(tool), f"Wi-Fi scan failed ({tool}). Is the wireless interface up?", self.timeout
+        )):
+            lines.append(line)
+
+        # nmcli/iw rows are grouped by SSID only once the whole dump is read
+        parser = parse_nmcli if tool == "nmcli" else parse_iw
+        for network in parser(lines):
+            yield network
+
+
+# ===============================
+# REPLAY (RECORDED CAPTURES)
+# ===============================
+class ReplayBackend(ScanBackend):
+    name = "replay"
+
+    # Format name -> parser taking an iterable of lines
+    PARSERS = {
+        "netsh": parse_netsh,
+        "nmcli": parse_nmcli,
+        "iw": parse_iw
+    }
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt
+
+    def capture_files(self):
+        if os.path.isdir(self.path):
+            return sorted(
+                os.path.join(self.path, name)
+                for name in os.listdir(self.path)
+                if os.path.isfile(os.path.join(self.path, name))
+            )
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Replay capture not found: {self.path}")
+        return [self.path]
+
+    def detect_format(self, path):
+        if self.fmt:
+            return self.fmt
+
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("SSID ") or line.startswith("Interface name"):
+                    return "netsh"
+                if line.startswith("BSS ") and "(on " in line:
+                    return "iw"
+                if "\\:" in line:
+                    return "nmcli"
+
+        raise ValueError(f"Unrecognised capture format: {path}")
+
+    def iter_networks(self):
+        for path in self.capture_files():
+            fmt = self.detect_format(path)
+            if fmt not in self.PARSERS:
+                raise ValueError(f"No parser for capture format '{fmt}'")
+
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                yield from self.PARSERS[fmt](f)
+
+
+# ===============================
+# SYNTHETIC (SEEDED GENERATOR)
+# ===============================
+class SyntheticBackend(ScanBackend):
+    name = "synthetic"
+
+    AUTH_TYPES = ["Open", "WEP", "WPA-Personal", "WPA2-Personal", "WPA3-Personal", "WPA2-Personal WPA3-Personal"]
+    CHANNELS = [1, 6, 11, 36, 40, 44, 48, 149, 153, 157, 161]
+
+    def __init__(self, networks=100, bssids_per_network=1, seed=0):
+        self.networks = networks
+        self.bssids_per_network = bssids_per_network
+        self.seed = seed
+
+    def iter_lines(self):
+        # Emits netsh-formatted text so synthetic runs exercise the real parser
+        rng = random.Random(self.seed)
+
+        yield "Interface name : Wi-Fi\n"
+        yield f"There are {self.networks} networks currently visible.\n"
+        yield "\n"
+
+        for i in range(1, self.networks + 1):
+            yield f"SSID {i} : LoadNet_{i:05d}\n"
+            yield "    Network type            : Infrastructure\n"
+            yield f"    Authentication          : {rng.choice(self.AUTH_TYPES)}\n"
+            yield "    Encryption              : CCMP\n"
+
+            for j in range(1, self.bssids_per_network + 1):
+                mac = ":".join(f"{rng.randrange(256):02x}" for _ in range(6))
+                yield f"    BSSID {j}                 : {mac}\n"
+                yield f"         Signal             : {rng.randint(5, 100)}%\n"
+                yield "         Radio type         : 802.11ax\n"
+                yield f"         Channel            : {rng.choice(self.CHANNELS)}\n"
+
+            yield "\n"
+
+    def iter_networks(self):
+        return parse_netsh(self.iter_lines())
+
+
+def build_backend(config):
+    scanner = config.scanner
+    backend = scanner["backend"]
+
+    if backend == "auto":
+        backend = "netsh" if os.name == "nt" else "linux"
+
+    if backend == "linux":
+        instance = LinuxBackend(scanner["linux_tool"], scanner["interface"], scanner["rescan"])
+    elif backend == "replay":
+        instance = ReplayBackend(scanner["replay_path"])
+    elif backend == "synthetic":
+        synthetic = scanner["synthetic"]
+        instance = SyntheticBackend(
+            synthetic["networks"],
+            synthetic["bssids_per_network"],
+            synthetic["seed"]
+        )
+    else:
+        instance = NetshBackend()
+
+    instance.timeout = scanner["timeout"]
+    return instance
+
+
+def write_capture(lines, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    print(f"📄 Capture saved: {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record or synthesize scan captures for the replay backend")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="save raw scan output from this machine's radio")
+    record.add_argument("output")
+    record.add_argument("--tool", choices=["netsh", "nmcli", "iw"], default="nmcli" if os.name != "nt" else "netsh")
+    record.add_argument("--interface", help="wireless interface for nmcli/iw")
+
+    synth = sub.add_parser("synthesize", help="write a seeded synthetic netsh dump")
+    synth.add_argument("output")
+    synth.add_argument("--networks", type=int, default=1000)
+    synth.add_argument("--bssids", type=int, default=1)
+    synth.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record" and args.tool == "netsh":
+        backend = NetshBackend()
+        backend.precheck()
+        write_capture(backend.iter_lines(), args.output)
+    elif args.command == "record":
+        write_capture(LinuxBackend(args.tool, args.interface).iter_lines(), args.output)
+    else:
+        write_capture(SyntheticBackend(args.networks, args.bssids, args.seed).iter_lines(), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# 📄 modules/scan_export.py
+"""Append-only scan history next to the wifi_scan.json/csv snapshots.
+
+    reports/wifi_scan.jsonl              one line per BSSID, appended as it is parsed
+    reports/scan_dataset/date=.../band=.../scan-<time>-<uuid>-0.parquet
+
+The JSONL stream needs nothing extra. The Parquet dataset needs pyarrow
+(optional); without it that export is skipped with a warning. Read the
+dataset back with only the columns you need:
+
+    load_dataset(columns=["bssid", "signal"], filters=[("band", "==", "5 GHz")])
+"""
+import json
+import os
+import uuid
+from datetime import datetime
+
+from modules.config import BASE_DIR, EXPORT_FORMATS
+
+JSONL_NAME = "wifi_scan.jsonl"
+DATASET_NAME = "scan_dataset"
+PARTITIONS = ("date", "band")
+
+# One row per BSSID, in this column order
+COLUMNS = ("scan_time", "date", "ssid", "encryption", "bssid", "vendor", "signal", "channel", "band", "last_seen")
+
+_warned = set()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        if "pyarrow" not in _warned:
+            _warned.add("pyarrow")
+            print("⚠️  pyarrow is not installed; skipping the Parquet scan dataset (pip install pyarrow)")
+        return None
+    return pyarrow
+
+
+def dataset_schema(pa):
+    return pa.schema([
+        ("scan_time", pa.timestamp("s")),
+        ("date", pa.string()),
+        ("ssid", pa.string()),
+        ("encryption", pa.string()),
+        ("bssid", pa.string()),
+        ("vendor", pa.string()),
+        ("signal", pa.int32()),
+        ("channel", pa.int32()),
+        ("band", pa.string()),
+        ("last_seen", pa.string())
+    ])
+
+
+def network_rows(network, scan_time):
+    date = scan_time.strftime("%Y-%m-%d")
+    for ap in network.get("bssids", []):
+        yield (
+            scan_time, date, network.get("ssid"), network.get("encryption"), ap.get("bssid"),
+            ap.get("vendor"), ap.get("signal"), ap.get("channel"), ap.get("band") or "Unknown",
+            network.get("last_seen")
+        )
+
+
+class ScanExport:
+    """Streams one scan into the enabled history formats.
+
+    Use it as a context manager: write() each network as it is produced,
+    and the Parquet files are written when the block closes.
+    """
+
+    def __init__(self, export_dir, formats=EXPORT_FORMATS, scan_time=None):
+        self.export_dir = export_dir
+        self.scan_time = (scan_time or datetime.now()).replace(microsecond=0)
+        self.jsonl_path = os.path.join(export_dir, JSONL_NAME) if "jsonl" in formats else None
+        self.dataset_dir = os.path.join(export_dir, DATASET_NAME) if "parquet" in formats else None
+
+        self.rows = 0
+        self._file = None
+        self._columns = {name: [] for name in COLUMNS} if self.dataset_dir else None
+
+    def __enter__(self):
+        if self.jsonl_path:
+            self._file = open(self.jsonl_path, "a", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(write_dataset=exc_type is None)
+
+    def write(self, network):
+        for row in network_rows(network, self.scan_time):
+            self.rows += 1
+            if self._file:
+                record = dict(zip(COLUMNS, row))
+                record["scan_time"] = self.scan_time.isoformat()
+                self._file.write(json.dumps(record) + "\n")
+            if self._columns is not None:
+                for name, value in zip(COLUMNS, row):
+                    self._columns[name].append(value)
+        if self._file:
+            self._file.flush()
+        return network
+
+    def write_all(self, networks):
+        for network in networks:
+            self.write(network)
+
+    def close(self, write_dataset=True):
+        if self._file:
+            self._file.close()
+            self._file = None
+            print(f"📄 JSONL history appended: {self.jsonl_path}")
+
+        if self._columns is not None and write_dataset and self.rows:
+            self._write_dataset()
+        self._columns = None
+
+    def _write_dataset(self):
+        pa = _import_pyarrow()
+        if pa is None:
+            return
+        table = pa.Table.from_pydict(self._columns, schema=dataset_schema(pa))
+        # The uuid keeps two scans within the same second from overwriting each other
+        stamp = f"{self.scan_time:%Y%m%dT%H%M%S}-{uuid.uuid4().hex}"
+        pa.parquet.write_to_dataset(
+            table,
+            self.dataset_dir,
+            partition_cols=list(PARTITIONS),
+            basename_template=f"scan-{stamp}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore"
+        )
+        print(f"📄 Parquet dataset updated: {self.dataset_dir}")
+
+
+# ===============================
+# READING HISTORY
+# ===============================
+def default_dataset_dir():
+    return os.path.join(BASE_DIR, "reports", DATASET_NAME)
+
+
+def load_dataset(path=None, columns=None, filters=None):
+    """pyarrow Table of the scan dataset, reading only `columns` and matching partitions."""
+    pa = _import_pyarrow()
+    if pa is None:
+        raise RuntimeError("Reading the scan dataset needs pyarrow (pip install pyarrow)")
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(path or default_dataset_dir(), format="parquet", partitioning="hive")
+    filter_expression = pa.parquet.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=filter_expression)
+
+
+def iter_jsonl(path=None):
+    """Records of the JSONL history, oldest first, one line at a time."""
+    path = path or os.path.join(BASE_DIR, "reports", JSONL_NAME)
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
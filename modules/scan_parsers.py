@@ -0,0 +1,311 @@
+# 📄 modules/scan_parsers.py
+import re
+
+# ===============================
+# NETSH PATTERNS (compiled once)
+# ===============================
+NETSH_SSID = re.compile(r"^SSID \d+\s*:\s?(.*)$")
+NETSH_AUTH = re.compile(r"^Authentication\s*:\s*(.*)$")
+NETSH_BSSID = re.compile(r"^BSSID \d+\s*:\s*(\S+)")
+NETSH_SIGNAL = re.compile(r"^Signal\s*:\s*(\d+)")
+NETSH_CHANNEL = re.compile(r"^Channel\s*:\s*(\d+)")
+
+
+def normalize_encryption(auth):
+    auth = auth.lower()
+
+    if "open" in auth:
+        return "Open"
+    if "wep" in auth:
+        return "WEP"
+    if "wpa3" in auth and "wpa2" in auth:
+        return "WPA2/WPA3"
+    if "wpa3" in auth:
+        return "WPA3"
+    if "wpa2" in auth:
+        return "WPA2"
+    if "wpa" in auth:
+        return "WPA"
+
+    return "Unknown"
+
+
+def new_network(ssid):
+    return {
+        "ssid": ssid,
+        "encryption": None,
+        "bssids": [],
+        "last_seen": None
+    }
+
+
+def new_bssid(bssid):
+    return {
+        "bssid": bssid,
+        "vendor": None,
+        "signal": None,
+        "channel": None,
+        "band": None
+    }
+
+
+class NetshParser:
+    """Incremental parser for `netsh wlan show networks mode=bssid`.
+
+    feed() one line at a time; a network record is returned as soon as the
+    next SSID block starts, and close() flushes the last one. Vendor, band
+    and last_seen are left for the scanner to fill in.
+    """
+
+    def __init__(self):
+        self.current = None
+        self.current_bssid = None
+
+    def feed(self, line):
+        line = line.strip()
+        if not line:
+            return None
+
+        match = NETSH_SSID.match(line)
+        if match:
+            done = self.current
+            self.current = new_network(match.group(1).strip())
+            self.current_bssid = None
+            return done
+
+        if self.current is None:
+            return None
+
+        match = NETSH_BSSID.match(line)
+        if match:
+            self.current_bssid = new_bssid(match.group(1))
+            self.current["bssids"].append(self.current_bssid)
+            return None
+
+        match = NETSH_AUTH.match(line)
+        if match:
+            self.current["encryption"] = normalize_encryption(match.group(1))
+            return None
+
+        if self.current_bssid is None:
+            return None
+
+        match = NETSH_SIGNAL.match(line)
+        if match:
+            self.current_bssid["signal"] = int(match.group(1))
+            return None
+
+        match = NETSH_CHANNEL.match(line)
+        if match:
+            self.current_bssid["channel"] = int(match.group(1))
+
+        return None
+
+    def close(self):
+        done = self.current
+        self.current = None
+        self.current_bssid = None
+        return done
+
+
+def parse_netsh(lines):
+    """Yield network records from any iterable of netsh lines (e.g. a pipe)."""
+    parser = NetshParser()
+    for line in lines:
+        network = parser.feed(line)
+        if network is not None:
+            yield network
+
+    network = parser.close()
+    if network is not None:
+        yield network
+
+
+# ===============================
+# NMCLI TERSE OUTPUT
+# ===============================
+# nmcli -t -f SSID,BSSID,CHAN,SIGNAL,SECURITY device wifi list
+NMCLI_FIELDS = ("SSID", "BSSID", "CHAN", "SIGNAL", "SECURITY")
+
+
+def split_terse(line):
+    """Split one `nmcli -t` line on unescaped colons, undoing \\: and \\\\."""
+    fields = []
+    current = []
+    escaped = False
+
+    for ch in line.rstrip("\r\n"):
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == ":":
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+
+    fields.append("".join(current))
+    return fields
+
+
+def nmcli_security(security):
+    security = security.strip()
+    if not security or security == "--":
+        return "Open"
+    return normalize_encryption(security.replace("WPA1", "WPA"))
+
+
+def parse_nmcli(lines, fields=NMCLI_FIELDS):
+    """Yield network records from terse nmcli output, grouped by SSID."""
+    networks = {}
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        values = split_terse(line)
+        if len(values) != len(fields):
+            continue
+        row = dict(zip(fields, values))
+
+        ssid = row["SSID"]
+        network = networks.get(ssid)
+        if network is None:
+            network = networks[ssid] = new_network(ssid)
+            network["encryption"] = nmcli_security(row["SECURITY"])
+
+        ap = new_bssid(row["BSSID"].lower())
+        ap["signal"] = int(row["SIGNAL"]) if row["SIGNAL"].isdigit() else None
+        ap["channel"] = int(row["CHAN"]) if row["CHAN"].isdigit() else None
+        network["bssids"].append(ap)
+
+    yield from networks.values()
+
+
+# ===============================
+# IW SCAN DUMP
+# ===============================
+# iw dev <iface> scan dump
+IW_BSS = re.compile(r"^BSS ([0-9a-fA-F:]{17})")
+IW_FREQ = re.compile(r"^freq:\s*(\d+)")
+IW_SIGNAL = re.compile(r"^signal:\s*(-?\d+(?:\.\d+)?) dBm")
+IW_SSID = re.compile(r"^SSID:\s?(.*)$")
+IW_DS_CHANNEL = re.compile(r"^DS Parameter set: channel (\d+)")
+IW_PRIMARY_CHANNEL = re.compile(r"^\* primary channel:\s*(\d+)")
+IW_AUTH_SUITES = re.compile(r"^\* Authentication suites:\s*(.*)$")
+
+
+def freq_to_channel(freq):
+    if freq == 2484:
+        return 14
+    if 2412 <= freq <= 2472:
+        return (freq - 2407) // 5
+    if 5000 <= freq <= 5895:
+        return (freq - 5000) // 5
+    # 6 GHz channel numbers overlap 2.4/5 GHz ones, so leave them unknown
+    return None
+
+
+def dbm_to_quality(dbm):
+    # Same 0-100 scale netsh and nmcli report (-100 dBm = 0, -50 dBm = 100)
+    return max(0, min(100, int(round(2 * (dbm + 100)))))
+
+
+def iw_encryption(bss):
+    if bss["rsn"]:
+        suites = bss["suites"]
+        if "SAE" in suites and "PSK" in suites:
+            return "WPA2/WPA3"
+        if "SAE" in suites:
+            return "WPA3"
+        return "WPA2"
+    if bss["wpa"]:
+        return "WPA"
+    if bss["privacy"]:
+        return "WEP"
+    return "Open"
+
+
+def parse_iw(lines):
+    """Yield network records from `iw ... scan dump`, grouped by SSID."""
+    networks = {}
+    bss = None
+
+    def flush(bss):
+        if bss is None:
+            return
+        ssid = bss["ssid"] or ""
+        network = networks.get(ssid)
+        if network is None:
+            network = networks[ssid] = new_network(ssid)
+            network["encryption"] = iw_encryption(bss)
+        network["bssids"].append(bss["ap"])
+
+    section = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        match = IW_BSS.match(stripped)
+        if match and not line[0].isspace():
+            flush(bss)
+            bss = {
+                "ap": new_bssid(match.group(1).lower()),
+                "ssid": None,
+                "privacy": False,
+                "rsn": False,
+                "wpa": False,
+                "suites": ""
+            }
+            section = None
+            continue
+
+        if bss is None:
+            continue
+
+        if stripped.startswith("RSN:"):
+            bss["rsn"] = True
+            section = "rsn"
+            stripped = stripped[4:].strip()
+        elif stripped.startswith("WPA:"):
+            bss["wpa"] = True
+            section = "wpa"
+            stripped = stripped[4:].strip()
+        elif not stripped.startswith("*"):
+            section = None
+
+        if stripped.startswith("capability:"):
+            bss["privacy"] = "Privacy" in stripped
+            continue
+
+        match = IW_AUTH_SUITES.match(stripped)
+        if match:
+            if section == "rsn":
+                bss["suites"] = match.group(1)
+            continue
+
+        match = IW_SSID.match(stripped)
+        if match and bss["ssid"] is None:
+            bss["ssid"] = match.group(1).strip()
+            continue
+
+        match = IW_FREQ.match(stripped)
+        if match:
+            if bss["ap"]["channel"] is None:
+                bss["ap"]["channel"] = freq_to_channel(int(match.group(1)))
+            continue
+
+        match = IW_SIGNAL.match(stripped)
+        if match:
+            bss["ap"]["signal"] = dbm_to_quality(float(match.group(1)))
+            continue
+
+        match = IW_DS_CHANNEL.match(stripped) or IW_PRIMARY_CHANNEL.match(stripped)
+        if match:
+            bss["ap"]["channel"] = int(match.group(1))
+
+    flush(bss)
+    yield from networks.values()
@@ -0,0 +1,196 @@
+# 📄 modules/scoring_rules.py
+"""Scoring rules for EncryptionAnalyzer and PasswordAudit.
+
+The rules live under lab_settings.scoring_rules in config.yaml and are
+compiled once per config load: SSID patterns become one case-insensitive
+regex, vendors a frozenset and encryption types dicts keyed in upper case
+(so "Open" matches an OPEN rule), so scoring a network costs the same
+however many rules are configured.
+"""
+import re
+
+import numpy as np
+
+DEFAULT_RULES = {
+    "encryption": {
+        "OPEN": {"severity": "Critical", "score": 9},
+        "WEP": {"severity": "Critical", "score": 9},
+        "WPA": {"severity": "High", "score": 7},
+        "WPA2": {"severity": "Medium", "score": 5},
+        "WPA2/WPA3": {"severity": "Low", "score": 3},
+        "WPA3": {"severity": "Low", "score": 2}
+    },
+    "unknown_encryption": {"severity": "Unknown", "score": 5},
+    "password": {
+        "encryption": {
+            "WEP": {"score": 40, "reason": "WEP encryption is broken"},
+            "WPA": {"score": 25, "reason": "WPA is outdated"},
+            "WPA2": {"score": 10},
+            "WPA2/WPA3": {"score": 10, "reason": "WPA2/WPA3 transition mode still accepts WPA2 clients"},
+            "WPA3": {"score": 2}
+        },
+        "wps": {"score": 25, "reason": "WPS enabled (PIN attack risk)"},
+        "ssid_patterns": {
+            "score": 10,
+            "reason": "Weak SSID pattern detected: {match}",
+            "patterns": ["admin", "guest", "wifi", "home", "test", "default", "tplink", "dlink"]
+        },
+        "vendors": {
+            "score": 10,
+            "reason": "Consumer router vendor: {vendor}",
+            "names": ["TP-Link", "D-Link", "Tenda", "Netgear"]
+        }
+    }
+}
+
+
+def _section(rules, key, default):
+    value = rules.get(key)
+    if value is None:
+        return default
+    if not isinstance(value, dict):
+        raise ValueError(f"{key} must be a mapping")
+    return value
+
+
+def _score(rule, where):
+    if not isinstance(rule, dict) or not isinstance(rule.get("score"), (int, float)):
+        raise ValueError(f"{where} needs a numeric score")
+    return rule["score"]
+
+
+def _list(rule, key, where):
+    value = rule.get(key) or []
+    if not isinstance(value, list) or not all(isinstance(v, str) and v for v in value):
+        raise ValueError(f"{where}.{key} must be a list of non-empty strings")
+    return value
+
+
+def trie_regex(words):
+    """One regex for a set of literal words, factored as a prefix trie.
+
+    A flat "a|b|c" alternation retries every word at every position; the
+    trie form branches on one character at a time, so matching cost stays
+    roughly flat as the list grows. Longer words win at the same position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        end = node.get("", False)
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class RuleSet:
+    """Compiled form of lab_settings.scoring_rules. Raises ValueError on bad rules."""
+
+    def __init__(self, rules=None):
+        rules = rules or {}
+
+        # ---- EncryptionAnalyzer ----
+        encryption = _section(rules, "encryption", DEFAULT_RULES["encryption"])
+        self.encryption = {
+            str(name).upper(): (rule.get("severity", "Unknown"), _score(rule, f"encryption.{name}"))
+            for name, rule in encryption.items()
+        }
+        unknown = _section(rules, "unknown_encryption", DEFAULT_RULES["unknown_encryption"])
+        self.unknown_encryption = (unknown.get("severity", "Unknown"), _score(unknown, "unknown_encryption"))
+
+        # ---- PasswordAudit ----
+        password = _section(rules, "password", {})
+        defaults = DEFAULT_RULES["password"]
+
+        self.password_encryption = {
+            str(name).upper(): (_score(rule, f"password.encryption.{name}"), rule.get("reason"))
+            for name, rule in _section(password, "encryption", defaults["encryption"]).items()
+        }
+
+        wps = _section(password, "wps", defaults["wps"])
+        self.wps = (_score(wps, "password.wps"), wps.get("reason"))
+
+        ssid = _section(password, "ssid_patterns", defaults["ssid_patterns"])
+        self.ssid_score = _score(ssid, "password.ssid_patterns")
+        self.ssid_reason = ssid.get("reason")
+        patterns = _list(ssid, "patterns", "password.ssid_patterns")
+        self.ssid_regex = re.compile(
+            trie_regex({p.lower() for p in patterns}), re.IGNORECASE
+        ) if patterns else None
+
+        vendors = _section(password, "vendors", defaults["vendors"])
+        self.vendor_score = _score(vendors, "password.vendors")
+        self.vendor_reason = vendors.get("reason")
+        self.vendors = frozenset(_list(vendors, "names", "password.vendors"))
+
+    # ===============================
+    # ENCRYPTION
+    # ===============================
+    def encryption_rule(self, encryption):
+        return self.encryption.get(str(encryption).upper(), self.unknown_encryption)
+
+    # ===============================
+    # PASSWORD FACTORS
+    # ===============================
+    def match_ssid(self, ssid):
+        if self.ssid_regex is None:
+            return None
+        match = self.ssid_regex.search(ssid)
+        return match.group(0).lower() if match else None
+
+    def password_points(self, network):
+        """Rule score and reasons for one network (signal is scored by PasswordAudit)."""
+        score = 0
+        reasons = []
+
+        points, reason = self.password_encryption.get(
+            str(network.get("encryption", "WPA2")).upper(), (0, None)
+        )
+        score += points
+        if reason:
+            reasons.append(reason)
+
+        if network.get("wps", False) or network.get("wps_enabled", False):
+            score += self.wps[0]
+            if self.wps[1]:
+                reasons.append(self.wps[1])
+
+        ssid_match = self.match_ssid(network.get("ssid") or "")
+        if ssid_match:
+            score += self.ssid_score
+            if self.ssid_reason:
+                reasons.append(self.ssid_reason.format(match=ssid_match))
+
+        vendor = network.get("vendor", "Unknown")
+        if vendor in self.vendors:
+            score += self.vendor_score
+            if self.vendor_reason:
+                reasons.append(self.vendor_reason.format(vendor=vendor))
+
+        return score, reasons
+
+    # ===============================
+    # COLUMNAR ENCRYPTION
+    # ===============================
+    def encryption_scores(self, labels):
+        """Base risk score for an array of encryption labels, as encryption_rule() gives.
+
+        Only the few distinct labels are upper-cased and looked up; the scores
+        are then spread back over the rows.
+        """
+        labels = np.asarray(labels)
+        if labels.dtype == object:
+            labels = labels.astype(str)  # sorts faster than objects, and tolerates None
+        unique, inverse = np.unique(labels, return_inverse=True)
+        scores = np.array([self.encryption_rule(label)[1] for label in unique.tolist()], dtype=np.int64)
+        return scores[inverse.reshape(-1)]
@@ -0,0 +1,148 @@
+# 📄 modules/simulation.py
+"""Seedable, vectorized simulation of the handshake and protection checks.
+
+Every network gets a fixed row of uniform draws from one PCG64 stream:
+row i is the same whether networks are simulated all at once, in chunks
+or one at a time (the stream is advanced to the row), so a seed
+reproduces a run exactly regardless of executor or worker count.
+"""
+import numpy as np
+
+# Columns of the per-network draw matrix
+HANDSHAKE_TIME, HANDSHAKE_SUCCESS, HANDSHAKE_PACKETS = 0, 1, 2
+PMF, WPS, RATE_LIMITING, HIDDEN_SSID, ISOLATION = 3, 4, 5, 6, 7
+DRAWS = 8
+
+# Monte Carlo trials use their own stream so they never shift the draws above
+MONTE_CARLO_STREAM = 1
+TRIAL_DRAWS = 3  # PMF, WPS, handshake per trial
+
+# signal above threshold -> (capture time range, base success chance)
+SIGNAL_BANDS = (
+    (-40, (5, 15), 0.95),
+    (-60, (15, 30), 0.80),
+    (None, (30, 60), 0.50)
+)
+ENCRYPTION_FACTORS = {"WPA3": 0.3, "WPA2": 0.8, "WPA": 0.9}
+
+
+def new_seed():
+    return int(np.random.SeedSequence().entropy % (1 << 63))
+
+
+class SimulationEngine:
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else int(seed)
+
+    def uniforms(self, n, start=0):
+        """(n, DRAWS) uniform draws for networks start .. start + n - 1."""
+        bit_generator = np.random.PCG64(self.seed)
+        # random() consumes exactly one 64-bit output per double
+        bit_generator.advance(start * DRAWS)
+        return np.random.Generator(bit_generator).random((n, DRAWS))
+
+    # ===============================
+    # HANDSHAKE
+    # ===============================
+    def handshake_probabilities(self, networks):
+        """Capture time range and success chance per network (no randomness)."""
+        low, high, chance = [], [], []
+        for network in networks:
+            signal = network.get("signal", -50)
+            if signal is None:
+                signal = -50
+            for threshold, (t_low, t_high), base in SIGNAL_BANDS:
+                if threshold is None or signal > threshold:
+                    break
+            encryption = network.get("encryption", "WPA2")
+            if encryption == "WEP":
+                base = 1.0  # Easy for WEP
+            else:
+                base *= ENCRYPTION_FACTORS.get(encryption, 1.0)
+            low.append(t_low)
+            high.append(t_high)
+            chance.append(base)
+        return np.array(low), np.array(high), np.array(chance)
+
+    def handshake(self, networks, draws):
+        low, high, chance = self.handshake_probabilities(networks)
+        capture_time = low + np.floor(draws[:, HANDSHAKE_TIME] * (high - low + 1)).astype(int)
+        possible = draws[:, HANDSHAKE_SUCCESS] < chance
+        packets = 100 + np.floor(draws[:, HANDSHAKE_PACKETS] * 901).astype(int)
+
+        results = []
+        for network, t, ok, p, c in zip(networks, capture_time.tolist(), possible.tolist(),
+                                        packets.tolist(), chance.tolist()):
+            encryption = network.get("encryption", "WPA2")
+            results.append({
+                "handshake_possible": ok,
+                "time_seconds": t,
+                "packet_count": p,
+                "success_probability": round(c * 100, 1),
+                "recommended_tools": ["aircrack-ng", "hashcat"] if encryption in ["WPA", "WPA2"] else ["specific tools"],
+                "notes": "Simulated handshake capture test"
+            })
+        return results
+
+    # ===============================
+    # PROTECTION
+    # ===============================
+    def protection_probabilities(self, networks):
+        """Chance that PMF, WPS, rate limiting, hidden SSID and isolation are on."""
+        n = len(networks)
+        modern = np.array([net.get("encryption", "WPA2") in ("WPA3", "WPA2") for net in networks], dtype=bool)
+        hidden = np.array([(net.get("ssid") or "").startswith("Hidden_") for net in networks], dtype=bool)
+        return {
+            "pmf_enabled": np.where(modern, 0.3, 0.0),
+            "wps_enabled": np.full(n, 0.7),
+            "rate_limiting": np.full(n, 0.5),
+            "hidden_ssid": np.where(hidden, 1.0, 0.2),
+            "isolation_enabled": np.full(n, 0.4)
+        }
+
+    def protection(self, networks, draws):
+        chances = self.protection_probabilities(networks)
+        # A feature is on when its draw lands in the top `chance` of [0, 1)
+        flags = {
+            "pmf_enabled": draws[:, PMF] > 1 - chances["pmf_enabled"],
+            "wps_enabled": draws[:, WPS] > 1 - chances["wps_enabled"],
+            "rate_limiting": draws[:, RATE_LIMITING] > 1 - chances["rate_limiting"],
+            "hidden_ssid": draws[:, HIDDEN_SSID] >= 1 - chances["hidden_ssid"],
+            "isolation_enabled": draws[:, ISOLATION] > 1 - chances["isolation_enabled"]
+        }
+        columns = {key: value.tolist() for key, value in flags.items()}
+        return [
+            {
+                "pmf_enabled": columns["pmf_enabled"][i],
+                "wps_enabled": columns["wps_enabled"][i],
+                "rate_limiting": columns["rate_limiting"][i],
+                "hidden_ssid": columns["hidden_ssid"][i],
+                "mac_filtering": False,  # Simulated as usually disabled
+                "isolation_enabled": columns["isolation_enabled"][i]  # Client isolation
+            }
+            for i in range(len(networks))
+        ]
+
+    def run(self, networks, start=0):
+        """Handshake and protection results for networks, as rows start.. of the stream."""
+        networks = list(networks)
+        draws = self.uniforms(len(networks), start)
+        return self.handshake(networks, draws), self.protection(networks, draws)
+
+    # ===============================
+    # MONTE CARLO
+    # ===============================
+    def trials(self, networks, trials, start=0):
+        """(n, trials) boolean outcomes of the random risk inputs for each network."""
+        networks = list(networks)
+        bit_generator = np.random.PCG64(np.random.SeedSequence([self.seed, MONTE_CARLO_STREAM]))
+        bit_generator.advance(start * trials * TRIAL_DRAWS)
+        draws = np.random.Generator(bit_generator).random((len(networks), trials, TRIAL_DRAWS))
+
+        chances = self.protection_probabilities(networks)
+        _, _, handshake_chance = self.handshake_probabilities(networks)
+        return {
+            "pmf_enabled": draws[:, :, 0] > 1 - chances["pmf_enabled"][:, None],
+            "wps_enabled": draws[:, :, 1] > 1 - chances["wps_enabled"][:, None],
+            "handshake_possible": draws[:, :, 2] < handshake_chance[:, None]
+        }
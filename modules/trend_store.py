@@ -0,0 +1,287 @@
+# 📄 modules/trend_store.py
+"""Time-series store of per-BSSID observations across scans.
+
+Every scan adds one raw row per BSSID and folds it into per-minute and
+per-hour rollups (sample count, min/max/mean signal, last channel), so
+long ranges are answered from a few rows per hour instead of every scan:
+
+    python -m modules.trend_store first-seen cc:54:fe:e3:cd:88
+    python -m modules.trend_store history cc:54:fe:e3:cd:88 --days 30 --resolution hour
+    python -m modules.trend_store occupancy --band "2.4 GHz" --days 7
+    python -m modules.trend_store import reports/wifi_scan.jsonl
+"""
+import argparse
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from modules.config import BASE_DIR
+
+DEFAULT_STORE = os.path.join(BASE_DIR, "evidence", "trends.db")
+
+RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    bssid       TEXT NOT NULL,
+    observed_at REAL NOT NULL,
+    ssid        TEXT,
+    signal      INTEGER,
+    channel     INTEGER,
+    band        TEXT,
+    encryption  TEXT
+);
+CREATE INDEX IF NOT EXISTS observations_bssid ON observations (bssid, observed_at);
+CREATE INDEX IF NOT EXISTS observations_time ON observations (observed_at);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    resolution INTEGER NOT NULL,
+    bucket     INTEGER NOT NULL,
+    bssid      TEXT NOT NULL,
+    ssid       TEXT,
+    band       TEXT,
+    channel    INTEGER,
+    encryption TEXT,
+    samples    INTEGER NOT NULL,
+    signal_min INTEGER,
+    signal_max INTEGER,
+    signal_sum INTEGER,
+    signal_n   INTEGER NOT NULL,
+    PRIMARY KEY (resolution, bssid, bucket)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rollups_band_time ON rollups (resolution, band, bucket, channel);
+
+CREATE TABLE IF NOT EXISTS bssids (
+    bssid      TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen  REAL NOT NULL,
+    ssid       TEXT
+) WITHOUT ROWID;
+"""
+
+UPSERT_ROLLUP = """
+INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT (resolution, bssid, bucket) DO UPDATE SET
+    ssid = excluded.ssid,
+    band = excluded.band,
+    channel = excluded.channel,
+    encryption = excluded.encryption,
+    samples = samples + 1,
+    signal_min = MIN(COALESCE(signal_min, excluded.signal_min), COALESCE(excluded.signal_min, signal_min)),
+    signal_max = MAX(COALESCE(signal_max, excluded.signal_max), COALESCE(excluded.signal_max, signal_max)),
+    signal_sum = COALESCE(signal_sum, 0) + COALESCE(excluded.signal_sum, 0),
+    signal_n = signal_n + excluded.signal_n
+"""
+
+UPSERT_BSSID = """
+INSERT INTO bssids VALUES (?, ?, ?, ?)
+ON CONFLICT (bssid) DO UPDATE SET
+    first_seen = MIN(first_seen, excluded.first_seen),
+    last_seen = MAX(last_seen, excluded.last_seen),
+    ssid = CASE WHEN excluded.last_seen >= last_seen THEN excluded.ssid ELSE ssid END
+"""
+
+
+def observation_rows(networks, observed_at):
+    for network in networks:
+        for ap in network.get("bssids", []):
+            bssid = (ap.get("bssid") or "").lower()
+            if bssid:
+                yield (bssid, observed_at, network.get("ssid"), ap.get("signal"),
+                       ap.get("channel"), ap.get("band"), network.get("encryption"))
+
+
+class TrendStore:
+    """Indexed SQLite trend store: raw observations plus minute/hour rollups."""
+
+    def __init__(self, path=None, retention_days=None):
+        self.path = path or DEFAULT_STORE
+        self.retention_days = retention_days  # raw rows older than this are dropped on ingest
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    # ===============================
+    # INGEST
+    # ===============================
+    def record(self, networks, observed_at=None):
+        """Adds one scan; returns the number of BSSID observations stored."""
+        observed_at = observed_at or time.time()
+        return self._insert(list(observation_rows(networks, observed_at)))
+
+    def _insert(self, rows):
+        rollups, first_seen = [], []
+        for bssid, observed_at, ssid, signal, channel, band, encryption in rows:
+            for seconds in RESOLUTIONS.values():
+                bucket = int(observed_at // seconds * seconds)
+                rollups.append((seconds, bucket, bssid, ssid, band, channel, encryption,
+                                signal, signal, signal, 0 if signal is None else 1))
+            first_seen.append((bssid, observed_at, observed_at, ssid))
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("INSERT INTO observations VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                conn.executemany(UPSERT_ROLLUP, rollups)
+                conn.executemany(UPSERT_BSSID, first_seen)
+                if self.retention_days:
+                    conn.execute("DELETE FROM observations WHERE observed_at < ?",
+                                 (time.time() - self.retention_days * 86400,))
+        finally:
+            conn.close()
+        return len(rows)
+
+    def import_jsonl(self, paths):
+        # Backfills from the reports/wifi_scan.jsonl history (one line per BSSID)
+        from modules.scan_export import iter_jsonl
+
+        total = 0
+        for path in paths:
+            rows = []
+            for record in iter_jsonl(path):
+                bssid = (record.get("bssid") or "").lower()
+                if not bssid:
+                    continue
+                observed_at = datetime.fromisoformat(record["scan_time"]).timestamp()
+                rows.append((bssid, observed_at, record.get("ssid"), record.get("signal"),
+                             record.get("channel"), record.get("band"), record.get("encryption")))
+            total += self._insert(rows)
+        print(f"📈 Imported {total} observations into {self.path}")
+        return total
+
+    def prune(self, days):
+        """Drops raw observations older than `days`; rollups and first-seen are kept."""
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute("DELETE FROM observations WHERE observed_at < ?",
+                                      (time.time() - days * 86400,))
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    # ===============================
+    # QUERIES
+    # ===============================
+    def first_seen(self, bssid):
+        """{"bssid", "first_seen", "last_seen", "ssid"} or None if never observed."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM bssids WHERE bssid = ?", (bssid.lower(),)).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row else None
+
+    def history(self, bssid, since=None, until=None, days=None, resolution="raw"):
+        """Observations of one BSSID, oldest first; minute/hour resolutions read the rollups."""
+        since, until = self._range(since, until, days)
+        conn = self._connect()
+        try:
+            if resolution == "raw":
+                sql = ("SELECT observed_at AS time, ssid, signal, channel, band, encryption "
+                       "FROM observations WHERE bssid = ? AND observed_at >= ? AND observed_at < ? "
+                       "ORDER BY observed_at")
+                params = (bssid.lower(), since, until)
+            else:
+                sql = ("SELECT bucket AS time, ssid, channel, band, encryption, samples, signal_min, signal_max, "
+                       "CAST(signal_sum AS REAL) / NULLIF(signal_n, 0) AS signal_mean "
+                       "FROM rollups WHERE resolution = ? AND bssid = ? AND bucket >= ? AND bucket < ? "
+                       "ORDER BY bucket")
+                params = (RESOLUTIONS[resolution], bssid.lower(), since, until)
+            return [dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def channel_occupancy(self, band=None, since=None, until=None, days=None, resolution="hour"):
+        """{bucket: {channel: BSSIDs seen}} per minute or hour."""
+        since, until = self._range(since, until, days)
+        sql = ("SELECT bucket, channel, COUNT(*) AS bssids FROM rollups "
+               "WHERE resolution = ? AND bucket >= ? AND bucket < ?")
+        params = [RESOLUTIONS[resolution], since, until]
+        if band:
+            sql += " AND band = ?"
+            params.append(band)
+        sql += " GROUP BY bucket, channel ORDER BY bucket, channel"
+
+        conn = self._connect()
+        try:
+            occupancy = {}
+            for row in conn.execute(sql, params):
+                occupancy.setdefault(row["bucket"], {})[row["channel"]] = row["bssids"]
+            return occupancy
+        finally:
+            conn.close()
+
+    def _range(self, since, until, days):
+        if days is not None:
+            since = time.time() - days * 86400
+        return since or 0, until or time.time() + 1
+
+
+def _format_time(timestamp):
+    return datetime.fromtimestamp(timestamp).isoformat(sep=" ", timespec="seconds")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query per-BSSID trends across scans")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="trend database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    first = sub.add_parser("first-seen", help="when a BSSID first and last appeared")
+    first.add_argument("bssid")
+
+    history = sub.add_parser("history", help="signal/channel history of one BSSID")
+    history.add_argument("bssid")
+    history.add_argument("--days", type=float, default=1)
+    history.add_argument("--resolution", choices=["raw", *RESOLUTIONS], default="raw")
+
+    occupancy = sub.add_parser("occupancy", help="BSSIDs per channel over time")
+    occupancy.add_argument("--band", help='e.g. "2.4 GHz" or "5 GHz"')
+    occupancy.add_argument("--days", type=float, default=7)
+    occupancy.add_argument("--resolution", choices=list(RESOLUTIONS), default="hour")
+
+    backfill = sub.add_parser("import", help="backfill from wifi_scan.jsonl history files")
+    backfill.add_argument("files", nargs="+")
+
+    prune = sub.add_parser("prune", help="drop raw observations older than N days (rollups are kept)")
+    prune.add_argument("--days", type=float, required=True)
+
+    args = parser.parse_args(argv)
+    store = TrendStore(args.store)
+
+    if args.command == "first-seen":
+        seen = store.first_seen(args.bssid)
+        if not seen:
+            print(f"❌ {args.bssid} has never been observed")
+            return
+        print(f"{seen['bssid']} ({seen['ssid']})  first seen {_format_time(seen['first_seen'])}  "
+              f"last seen {_format_time(seen['last_seen'])}")
+
+    elif args.command == "history":
+        for row in store.history(args.bssid, days=args.days, resolution=args.resolution):
+            signal = row["signal"] if args.resolution == "raw" else (
+                f"{row['signal_mean']:.0f} ({row['signal_min']}-{row['signal_max']}, {row['samples']} scans)"
+                if row["signal_mean"] is not None else "-")
+            print(f"{_format_time(row['time'])}  {row['ssid']}  ch {row['channel']} {row['band']}  signal {signal}")
+
+    elif args.command == "occupancy":
+        for bucket, channels in store.channel_occupancy(args.band, days=args.days, resolution=args.resolution).items():
+            counts = "  ".join(f"ch{channel}:{count}" for channel, count in channels.items())
+            print(f"{_format_time(bucket)}  {counts}")
+
+    elif args.command == "import":
+        store.import_jsonl(args.files)
+
+    else:
+        print(f"🧹 Dropped {store.prune(args.days)} raw observations")
+
+
+if __name__ == "__main__":
+    main()
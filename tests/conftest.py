@@ -0,0 +1,43 @@
+# 📄 tests/conftest.py
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def capture_lines():
+    """Lines of a recorded capture in captures/, e.g. capture_lines("netsh")."""
+    def read(name):
+        with open(os.path.join(ROOT, "captures", f"{name}_sample.txt"), encoding="utf-8") as f:
+            return f.readlines()
+    return read
+
+
+@pytest.fixture
+def replay_config(tmp_path, monkeypatch):
+    """Makes load_config() return config.yaml set to replay a capture, writing nothing outside tmp_path.
+
+    Returns a function taking the capture path (default: the nmcli sample).
+    """
+    import yaml
+
+    import modules.config
+
+    def use(capture=os.path.join(ROOT, "captures", "nmcli_sample.txt"), **lab_settings):
+        with open(os.path.join(ROOT, "config.yaml"), encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        lab = data["lab_settings"]
+        lab["simulation_mode"] = False
+        lab["scanner"].update(backend="replay", replay_path=str(capture), exports=[])
+        lab["trends"]["enabled"] = False
+        lab.update(lab_settings)
+
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(data), encoding="utf-8")
+        monkeypatch.setattr(modules.config, "DEFAULT_CONFIG_PATH", str(path))
+        return modules.config.load_config()
+    return use
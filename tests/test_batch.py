@@ -0,0 +1,34 @@
+# 📄 tests/test_batch.py
+"""Batch (--all) analysis of scanned networks."""
+from modules.config import Config
+from modules.executor import StageExecutor
+from modules.network_scanner import build_target
+from modules.report_generator import summarize_fleet
+from modules.scan_parsers import parse_netsh
+from modules.simulation import SimulationEngine
+
+# The second access point has no Signal line, so its signal stays None
+NO_SIGNAL_CAPTURE = """\
+SSID 1 : Lab
+    Authentication          : WPA2-Personal
+    BSSID 1                 : aa:aa:aa:aa:aa:01
+         Signal             : 70%
+         Channel            : 6
+
+SSID 2 : Quiet
+    Authentication          : WPA2-Personal
+    BSSID 1                 : aa:aa:aa:aa:aa:02
+         Channel            : 11
+"""
+
+
+def test_batch_survives_missing_signal():
+    networks = list(parse_netsh(NO_SIGNAL_CAPTURE.splitlines(True)))
+    assert networks[1]["bssids"][0]["signal"] is None
+
+    targets = [build_target(net) for net in networks]
+    results = StageExecutor("serial").analyze(targets, Config(), SimulationEngine(1))
+
+    assert [result["target"]["ssid"] for result in results] == ["Lab", "Quiet"]
+    assert results[1]["password"]["strength"]
+    assert summarize_fleet(results)["network_count"] == 2
@@ -0,0 +1,47 @@
+# 📄 tests/test_bloom_filter.py
+"""Leaked-passphrase Bloom filter and its use by the password audit."""
+import pytest
+
+from modules.bloom_filter import BloomFilter, build_filter
+from modules.password_audit import PasswordAudit
+
+WORDS = [f"password{i}" for i in range(500)] + ["hunter2", "correct horse"]
+
+
+@pytest.fixture
+def bloom_path(tmp_path):
+    wordlist = tmp_path / "leaked.txt"
+    wordlist.write_text("\n".join(WORDS) + "\n", encoding="utf-8")
+    path = str(tmp_path / "leaked.bloom")
+    build_filter(str(wordlist), path, fp_rate=0.001)
+    return path
+
+
+def test_bloom_filter_lookup(bloom_path):
+    bloom = BloomFilter(bloom_path)
+    try:
+        assert all(word in bloom for word in WORDS)
+        false_positives = sum(f"unlisted-{i}" in bloom for i in range(2000))
+        assert false_positives < 20
+    finally:
+        bloom.close()
+
+
+def test_not_a_bloom_filter(tmp_path):
+    path = tmp_path / "junk.bloom"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        BloomFilter(str(path))
+
+
+def test_leaked_passphrase_is_very_weak(bloom_path, replay_config, monkeypatch):
+    config = replay_config()
+    monkeypatch.setattr(config, "passphrase_blocklist", bloom_path)
+    target = {"ssid": "Lab", "encryption": "WPA2", "signal": 70}
+
+    leaked = PasswordAudit(config).run(dict(target, passphrase="correct horse"))
+    assert leaked["leaked"] is True
+    assert leaked["strength"] == "Very Weak"
+    assert leaked["estimated_crack_days"] == 0
+
+    assert not PasswordAudit(config).run(dict(target, passphrase="unlisted-7f3a-Qx!")).get("leaked")
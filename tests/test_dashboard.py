@@ -0,0 +1,51 @@
+# 📄 tests/test_dashboard.py
+"""Streamlit dashboard reruns (needs streamlit; skipped without it)."""
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def app(replay_config):
+    replay_config()
+    return AppTest.from_file(os.path.join(ROOT, "ui.py"), default_timeout=60)
+
+
+def test_target_survives_reruns(app):
+    # Reruns get a fresh copy of the cached scan while the cached table keeps
+    # the first run's objects; the selected target must still resolve
+    app.run()
+    assert not app.exception
+    app.toggle(key="stage_handshake").set_value(True)
+    app.toggle(key="stage_protection").set_value(True)
+    app.selectbox[-1].select_index(1)
+    app.run()
+    app.run()
+
+    assert not app.exception
+    assert app.success[0].value.startswith("Selected Network: Guest_WiFi")  # second by signal
+    assert any(text.value.startswith("Handshake Capturable:") for text in app.markdown)
+
+
+def test_evidence_keeps_the_analyzed_bssid(app, tmp_path, monkeypatch):
+    # The dashboard must hand the analyzers the same flattened target as main.py
+    import modules.evidence_collector as evidence_collector
+    import modules.report_generator as report_generator
+    store = str(tmp_path / "evidence.db")
+    monkeypatch.setattr(evidence_collector, "DEFAULT_STORE", store)
+    monkeypatch.setattr(report_generator, "REPORT_DIR", str(tmp_path / "reports"))
+
+    app.run()
+    app.button[-2].click()  # Save Evidence & Generate HTML Report
+    app.run()
+
+    assert not app.exception
+    evidence = evidence_collector.EvidenceCollector(store)
+    [audit] = evidence.query()
+    assert audit["target"]["bssid"]
+    assert evidence.query(bssid=audit["target"]["bssid"]) == [audit]
@@ -0,0 +1,75 @@
+# 📄 tests/test_evidence_collector.py
+"""SQLite evidence store: saving runs, indexed queries and round trips."""
+import json
+import time
+
+import pytest
+
+from modules.evidence_collector import EvidenceCollector, main
+
+DAY = 86400
+
+
+def audit(ssid, bssid, level="High", score=9):
+    return {
+        "target": {"ssid": ssid, "bssid": bssid, "encryption": "WPA2"},
+        "encryption": {"type": "WPA2", "score": 5},
+        "risk": {"level": level, "score": score}
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EvidenceCollector(str(tmp_path / "evidence.db"))
+
+
+@pytest.fixture
+def runs(store):
+    """A batch run from 40 days ago and a single-target run from yesterday."""
+    now = time.time()
+    batch = store.save({"mode": "batch", "networks": [
+        audit("Lab", "AA:AA:AA:AA:AA:01"), audit("Guest", "aa:aa:aa:aa:aa:02", "Low", 3)
+    ]}, saved_at=now - 40 * DAY)
+    single = store.save(dict(audit("Lab", "aa:aa:aa:aa:aa:01", "Critical", 12), adapter="wlan0"),
+                        saved_at=now - DAY)
+    return {"batch": batch, "single": single}
+
+
+def test_query_filters(store, runs):
+    # Newest first; BSSIDs match case-insensitively
+    history = store.query(bssid="AA:aa:AA:aa:AA:01")
+    assert [a["risk"]["level"] for a in history] == ["Critical", "High"]
+    assert [a["run_id"] for a in history] == [runs["single"], runs["batch"]]
+
+    assert [a["target"]["ssid"] for a in store.query(days=30)] == ["Lab"]
+    assert [a["target"]["ssid"] for a in store.query(run_id=runs["batch"])] == ["Lab", "Guest"]
+    assert [a["target"]["ssid"] for a in store.query(ssid="Guest")] == ["Guest"]
+    assert len(store.query(limit=2)) == 2
+    assert store.query(ssid="Lab", until=time.time() - 30 * DAY)[0]["run_id"] == runs["batch"]
+    assert store.query(bssid="ff:ff:ff:ff:ff:ff") == []
+
+
+def test_load_run_round_trips(store, runs):
+    single = store.load_run(runs["single"])
+    assert single["adapter"] == "wlan0"
+    assert single["risk"]["level"] == "Critical"
+
+    batch = store.load_run(runs["batch"])
+    assert [a["target"]["ssid"] for a in batch["networks"]] == ["Lab", "Guest"]
+    assert store.load_run("missing") is None
+
+
+def test_import_legacy_json(tmp_path, store):
+    legacy = tmp_path / "2025-01-01_10-00-00.json"
+    legacy.write_text(json.dumps(dict(audit("Old", "aa:aa:aa:aa:aa:09"), timestamp="2025-01-01T10:00:00")),
+                      encoding="utf-8")
+    [run_id] = store.import_json([str(legacy)])
+
+    [imported] = store.query(bssid="aa:aa:aa:aa:aa:09")
+    assert imported["run_id"] == run_id
+    assert imported["audited_at"] == "2025-01-01T10:00:00"
+
+
+def test_query_cli(store, runs, capsys):
+    main(["--store", store.path, "query", "--ssid", "Guest"])
+    assert "Guest (aa:aa:aa:aa:aa:02)  Low 3" in capsys.readouterr().out
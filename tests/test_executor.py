@@ -0,0 +1,45 @@
+# 📄 tests/test_executor.py
+"""Serial, thread and process executors must agree result for result."""
+import pytest
+
+from modules.config import Config
+from modules.executor import StageExecutor
+from modules.metrics import Metrics
+from modules.network_scanner import build_target
+from modules.scan_parsers import parse_nmcli
+from modules.simulation import SimulationEngine
+
+
+@pytest.fixture
+def targets(capture_lines):
+    # The recorded networks, repeated under fresh BSSIDs so pools get several chunks
+    networks = list(parse_nmcli(capture_lines("nmcli")))
+    targets = []
+    for copy in range(6):
+        for net in networks:
+            target = build_target(net)
+            target["bssid"] = f"02:00:00:00:{copy:02x}:{len(targets):02x}"
+            targets.append(target)
+    return targets
+
+
+def analyze(kind, targets, passphrases=None):
+    metrics = Metrics()
+    results = StageExecutor(kind, workers=2).analyze(targets, Config(), SimulationEngine(42), metrics, passphrases)
+    return results, metrics
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_pools_match_serial(kind, targets):
+    passphrases = ["Welcome123" if i % 5 == 0 else None for i in range(len(targets))]
+    serial, _ = analyze("serial", targets, passphrases)
+    pooled, metrics = analyze(kind, targets, passphrases)
+
+    assert pooled == serial
+    assert [result["target"]["bssid"] for result in pooled] == [target["bssid"] for target in targets]
+    assert metrics.counters["networks_analyzed"] == len(targets)
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        StageExecutor("gpu")
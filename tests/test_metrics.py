@@ -0,0 +1,68 @@
+# 📄 tests/test_metrics.py
+"""Stage histograms and their Prometheus text export."""
+import re
+
+from modules.metrics import BUCKETS, PROMETHEUS_PREFIX, Metrics
+
+SAMPLE = re.compile(r'^(\w+)\{(\w+)="([^"]*)"(?:,le="([^"]+)")?\} (\S+)$')
+
+
+def recorded():
+    metrics = Metrics()
+    # On a bound counts in that bucket; past the last bound only in +Inf
+    for seconds in (0.0001, 0.003, 0.003, 45, 100):
+        metrics.observe("scan", seconds)
+    metrics.merge({"risk_scoring": 0.02})
+    metrics.count("bssids_scanned", 12)
+    metrics.count("bssids_scanned", 3)
+    return metrics
+
+
+def test_histogram_buckets():
+    histogram = recorded().histograms["scan"]
+    cumulative = dict(histogram.cumulative())
+    assert len(cumulative) == len(BUCKETS) + 1
+    assert (cumulative[0.0001], cumulative[0.005], cumulative[30], cumulative[60], cumulative[float("inf")]) == (1, 3, 3, 4, 5)
+    assert (histogram.count, histogram.max) == (5, 100)
+
+
+def test_prometheus_text_format():
+    text = recorded().to_prometheus()
+    assert text.endswith("\n")
+
+    lines = text.splitlines()
+    assert lines[:2] == [
+        f"# HELP {PROMETHEUS_PREFIX}_stage_seconds Time spent in each audit pipeline stage.",
+        f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds histogram"
+    ]
+    assert f"# TYPE {PROMETHEUS_PREFIX}_events_total counter" in lines
+
+    samples = [SAMPLE.match(line) for line in lines if not line.startswith("#")]
+    assert all(samples), [line for line, m in zip(lines, samples) if not m]
+
+    buckets = [(m[4], float(m[5])) for m in samples if m[1].endswith("_bucket") and m[3] == "scan"]
+    assert [le for le, _ in buckets] == [repr(float(b)) for b in BUCKETS] + ["+Inf"]
+    counts = [count for _, count in buckets]
+    assert counts == sorted(counts)  # cumulative
+
+    values = {(m[1], m[3]): float(m[5]) for m in samples if not m[1].endswith("_bucket")}
+    assert values[(f"{PROMETHEUS_PREFIX}_stage_seconds_count", "scan")] == counts[-1] == 5
+    assert values[(f"{PROMETHEUS_PREFIX}_stage_seconds_sum", "scan")] == 0.0001 + 0.003 + 0.003 + 45 + 100
+    assert values[(f"{PROMETHEUS_PREFIX}_stage_seconds_count", "risk_scoring")] == 1
+    assert values[(f"{PROMETHEUS_PREFIX}_events_total", "bssids_scanned")] == 15
+
+
+def test_write_prometheus_replaces_file(tmp_path):
+    path = tmp_path / "metrics" / "wifi_audit.prom"
+    recorded().write_prometheus(str(path))
+    Metrics().write_prometheus(str(path))
+
+    assert path.read_text(encoding="utf-8") == Metrics().to_prometheus()
+    assert [p.name for p in path.parent.iterdir()] == ["wifi_audit.prom"]
+
+
+def test_summary_orders_slowest_first():
+    summary = recorded().summary()
+    assert list(summary["stages"]) == ["scan", "risk_scoring"]
+    assert summary["stages"]["scan"]["buckets"][-1] == ["+Inf", 5]
+    assert summary["counters"] == {"bssids_scanned": 15}
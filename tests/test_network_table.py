@@ -0,0 +1,65 @@
+# 📄 tests/test_network_table.py
+"""Dashboard table: server-side filtering, sorting and paging of BSSIDs."""
+import pytest
+
+from modules.network_table import NetworkTable
+
+
+def network(ssid, encryption, *aps):
+    return {
+        "ssid": ssid,
+        "encryption": encryption,
+        "bssids": [{"bssid": bssid, "signal": signal, "channel": channel, "band": band, "vendor": "Acme"}
+                   for bssid, signal, channel, band in aps]
+    }
+
+
+@pytest.fixture
+def table():
+    return NetworkTable([
+        network("LabNet", "WPA2", ("aa:01", 78, 6, "2.4 GHz"), ("aa:02", 64, 36, "5 GHz")),
+        network("guest_wifi", "WPA", ("bb:01", 55, 1, "2.4 GHz")),
+        network("Office", "WPA3", ("cc:01", None, None, None)),
+        network("", "Open", ("dd:01", 90, 11, "2.4 GHz"))
+    ])
+
+
+def bssids(table, rows):
+    return [table.values["bssid"][i] for i in rows]
+
+
+def test_filters(table):
+    assert len(table) == 5
+    assert bssids(table, table.query(ssid="NET")) == ["aa:01", "aa:02"]
+    assert bssids(table, table.query(encryptions=["WPA", "Open"])) == ["dd:01", "bb:01"]
+    assert bssids(table, table.query(bands=["5 GHz", "Unknown"])) == ["aa:02", "cc:01"]
+    # A missing signal never falls inside a range
+    assert bssids(table, table.query(signal=(50, 80))) == ["aa:01", "aa:02", "bb:01"]
+    assert bssids(table, table.query(ssid="lab", bands=["2.4 GHz"])) == ["aa:01"]
+    assert table.options("band") == ["2.4 GHz", "5 GHz", "Unknown"]
+
+
+def test_sorting(table):
+    # Missing values go last in either direction
+    assert bssids(table, table.query(sort="signal")) == ["dd:01", "aa:01", "aa:02", "bb:01", "cc:01"]
+    assert bssids(table, table.query(sort="channel", descending=False)) == ["bb:01", "aa:01", "dd:01", "aa:02", "cc:01"]
+    # SSIDs compare case-insensitively
+    assert bssids(table, table.query(sort="ssid", descending=False)) == ["dd:01", "bb:01", "aa:01", "aa:02", "cc:01"]
+    assert table.order("ssid", True) is table.order("ssid", True)
+    with pytest.raises(ValueError):
+        table.order("password")
+
+
+def test_paging(table):
+    rows = table.query(sort="signal")
+    assert table.page_count(rows, 2) == 3
+    assert table.page_count(rows[:0], 2) == 1
+
+    page = table.page(rows, 1, 2)
+    assert page["BSSID"] == ["aa:02", "bb:01"]
+    assert page["Signal (%)"] == [64, 55]
+    assert table.page(rows, 2, 2)["Channel"] == [None]
+
+    # Two BSSIDs of one network collapse to one selectable network, in row order
+    assert table.page_positions(rows, 0, 3) == [3, 0]
+    assert [net["ssid"] for net in table.page_networks(rows, 1, 2)] == ["LabNet", "guest_wifi"]
@@ -0,0 +1,56 @@
+# 📄 tests/test_network_watch.py
+"""Watch mode: successive scans diffed into change events."""
+from modules.network_watch import NetworkIndex, error_event, format_event
+
+
+def network(ssid, encryption, *aps):
+    return {
+        "ssid": ssid,
+        "encryption": encryption,
+        "bssids": [
+            {"bssid": bssid, "signal": signal, "channel": channel, "band": "2.4 GHz", "vendor": "Unknown"}
+            for bssid, signal, channel in aps
+        ]
+    }
+
+
+def test_network_index_diffs_scans():
+    index = NetworkIndex(signal_threshold=10, miss_limit=2)
+    first = [network("Lab", "WPA2", ("aa:aa:aa:aa:aa:01", 70, 6), ("aa:aa:aa:aa:aa:02", 50, 11))]
+    assert [e["event"] for e in index.update(first)] == ["new", "new"]
+
+    # Small signal drift is quiet; a channel change, a big signal move and a downgrade are reported
+    assert index.update(first) == []
+    changed = [network("Lab", "WPA", ("AA:AA:AA:AA:AA:01", 75, 1), ("aa:aa:aa:aa:aa:02", 30, 11))]
+    events = {(e["event"], e["bssid"]): (e["old"], e["new"]) for e in index.update(changed)}
+    assert events == {
+        ("encryption", "aa:aa:aa:aa:aa:01"): ("WPA2", "WPA"),
+        ("channel", "aa:aa:aa:aa:aa:01"): (6, 1),
+        ("encryption", "aa:aa:aa:aa:aa:02"): ("WPA2", "WPA"),
+        ("signal", "aa:aa:aa:aa:aa:02"): (50, 30)
+    }
+
+    # An AP is only gone after miss_limit scans without it
+    only_one = [network("Lab", "WPA", ("aa:aa:aa:aa:aa:01", 75, 1))]
+    assert index.update(only_one) == []
+    assert [(e["event"], e["bssid"]) for e in index.update(only_one)] == [("gone", "aa:aa:aa:aa:aa:02")]
+
+
+def test_slow_signal_drift_surfaces():
+    # Each step is under the threshold, but the total since the last report is not
+    index = NetworkIndex(signal_threshold=10)
+    index.update([network("Lab", "WPA2", ("aa:aa:aa:aa:aa:01", 70, 6))])
+    assert index.update([network("Lab", "WPA2", ("aa:aa:aa:aa:aa:01", 64, 6))]) == []
+    [event] = index.update([network("Lab", "WPA2", ("aa:aa:aa:aa:aa:01", 58, 6))])
+    assert (event["event"], event["old"], event["new"]) == ("signal", 70, 58)
+
+
+def test_format_event():
+    index = NetworkIndex()
+    index.update([network("Lab", "WPA2", ("aa:aa:aa:aa:aa:01", 70, 6))])
+    [event] = index.update([network("Lab", "WPA", ("aa:aa:aa:aa:aa:01", 70, 6))])
+    assert format_event(event).endswith("ENCRYPTION aa:aa:aa:aa:aa:01 (Lab): WPA2 → WPA")
+
+    failed = error_event(OSError("radio busy"))
+    assert failed["bssid"] is None
+    assert format_event(failed).endswith("scan failed: OSError: radio busy")
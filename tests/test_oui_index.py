@@ -0,0 +1,58 @@
+# 📄 tests/test_oui_index.py
+"""IEEE registry CSVs compiled into the mmap OUI index."""
+import os
+
+from modules.oui_index import OUIIndex, build_index, open_index
+
+REGISTRY = (
+    "Registry,Assignment,Organization Name,Organization Address\n"
+    "MA-L,CC54FE,Acme Networks,Somewhere\n"
+    "MA-L,00146C,Netgear,Elsewhere\n"
+    "MA-L,70B3D5,IEEE Registration Authority,Piscataway\n"
+    "MA-M,70B3D5A,Small Maker,Nowhere\n"
+    "MA-S,70B3D5A12,Tiny Maker,Anywhere\n"
+)
+
+
+def build(tmp_path, text=REGISTRY):
+    registry = tmp_path / "oui.csv"
+    registry.write_text(text, encoding="utf-8")
+    path = str(tmp_path / "oui.idx")
+    build_index([str(registry)], path)
+    return path
+
+
+def test_lookup_by_24_bit_prefix(tmp_path):
+    index = OUIIndex(build(tmp_path))
+    try:
+        assert index.lookup("cc:54:fe:e3:cd:88") == "Acme Networks"
+        assert index.lookup("00-14-6C-7E-40-80") == "Netgear"
+        assert index.lookup("f0:9f:c2:11:22:33") is None
+        assert index.lookup("not a mac") is None
+    finally:
+        index.close()
+
+
+def test_longest_prefix_wins(tmp_path):
+    # One MA-L block sub-assigned as MA-M (28 bits) and, inside that, MA-S (36 bits)
+    index = OUIIndex(build(tmp_path))
+    try:
+        assert index.lookup("70:b3:d5:a1:20:01") == "Tiny Maker"
+        assert index.lookup("70:b3:d5:a1:30:01") == "Small Maker"  # 36-bit miss, 28-bit hit
+        assert index.lookup("70:b3:d5:af:ff:ff") == "Small Maker"
+        assert index.lookup("70:b3:d5:b1:20:01") == "IEEE Registration Authority"
+    finally:
+        index.close()
+
+
+def test_open_index_reloads_rebuilt_file(tmp_path):
+    assert open_index(str(tmp_path / "missing.idx")) is None
+
+    path = build(tmp_path)
+    assert open_index(path) is open_index(path)
+    assert open_index(path).lookup("cc:54:fe:00:00:01") == "Acme Networks"
+
+    built = os.stat(path).st_mtime_ns
+    build(tmp_path, REGISTRY.replace("Acme Networks", "Acme Labs"))
+    os.utime(path, ns=(built + 10**9, built + 10**9))  # mtimes are coarse; don't rely on the clock ticking
+    assert open_index(path).lookup("cc:54:fe:00:00:01") == "Acme Labs"
@@ -0,0 +1,63 @@
+# 📄 tests/test_parsers.py
+"""Recorded captures (captures/*_sample.txt) through the scan parsers."""
+import pytest
+
+from modules.scan_parsers import NetshParser, parse_iw, parse_netsh, parse_nmcli
+
+PARSERS = {"netsh": parse_netsh, "nmcli": parse_nmcli, "iw": parse_iw}
+
+# capture -> {ssid: (encryption, BSSID count, first BSSID, its signal, its channel)}
+EXPECTED = {
+    "netsh": {
+        "realme 9 Pro+": ("WPA3", 1, "e2:06:bd:ea:ee:ab", 81, 5),
+        "Excitel_1474997_2.4": ("WPA2", 1, "a8:3a:48:3e:07:17", 29, 38),
+        "AmanNote": ("WPA2", 1, "3e:56:e3:30:c6:45", 98, 5),
+        "Nisha": ("WPA2", 1, "d8:44:89:1e:ad:bf", 29, 11),
+        "www.excitel.com": ("WPA2", 1, "a8:3a:48:3e:07:1a", 24, 8),
+        "JioAirfiberA6": ("WPA2", 2, "20:b5:c6:5c:63:18", 13, 100)
+    },
+    "nmcli": {
+        "LabNet": ("WPA2", 2, "aa:bb:cc:dd:ee:ff", 78, 6),
+        "Guest_WiFi": ("WPA", 1, "11:22:33:44:55:66", 55, 1),
+        "Office:5G": ("WPA2/WPA3", 1, "00:1a:2b:10:20:30", 41, 149),
+        "Printer-Setup": ("Open", 1, "00:50:f2:ab:cd:ef", 35, 11)
+    },
+    "iw": {
+        "LabMesh": ("WPA2/WPA3", 2, "f0:9f:c2:11:22:33", 100, 6),
+        "legacy-wep": ("WEP", 1, "00:14:6c:7e:40:80", 38, 1),
+        "OldRouter": ("WPA", 1, "04:18:d6:aa:bb:cc", 82, 11)
+    }
+}
+
+
+@pytest.mark.parametrize("fmt", sorted(EXPECTED))
+def test_capture_parses(fmt, capture_lines):
+    networks = list(PARSERS[fmt](capture_lines(fmt)))
+
+    assert [net["ssid"] for net in networks] == list(EXPECTED[fmt])
+    for net in networks:
+        encryption, count, bssid, signal, channel = EXPECTED[fmt][net["ssid"]]
+        assert net["encryption"] == encryption
+        assert len(net["bssids"]) == count
+        assert net["bssids"][0]["bssid"] == bssid
+        assert net["bssids"][0]["signal"] == signal
+        assert net["bssids"][0]["channel"] == channel
+
+
+def test_netsh_streaming_matches_batch(capture_lines):
+    lines = capture_lines("netsh")
+    parser = NetshParser()
+
+    # Each SSID block is handed out as soon as the next one starts
+    streamed = []
+    for i, line in enumerate(lines):
+        network = parser.feed(line)
+        if network is not None:
+            streamed.append((i, network))
+    last = parser.close()
+
+    assert [net["ssid"] for _, net in streamed] == list(EXPECTED["netsh"])[:-1]
+    assert streamed[0][0] < len(lines) // 2
+    assert last["ssid"] == "JioAirfiberA6"
+    assert [net for _, net in streamed] + [last] == list(parse_netsh(lines))
+
@@ -0,0 +1,35 @@
+# 📄 tests/test_password_audit.py
+"""Rating supplied passphrases in the single-target and batch audits."""
+from modules.config import load_config
+from modules.executor import StageExecutor
+from modules.password_audit import PasswordAudit, load_passphrases
+from modules.simulation import SimulationEngine
+
+TARGET = {"ssid": "LabNet", "encryption": "WPA3", "bssid": "aa:bb:cc:dd:ee:ff", "vendor": "Unknown", "signal": 40}
+
+
+def test_weak_passphrase_changes_audit():
+    audit = PasswordAudit(load_config())
+    guessed = audit.run(TARGET)
+    rated = audit.run(dict(TARGET, passphrase="password123"))
+
+    assert rated["strength"] == "Very Weak"
+    assert rated["strength"] != guessed["strength"]
+    assert rated["estimated_crack_days"] < guessed["estimated_crack_days"]
+
+
+def test_batch_rates_passphrases_without_keeping_them(tmp_path):
+    csv_path = tmp_path / "aps.csv"
+    csv_path.write_text("ssid,passphrase\nLabNet,password123\n", encoding="utf-8")
+    passphrases = load_passphrases(str(csv_path))
+    assert passphrases == {"LabNet": "password123"}
+
+    other = dict(TARGET, ssid="Other", bssid="aa:bb:cc:dd:ee:01")
+    targets = [TARGET, other]
+    results = StageExecutor("serial").analyze(
+        targets, load_config(), SimulationEngine(1), passphrases=[passphrases.get(t["ssid"]) for t in targets]
+    )
+
+    assert results[0]["password"]["strength"] == "Very Weak"
+    assert results[1]["password"] == PasswordAudit(load_config()).run(other)
+    assert all("passphrase" not in result["target"] for result in results)
@@ -0,0 +1,108 @@
+# 📄 tests/test_risk_engine.py
+"""RiskEngine: scalar, columnar and Monte Carlo scoring agree."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import modules.risk_engine
+from main import parse_args
+from modules.config import Config, ConfigError, load_config
+from modules.encryption_analyzer import EncryptionAnalyzer
+from modules.password_strength import STRENGTHS
+from modules.risk_engine import RiskEngine
+from modules.simulation import SimulationEngine
+
+LABELS = ["Open", "WEP", "wpa", "WPA2", "wpa2/wpa3", "WPA3", "Enterprise-ish"]  # mixed case and one unknown
+
+
+def test_score_table_matches_calculate():
+    config = load_config()
+    engine, analyzer = RiskEngine(config), EncryptionAnalyzer(config)
+    rows = list(itertools.product(LABELS, [True, False], [True, False], STRENGTHS))
+
+    # Display-style column names, as a report DataFrame would have them
+    scored = engine.score_table(pd.DataFrame(rows, columns=["Encryption Type", "PMF Enabled", "WPS Enabled", "Password Strength"]))
+    for i, (label, pmf, wps, strength) in enumerate(rows):
+        expected = engine.calculate(
+            analyzer.analyze({"encryption": label}),
+            {"pmf_enabled": pmf, "wps_enabled": wps},
+            {"strength": strength}
+        )
+        assert (scored["score"][i], scored["level"][i]) == (expected["score"], expected["level"]), rows[i]
+
+
+def test_score_table_needs_its_columns():
+    engine = RiskEngine(Config())
+    with pytest.raises(KeyError, match="encryption"):
+        engine.score_table({"pmf": [True], "wps": [False], "strength": ["Weak"]})
+    with pytest.raises(KeyError, match="wps"):
+        engine.score_table({"encryption": ["WPA2"], "pmf": [True], "strength": ["Weak"]})
+
+
+def test_leaked_passphrase_scores_alike_in_every_path():
+    engine = RiskEngine(Config())
+    encryption = {"type": "WPA3", "severity": "Low", "score": 2}
+    protection = {"pmf_enabled": True, "wps_enabled": False}
+    passwords = [{"strength": "Strong", "leaked": True}, {"strength": "Strong"}]
+
+    scored = engine.score_table({
+        "encryption_score": np.array([2, 2]),
+        "pmf_enabled": np.array([True, True]),
+        "wps_enabled": np.array([False, False]),
+        "password_strength": np.array(["Strong", "Strong"]),
+        "password_leaked": np.array([True, False])
+    })
+    for i, password in enumerate(passwords):
+        expected = engine.calculate(encryption, protection, password)
+        assert scored["score"][i] == expected["score"]
+        assert scored["level"][i] == expected["level"]
+    assert scored["score"][0] == scored["score"][1] + 3
+
+    # Same simulation row for both, so only the leaked flag differs
+    target = {"ssid": "LabNet", "encryption": "WPA3", "signal": 60}
+    leaked, clean = (
+        engine.monte_carlo([{"target": target, "encryption": encryption, "password": password}], SimulationEngine(7), 200)[0]
+        for password in passwords
+    )
+    assert leaked["mean"] == clean["mean"] + 3
+
+
+def analyzed(n):
+    encryption = [{"type": "WPA2", "severity": "Medium", "score": 5}, {"type": "WEP", "severity": "High", "score": 8}]
+    return [
+        {
+            "target": {"ssid": f"Lab{i}", "encryption": encryption[i % 2]["type"], "signal": -40 - 5 * i},
+            "encryption": encryption[i % 2],
+            "password": {"strength": STRENGTHS[i % len(STRENGTHS)], "leaked": i == 3}
+        }
+        for i in range(n)
+    ]
+
+
+def test_monte_carlo_does_not_depend_on_chunking(monkeypatch):
+    results, engine = analyzed(7), RiskEngine(Config())
+    whole = engine.monte_carlo(results, SimulationEngine(11), 300)
+
+    # 3 networks per vectorized pass instead of all 7 at once
+    monkeypatch.setattr(modules.risk_engine, "MONTE_CARLO_ROWS", 900)
+    assert engine.monte_carlo(results, SimulationEngine(11), 300) == whole
+    # A network keeps its draws when scored alone at its row
+    assert engine.monte_carlo(results[4:5], SimulationEngine(11), 300, start=4) == whole[4:5]
+
+    assert all(d["trials"] == 300 and abs(sum(d["level_probability"].values()) - 1) < 1e-3 for d in whole)
+
+
+@pytest.mark.parametrize("trials", [-1, True, 2.5, "100"])
+def test_config_rejects_bad_trial_counts(trials):
+    with pytest.raises(ConfigError, match="monte_carlo_trials"):
+        Config({"lab_settings": {"monte_carlo_trials": trials}})
+
+
+def test_cli_rejects_negative_trials(capsys):
+    assert parse_args(["--all", "--monte-carlo", "0"]).monte_carlo == 0
+    for bad in ("-5", "many"):
+        with pytest.raises(SystemExit):
+            parse_args(["--all", "--monte-carlo", bad])
+    assert "--monte-carlo" in capsys.readouterr().err
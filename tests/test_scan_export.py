@@ -0,0 +1,40 @@
+# 📄 tests/test_scan_export.py
+"""Scan history exports: the JSONL stream and the partitioned Parquet dataset."""
+from datetime import datetime
+
+import pytest
+
+from modules.scan_export import ScanExport, iter_jsonl, load_dataset
+
+SCAN_TIME = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def network(ssid, bssid, band):
+    return {"ssid": ssid, "encryption": "WPA2",
+            "bssids": [{"bssid": bssid, "signal": 70, "channel": 6, "band": band, "vendor": "Acme"}]}
+
+
+def export(tmp_path, networks, formats):
+    with ScanExport(str(tmp_path), formats, scan_time=SCAN_TIME) as scan:
+        scan.write_all(networks)
+    return scan
+
+
+def test_jsonl_appends(tmp_path):
+    export(tmp_path, [network("Lab", "aa:01", "2.4 GHz")], ["jsonl"])
+    export(tmp_path, [network("Lab", "aa:01", "2.4 GHz"), network("Guest", "bb:01", None)], ["jsonl"])
+
+    records = list(iter_jsonl(str(tmp_path / "wifi_scan.jsonl")))
+    assert [r["ssid"] for r in records] == ["Lab", "Lab", "Guest"]
+    assert records[2]["band"] == "Unknown"
+    assert records[0]["scan_time"] == "2026-03-01T12:00:00"
+
+
+def test_scans_in_the_same_second_keep_their_rows(tmp_path):
+    pytest.importorskip("pyarrow")
+    export(tmp_path, [network("Lab", "aa:01", "2.4 GHz"), network("Fast", "cc:01", "5 GHz")], ["parquet"])
+    export(tmp_path, [network("Lab", "aa:02", "2.4 GHz")], ["parquet"])
+
+    dataset = str(tmp_path / "scan_dataset")
+    assert sorted(load_dataset(dataset, columns=["bssid"])["bssid"].to_pylist()) == ["aa:01", "aa:02", "cc:01"]
+    assert load_dataset(dataset, columns=["ssid"], filters=[("band", "==", "5 GHz")])["ssid"].to_pylist() == ["Fast"]
@@ -0,0 +1,35 @@
+# 📄 tests/test_simulation.py
+"""Seeded simulation: a network's draws depend only on the seed and its row."""
+from modules.handshake_test import HandshakeTest
+from modules.protection_test import ProtectionTest
+from modules.simulation import SimulationEngine
+
+NETWORKS = [
+    {"ssid": f"Lab{i}", "encryption": encryption, "signal": signal}
+    for i, (encryption, signal) in enumerate(
+        [("WPA2", -35), ("WPA3", -55), ("WEP", -70), ("Open", None), ("WPA", -45), ("Hidden_Lab", -65)] * 3
+    )
+]
+
+
+def test_rows_do_not_depend_on_batching():
+    engine = SimulationEngine(1234)
+    handshakes, protections = engine.run(NETWORKS)
+
+    # In chunks of 4, and one network at a time through the single-target tests
+    chunked = ([], [])
+    for start in range(0, len(NETWORKS), 4):
+        part = engine.run(NETWORKS[start:start + 4], start)
+        chunked[0].extend(part[0])
+        chunked[1].extend(part[1])
+    assert chunked == (handshakes, protections)
+
+    for row, network in enumerate(NETWORKS):
+        assert HandshakeTest(SimulationEngine(1234)).run(network, row) == handshakes[row]
+        assert ProtectionTest(SimulationEngine(1234)).run(network, row) == protections[row]
+
+
+def test_seed_reproduces_and_varies():
+    assert SimulationEngine(5).uniforms(6).tolist() == SimulationEngine(5).uniforms(6).tolist()
+    assert SimulationEngine(5).uniforms(6).tolist() != SimulationEngine(6).uniforms(6).tolist()
+    assert SimulationEngine().seed != SimulationEngine().seed
@@ -0,0 +1,62 @@
+# 📄 tests/test_trend_store.py
+"""Trend store: raw observations folded into minute and hour rollups."""
+import pytest
+
+from modules.trend_store import TrendStore
+
+HOUR = 3600
+BASE = 470_000 * HOUR  # an hour boundary in 2023
+
+
+def scan(*aps, ssid="Lab"):
+    return [{
+        "ssid": ssid,
+        "encryption": "WPA2",
+        "bssids": [
+            {"bssid": bssid, "signal": signal, "channel": channel, "band": "2.4 GHz"}
+            for bssid, signal, channel in aps
+        ]
+    }]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TrendStore(str(tmp_path / "trends.db"))
+    store.record(scan(("AA:AA:AA:AA:AA:01", 60, 6), ("aa:aa:aa:aa:aa:02", 30, 1)), BASE + 10)
+    store.record(scan(("aa:aa:aa:aa:aa:01", None, 6)), BASE + 50)  # no signal reading
+    store.record(scan(("aa:aa:aa:aa:aa:01", 40, 11)), BASE + 70)
+    store.record(scan(("aa:aa:aa:aa:aa:01", 50, 11), ssid="Lab-renamed"), BASE + HOUR + 100)
+    return store
+
+
+def test_rollups(store):
+    minutes = store.history("aa:aa:aa:aa:aa:01", resolution="minute")
+    assert [(r["time"], r["samples"], r["signal_min"], r["signal_max"], r["signal_mean"]) for r in minutes] == [
+        (BASE, 2, 60, 60, 60.0),  # the missing reading counts as a sample, not as a signal
+        (BASE + 60, 1, 40, 40, 40.0),
+        (BASE + HOUR + 60, 1, 50, 50, 50.0)
+    ]
+
+    hours = store.history("aa:aa:aa:aa:aa:01", resolution="hour")
+    assert [(r["time"], r["samples"], r["signal_min"], r["signal_max"], r["signal_mean"], r["channel"]) for r in hours] == [
+        (BASE, 3, 40, 60, 50.0, 11),  # the last channel seen in the bucket
+        (BASE + HOUR, 1, 50, 50, 50.0, 11)
+    ]
+    assert [r["signal"] for r in store.history("AA:AA:AA:AA:AA:01")] == [60, None, 40, 50]
+    assert len(store.history("aa:aa:aa:aa:aa:01", since=BASE + HOUR)) == 1
+
+
+def test_first_seen_and_occupancy(store):
+    seen = store.first_seen("AA:AA:AA:AA:AA:01")
+    assert (seen["first_seen"], seen["last_seen"], seen["ssid"]) == (BASE + 10, BASE + HOUR + 100, "Lab-renamed")
+    assert store.first_seen("ff:ff:ff:ff:ff:ff") is None
+
+    assert store.channel_occupancy(band="2.4 GHz") == {BASE: {1: 1, 11: 1}, BASE + HOUR: {11: 1}}
+    assert store.channel_occupancy(band="5 GHz") == {}
+
+
+def test_prune_keeps_rollups(store):
+    assert store.prune(days=1) == 5
+    assert store.history("aa:aa:aa:aa:aa:01") == []
+    assert len(store.history("aa:aa:aa:aa:aa:01", resolution="hour")) == 2
+    assert store.first_seen("aa:aa:aa:aa:aa:01")["first_seen"] == BASE + 10
@@ -1,47 +1,97 @@
 import streamlit as st
 from modules.adapter_manager import AdapterManager
-from modules.network_scanner import NetworkScanner
+from modules.network_scanner import NetworkScanner, build_target
+from modules.network_table import SORT_KEYS, NetworkTable
 from modules.encryption_analyzer import EncryptionAnalyzer
 from modules.handshake_test import HandshakeTest
 from modules.protection_test import ProtectionTest
 from modules.password_audit import PasswordAudit
 from modules.risk_engine import RiskEngine
 from modules.evidence_collector import EvidenceCollector
-from modules.report_generator import ReportGenerator
+from modules.report_generator import REPORT_DIR, ReportGenerator
+from modules.config import load_config
+from modules.simulation import SimulationEngine
 from datetime import datetime
+import asyncio
+import glob
 import os
-import pdfkit
 import pandas as pd
 
 st.set_page_config(page_title="Wi-Fi Security Audit Tool", layout="wide")
 
 st.title("🔒 Wi-Fi Security Audit Tool (Lab Simulation)")
 
+# Parsed once per config.yaml change, not on every Streamlit rerun
+config = load_config()
+
+# One simulation seed per browser session, so reruns don't redraw results
+if "simulation_seed" not in st.session_state:
+    st.session_state.simulation_seed = SimulationEngine(config.simulation_seed).seed
+engine = SimulationEngine(st.session_state.simulation_seed)
+
 # -----------------------------
-# Helper: Flatten networks
+# Cached stages
 # -----------------------------
-def flatten_networks(networks):
-    rows = []
-    for net in networks:
-        for ap in net["bssids"]:
-            rows.append({
-                "SSID": net["ssid"],
-                "Encryption": net["encryption"],
-                "BSSID": ap["bssid"],
-                "Vendor": ap["vendor"],
-                "Signal (%)": ap["signal"],
-                "Channel": ap["channel"],
-                "Band": ap["band"],
-                "Last Seen": net["last_seen"]
-            })
-    return rows
+# Widget interactions rerun this script; scans are reused for ui.scan_ttl
+# seconds (or until Rescan) and each analysis stage is cached per
+# (BSSID, config fingerprint), so reruns never touch the radio.
+# Arguments starting with "_" are not part of the cache key.
+SCAN_TTL = config.ui["scan_ttl"]
+
+
+@st.cache_data(ttl=SCAN_TTL, show_spinner="Detecting wireless adapter...")
+def detect_adapter():
+    return AdapterManager().detect()
+
+
+@st.cache_data(ttl=SCAN_TTL, show_spinner="Scanning for networks...")
+def scan_networks(config_hash):
+    networks = asyncio.run(NetworkScanner(load_config()).scan_async())
+    # Full-resolution timestamp: also the key of the per-scan NetworkTable
+    return networks, datetime.now()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def network_table(config_hash, scanned_at, _networks):
+    # Built once per scan and shared, not copied, across reruns
+    return NetworkTable(_networks)
+
+
+@st.cache_data(show_spinner=False)
+def analyze_encryption(bssid, config_hash, _target):
+    return EncryptionAnalyzer(load_config()).analyze(_target)
+
+
+@st.cache_data(show_spinner=False)
+def test_handshake(bssid, config_hash, seed, row, _target):
+    return HandshakeTest(SimulationEngine(seed)).run(_target, row)
+
+
+@st.cache_data(show_spinner=False)
+def test_protection(bssid, config_hash, seed, row, _target):
+    return ProtectionTest(SimulationEngine(seed)).run(_target, row)
+
+
+@st.cache_data(show_spinner=False)
+def audit_password(bssid, config_hash, _target):
+    return PasswordAudit(load_config()).run(_target)
+
+
+@st.cache_data(show_spinner="Running Monte Carlo trials...")
+def simulate_risk(bssid, config_hash, seed, row, trials, strength, _result):
+    return RiskEngine(load_config()).monte_carlo([_result], SimulationEngine(seed), trials, row)[0]
+
+
+def stage(title, key, value=False):
+    st.subheader(title)
+    return st.toggle("Run this stage", key=key, value=value)
 
 
 # -----------------------------
 # Step 1: Adapter Info
 # -----------------------------
 st.subheader("Step 1: Wireless Adapter Info")
-adapter = AdapterManager().detect()
+adapter = detect_adapter()
 st.write(f"**Adapter:** {adapter['adapter']}")
 st.write(f"**Monitor Mode Support:** {adapter['supports_monitor']}")
 
@@ -49,69 +99,133 @@ st.write(f"**Monitor Mode Support:** {adapter['supports_monitor']}")
 # Step 2: Scan Networks
 # -----------------------------
 st.subheader("Step 2: Scan Networks")
-networks = NetworkScanner().scan()
+if st.button("🔄 Rescan"):
+    st.cache_data.clear()  # fresh radio data invalidates every cached stage
+
+networks, scanned_at = scan_networks(config.fingerprint)
+st.caption(f"Scanned at {scanned_at:%H:%M:%S}; reused for {SCAN_TTL:g}s or until Rescan")
 
 if not networks:
     st.warning("No networks found.")
     st.stop()
 
-# Display networks table
-flat_data = flatten_networks(networks)
-net_df = pd.DataFrame(flat_data)
+# Filter, sort and page server-side; only the visible page reaches the browser
+table = network_table(config.fingerprint, scanned_at, networks)
+filters = st.columns(4)
+ssid_filter = filters[0].text_input("SSID contains")
+encryption_filter = filters[1].multiselect("Encryption", table.options("encryption"))
+band_filter = filters[2].multiselect("Band", table.options("band"))
+signal_filter = filters[3].slider("Signal (%)", 0, 100, (0, 100))
+sorting = st.columns(4)
+sort_by = sorting[0].selectbox("Sort by", SORT_KEYS)
+descending = sorting[1].toggle("Descending", value=sort_by == "signal")
+
+rows = table.query(ssid_filter, encryption_filter, band_filter,
+                   None if signal_filter == (0, 100) else signal_filter, sort_by, descending)
+page_size = config.ui["page_size"]
+pages = table.page_count(rows, page_size)
+page = sorting[2].number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1) - 1
+sorting[3].metric("Matching BSSIDs", f"{len(rows)} / {len(table)}")
 
-st.dataframe(net_df, use_container_width=True)
+st.dataframe(pd.DataFrame(table.page(rows, page, page_size)), use_container_width=True)
 
 # -----------------------------
 # Network selection
 # -----------------------------
-ssid_options = sorted(set(net["ssid"] for net in networks))
-selected_ssid = st.selectbox("Select Target Network", ssid_options)
+# Positions, not objects: the cached table and the cached scan hold separate copies
+positions = table.page_positions(rows, page, page_size)
+if not positions:
+    st.warning("No networks match the filters.")
+    st.stop()
+
+# The position is also the simulation row, as in main.py (single target and --all)
+row = st.selectbox("Select Target Network (from this page)", positions,
+                   format_func=lambda i: networks[i]["ssid"])
+
+# Flattened onto the strongest AP, the same target main.py hands the analyzers
+target = build_target(networks[row])
+st.success(f"Selected Network: {target['ssid']}  |  APs: {target['ap_count']}")
+
+cache_key = (target["bssid"] or target["ssid"], config.fingerprint)
+seed = engine.seed
+passphrase = None
+
+
+def encryption_result():
+    return analyze_encryption(*cache_key, target)
+
+
+def handshake_result():
+    return test_handshake(*cache_key, seed, row, target)
+
+
+def protection_result():
+    return test_protection(*cache_key, seed, row, target)
+
+
+def password_result():
+    if passphrase:
+        # Never cached: the passphrase must not outlive this rerun
+        return PasswordAudit(config).run(dict(target, passphrase=passphrase))
+    return audit_password(*cache_key, target)
 
-target = next(net for net in networks if net["ssid"] == selected_ssid)
-st.success(f"Selected Network: {target['ssid']}  |  APs: {len(target['bssids'])}")
 
 # -----------------------------
 # Step 3: Encryption Analysis
 # -----------------------------
-st.subheader("Step 3: Encryption Analysis")
-encryption = EncryptionAnalyzer().analyze(target)
-st.write(f"**Encryption Type:** {encryption['type']}")
-st.write(f"**Severity:** {encryption['severity']}")
+if stage("Step 3: Encryption Analysis", "stage_encryption", value=True):
+    encryption = encryption_result()
+    st.write(f"**Encryption Type:** {encryption['type']}")
+    st.write(f"**Severity:** {encryption['severity']}")
 
 # -----------------------------
 # Step 4: Handshake Test
 # -----------------------------
-st.subheader("Step 4: Handshake Test")
-handshake = HandshakeTest().run(target)
-st.write(f"Handshake Capturable: {handshake['handshake_possible']}")
+if stage("Step 4: Handshake Test", "stage_handshake"):
+    handshake = handshake_result()
+    st.write(f"Handshake Capturable: {handshake['handshake_possible']}")
 
 # -----------------------------
 # Step 5: Protection Test
 # -----------------------------
-st.subheader("Step 5: Protection Features")
-protection = ProtectionTest().run(target)
-st.write(f"PMF Enabled: {protection['pmf_enabled']}")
-st.write(f"WPS Enabled: {protection['wps_enabled']}")
+if stage("Step 5: Protection Features", "stage_protection"):
+    protection = protection_result()
+    st.write(f"PMF Enabled: {protection['pmf_enabled']}")
+    st.write(f"WPS Enabled: {protection['wps_enabled']}")
 
 # -----------------------------
 # Step 6: Password Audit
 # -----------------------------
-st.subheader("Step 6: Password Audit")
-password = PasswordAudit().run(target)
-st.write(f"Strength: {password['strength']}")
-st.write(f"Entropy Bits: {password['entropy_bits']}")
-st.write(f"Estimated Crack Time (days): {password['estimated_crack_days']}")
+if stage("Step 6: Password Audit", "stage_password"):
+    passphrase = st.text_input("AP passphrase (optional, rated offline and never saved)", type="password")
+    password = password_result()
+    st.write(f"Strength: {password['strength']}")
+    st.write(f"Entropy Bits: {password['entropy_bits']}")
+    st.write(f"Estimated Crack Time (days): {password['estimated_crack_days']}")
 
-st.write("Factors affecting password strength:")
-for f in password.get("factors", []):
-    st.write(f"- {f}")
+    st.write("Factors affecting password strength:")
+    for f in password.get("factors", []):
+        st.write(f"- {f}")
 
 # -----------------------------
 # Step 7: Risk Assessment
 # -----------------------------
-st.subheader("Step 7: Risk Assessment")
-risk = RiskEngine().calculate(encryption, protection, password)
-st.write(f"Risk Level: {risk['level']} ({risk['score']}/15)")
+risk_distribution = None
+if stage("Step 7: Risk Assessment", "stage_risk"):
+    # Runs (or reuses) only the stages the score depends on
+    encryption, protection, password = encryption_result(), protection_result(), password_result()
+    risk = RiskEngine(config).calculate(encryption, protection, password)
+    st.write(f"Risk Level: {risk['level']} ({risk['score']}/15)")
+
+    trials = st.number_input("Monte Carlo trials (0 = off)", min_value=0, max_value=100000,
+                             value=config.monte_carlo_trials, step=1000)
+    if trials:
+        risk_distribution = simulate_risk(
+            *cache_key, seed, row, int(trials), password["strength"],
+            {"target": target, "encryption": encryption, "password": password}
+        )
+        st.write(f"Mean score: {risk_distribution['mean']}/15 (σ {risk_distribution['std']})")
+        st.bar_chart(pd.Series(risk_distribution["level_probability"], name="Probability"))
 
 # -----------------------------
 # Save Evidence & Generate Report
@@ -123,6 +237,9 @@ report_html_path = None
 report_pdf_path = None
 
 if st.button("✅ Save Evidence & Generate HTML Report"):
+    encryption, handshake, protection = encryption_result(), handshake_result(), protection_result()
+    password = password_result()
+    risk = RiskEngine(config).calculate(encryption, protection, password)
     data = {
         "adapter": adapter,
         "target": target,
@@ -131,13 +248,17 @@ if st.button("✅ Save Evidence & Generate HTML Report"):
         "protection": protection,
         "password": password,
         "risk": risk,
+        "simulation_seed": engine.seed,
         "timestamp": start_time.isoformat(),
         "duration": (datetime.now() - start_time).total_seconds()
     }
+    if risk_distribution:
+        data["risk_distribution"] = risk_distribution
 
-    EvidenceCollector().save(data)
+    data["run_id"] = EvidenceCollector().save(data)
 
-    report_html_path = ReportGenerator().generate(data)
+    generator = ReportGenerator(config)
+    report_html_path = generator.generate(data)
     st.success(f"✅ Report generated: {report_html_path}")
 
     # Preview HTML
@@ -147,12 +268,12 @@ if st.button("✅ Save Evidence & Generate HTML Report"):
         st.components.v1.html(html_content, height=600, scrolling=True)
 
     # Generate PDF
-    report_pdf_path = report_html_path.replace(".html", ".pdf")
-    try:
-        pdfkit.from_file(report_html_path, report_pdf_path)
-        st.success(f"✅ PDF generated: {report_pdf_path}")
-    except Exception as e:
-        st.error(f"PDF generation failed: {e}")
+    pdf_result = generator.export_pdfs([report_html_path])[0]
+    report_pdf_path = pdf_result["pdf"]
+    if pdf_result["status"] == "failed":
+        st.error(f"PDF generation failed: {pdf_result['error']}")
+    else:
+        st.success(f"✅ PDF generated in {pdf_result['seconds']:.1f}s: {report_pdf_path}")
 
     # Download buttons
     with open(report_html_path, "rb") as f:
@@ -172,4 +293,10 @@ if st.button("✅ Save Evidence & Generate HTML Report"):
                 mime="application/pdf"
             )
 
+if st.button("📄 Export All Reports to PDF"):
+    html_paths = sorted(glob.glob(os.path.join(REPORT_DIR, "*.html")))
+    with st.spinner(f"Converting {len(html_paths)} reports..."):
+        pdf_results = ReportGenerator(config).export_pdfs(html_paths)
+    st.dataframe(pd.DataFrame(pdf_results))
+
 st.info("⚠️ Note: This tool simulates Wi-Fi auditing in a lab environment only.")
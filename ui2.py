@@ -1,7 +1,10 @@
 from modules.network_scanner import NetworkScanner
 from modules.password_attack_simulator import NetworkScanner, WiFiConnector
+from modules.config import load_config
+from modules.network_table import SORT_KEYS, NetworkTable
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
+import asyncio
 import threading
 
 
@@ -9,20 +12,52 @@ class WiFiAuditUI:
     def __init__(self, root):
         self.root = root
         self.root.title("WiFi Security Auditor")
-        self.root.geometry("700x550")
+        self.root.geometry("760x620")
 
         self.networks = []
         self.selected_ssid = None
 
+        # Filtering and paging run on a columnar table; the Listbox only holds one page
+        self.page_size = load_config().ui["page_size"]
+        self.table = NetworkTable([])
+        self.rows = self.table.query()
+        self.page = 0
+
         self._build_ui()
 
     def _build_ui(self):
         tk.Label(self.root, text="WiFi Security Auditor", font=("Arial", 16, "bold")).pack(pady=10)
 
-        tk.Button(self.root, text="Scan Networks", command=self.scan_networks).pack()
-
-        self.network_list = tk.Listbox(self.root, height=8, width=60)
-        self.network_list.pack(pady=10)
+        self.scan_button = tk.Button(self.root, text="Scan Networks", command=self.scan_networks)
+        self.scan_button.pack()
+
+        filters = tk.Frame(self.root)
+        filters.pack(pady=(10, 0))
+        tk.Label(filters, text="SSID:").pack(side=tk.LEFT)
+        self.ssid_filter = tk.StringVar()
+        tk.Entry(filters, textvariable=self.ssid_filter, width=14).pack(side=tk.LEFT)
+        self.encryption_filter = tk.StringVar(value="All")
+        self.encryption_menu = tk.OptionMenu(filters, self.encryption_filter, "All")
+        self.encryption_menu.pack(side=tk.LEFT)
+        self.band_filter = tk.StringVar(value="All")
+        self.band_menu = tk.OptionMenu(filters, self.band_filter, "All")
+        self.band_menu.pack(side=tk.LEFT)
+        tk.Label(filters, text="Min signal:").pack(side=tk.LEFT)
+        self.signal_filter = tk.IntVar(value=0)
+        tk.Spinbox(filters, from_=0, to=100, increment=10, width=4, textvariable=self.signal_filter).pack(side=tk.LEFT)
+        self.sort_key = tk.StringVar(value="signal")
+        tk.OptionMenu(filters, self.sort_key, *SORT_KEYS).pack(side=tk.LEFT)
+        tk.Button(filters, text="Apply", command=self.apply_filters).pack(side=tk.LEFT)
+
+        self.network_list = tk.Listbox(self.root, height=8, width=90, font=("Courier", 9))
+        self.network_list.pack(pady=5)
+
+        pager = tk.Frame(self.root)
+        pager.pack()
+        tk.Button(pager, text="◀ Prev", command=lambda: self.show_page(self.page - 1)).pack(side=tk.LEFT)
+        self.page_label = tk.Label(pager, text="Page 1 / 1")
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        tk.Button(pager, text="Next ▶", command=lambda: self.show_page(self.page + 1)).pack(side=tk.LEFT)
 
         tk.Label(self.root, text="Passwords (one per line):").pack()
         self.password_box = scrolledtext.ScrolledText(self.root, height=8)
@@ -50,19 +85,81 @@ class WiFiAuditUI:
         self.network_list.delete(0, tk.END)
         self.log("[*] Scanning networks...")
 
+        self.networks = []
+        self.table = NetworkTable([])
+        self.rows = self.table.query()
+        self.page_label.configure(text="Scanning...")
+        self.scan_button.configure(state="disabled")
+
+        # The scan runs on its own event loop so the Tk loop never blocks
+        thread = threading.Thread(target=self._scan_worker, daemon=True)
+        thread.start()
+
+    def _scan_worker(self):
         try:
-            scanner = NetworkScanner()
-            self.networks = scanner.scan()
+            asyncio.run(self._scan_async())
         except Exception as e:
-            messagebox.showerror("Scan Error", str(e))
-            return
+            self.root.after(0, messagebox.showerror, "Scan Error", str(e))
+        finally:
+            self.root.after(0, self._scan_finished)
+
+    async def _scan_async(self):
+        scanner = NetworkScanner()
+        networks = []
+
+        # Show each network as soon as its block is parsed
+        async for net in scanner.aiter_scan():
+            networks.append(net)
+            self.root.after(0, self._add_network, net)
 
-        for net in self.networks:
-            ssid = net.get("ssid", "Unknown")
-            self.network_list.insert(tk.END, ssid)
+        await asyncio.to_thread(scanner.export, networks)
 
+    def _add_network(self, net):
+        self.networks.append(net)
+        # Fill the first page while the scan streams in; the full table is built at the end
+        if self.network_list.size() < self.page_size:
+            self.network_list.insert(tk.END, net.get("ssid", "Unknown"))
+
+    def _scan_finished(self):
+        self.scan_button.configure(state="normal")
         self.log(f"[+] Found {len(self.networks)} networks")
 
+        self.table = NetworkTable(self.networks)
+        for menu, variable, column in ((self.encryption_menu, self.encryption_filter, "encryption"),
+                                       (self.band_menu, self.band_filter, "band")):
+            menu["menu"].delete(0, tk.END)
+            for option in ["All", *self.table.options(column)]:
+                menu["menu"].add_command(label=option, command=tk._setit(variable, option))
+            variable.set("All")
+        self.apply_filters()
+
+    def apply_filters(self):
+        encryption, band = self.encryption_filter.get(), self.band_filter.get()
+        try:
+            min_signal = self.signal_filter.get()
+        except tk.TclError:
+            min_signal = 0
+        self.rows = self.table.query(
+            ssid=self.ssid_filter.get().strip(),
+            encryptions=None if encryption == "All" else [encryption],
+            bands=None if band == "All" else [band],
+            signal=(min_signal, 100) if min_signal else None,
+            sort=self.sort_key.get(),
+            descending=self.sort_key.get() == "signal"
+        )
+        self.show_page(0)
+
+    def show_page(self, page):
+        pages = self.table.page_count(self.rows, self.page_size)
+        self.page = min(max(page, 0), pages - 1)
+        columns = self.table.page(self.rows, self.page, self.page_size)
+
+        self.network_list.delete(0, tk.END)
+        for ssid, bssid, encryption, signal, band in zip(columns["SSID"], columns["BSSID"], columns["Encryption"],
+                                                         columns["Signal (%)"], columns["Band"]):
+            self.network_list.insert(tk.END, f"{ssid[:28]:<28} {bssid:<18} {encryption:<10} {signal!s:>4}%  {band}")
+        self.page_label.configure(text=f"Page {self.page + 1} / {pages}  ({len(self.rows)} BSSIDs)")
+
     def start_test(self):
         selection = self.network_list.curselection()
         if not selection:
@@ -81,7 +178,10 @@ class WiFiAuditUI:
             messagebox.showwarning("No Passwords", "Enter at least one password")
             return
 
-        self.selected_ssid = self.network_list.get(selection[0])
+        if len(self.rows):
+            self.selected_ssid = self.table.page(self.rows, self.page, self.page_size)["SSID"][selection[0]]
+        else:
+            self.selected_ssid = self.network_list.get(selection[0])
         self.log(f"[*] Target: {self.selected_ssid}")
         self.log(f"[*] Passwords loaded: {len(passwords)}")
 